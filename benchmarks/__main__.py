@@ -0,0 +1,71 @@
+import argparse
+import json
+import platform
+import sys
+import time
+
+from . import bench_decoding, bench_encoding, bench_roundtrip  # noqa: F401
+from .harness import registered, run
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmarks for the jpm_online_payments client hot paths.",
+    )
+    parser.add_argument(
+        "-k", "--filter", default="", help="only run benchmarks whose name contains this"
+    )
+    parser.add_argument("-n", "--iterations", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=200)
+    parser.add_argument(
+        "--alloc-iterations",
+        type=int,
+        default=None,
+        help="operations run under tracemalloc (default: iterations / 10)",
+    )
+    parser.add_argument("-o", "--output", help="write the JSON report to this file")
+    parser.add_argument("--list", action="store_true", help="list benchmarks and exit")
+    args = parser.parse_args()
+
+    benches = [b for b in registered() if args.filter in b.name]
+    if args.list:
+        for bench in benches:
+            print(f"{bench.group:10} {bench.name}")
+        return 0
+
+    results = []
+    for bench in benches:
+        result = run(
+            bench,
+            iterations=args.iterations,
+            warmup=args.warmup,
+            alloc_iterations=args.alloc_iterations,
+        )
+        results.append(result)
+        print(
+            f"{bench.name:50} {result['ops_per_sec']:12.1f} ops/s"
+            f"  p50 {result['latency_ns']['p50'] / 1000:9.1f}us"
+            f"  p99 {result['latency_ns']['p99'] / 1000:9.1f}us"
+            f"  {result['allocations']['peak_bytes_per_op']:10.0f} B/op",
+            file=sys.stderr,
+        )
+
+    report = {
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "benchmarks": results,
+    }
+    encoded = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(encoded)
+    else:
+        print(encoded)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
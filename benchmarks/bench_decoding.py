@@ -0,0 +1,92 @@
+import contextlib
+
+import httpx
+import pydantic
+
+from jpm_online_payments.core import BaseClient, StreamResponse, response_plan
+from jpm_online_payments.types import models
+
+from .fixtures import (
+    FRAUD_CHECK_RESPONSE,
+    PAYMENT_RESPONSE,
+    REFUND_RESPONSE,
+    VERIFICATION_RESPONSE,
+    sse_body,
+)
+from .harness import benchmark
+
+
+class PaymentEvent(pydantic.BaseModel):
+    data: models.PaymentResponse
+
+
+def _process_response(body, cast_to):
+    base_client = BaseClient(base_url="http://gateway.test/api/v2")
+    response = httpx.Response(200, json=body)
+    return lambda: base_client.process_response(response=response, cast_to=cast_to)
+
+
+def _projected(body, cast_to):
+    plan = response_plan(cast_to)
+    response = httpx.Response(200, json=body)
+    fields = ["transaction_id", "transaction_state", "amount"]
+    return lambda: plan.decode(response, fields=fields)
+
+
+@benchmark("process_response/PaymentResponse", group="decoding")
+def process_payment_response():
+    return _process_response(PAYMENT_RESPONSE, models.PaymentResponse)
+
+
+@benchmark("view/PaymentResponse_4_fields", group="decoding")
+def view_payment_response():
+    plan = response_plan(models.PaymentResponse)
+    response = httpx.Response(200, json=PAYMENT_RESPONSE)
+
+    def op():
+        view = plan.decode(response, "view")
+        return (
+            view.transaction_id,
+            view.response_status,
+            view.transaction_state,
+            view.amount,
+        )
+
+    return op
+
+
+@benchmark("projected/PaymentResponse_3_fields", group="decoding")
+def projected_payment_response():
+    return _projected(PAYMENT_RESPONSE, models.PaymentResponse)
+
+
+@benchmark("projected/RefundResponse_3_fields", group="decoding")
+def projected_refund_response():
+    return _projected(REFUND_RESPONSE, models.RefundResponse)
+
+
+@benchmark("process_response/RefundResponse", group="decoding")
+def process_refund_response():
+    return _process_response(REFUND_RESPONSE, models.RefundResponse)
+
+
+@benchmark("process_response/VerificationResponse", group="decoding")
+def process_verification_response():
+    return _process_response(VERIFICATION_RESPONSE, models.VerificationResponse)
+
+
+@benchmark("process_response/FraudCheckResponse", group="decoding")
+def process_fraud_check_response():
+    return _process_response(FRAUD_CHECK_RESPONSE, models.FraudCheckResponse)
+
+
+@benchmark("stream_response/sse_50_events", group="decoding")
+def stream_response_sse():
+    body = sse_body(50)
+
+    def op():
+        response = httpx.Response(200, content=body)
+        stream = StreamResponse(response, contextlib.nullcontext(), PaymentEvent)
+        return sum(1 for _ in stream)
+
+    return op
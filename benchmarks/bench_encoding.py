@@ -0,0 +1,167 @@
+import httpx
+
+from jpm_online_payments import Client
+from jpm_online_payments.core import (
+    default_request_options,
+    encode_payload,
+    freeze,
+    to_encodable,
+)
+from jpm_online_payments.core.request import encode_json
+from jpm_online_payments.resources.payments import client as payments_client
+from jpm_online_payments.types import params
+
+from .fixtures import (
+    MERCHANT_ID,
+    REQUEST_ID,
+    authorize,
+    body_of,
+    gateway_handler,
+    payment_kwargs,
+    refund_kwargs,
+)
+from .harness import benchmark
+
+
+@benchmark("to_encodable/payment", group="encoding")
+def to_encodable_payment():
+    item = body_of(payment_kwargs())
+    return lambda: to_encodable(item=item, dump_with=params._SerializerPayment)
+
+
+@benchmark("to_encodable/payment_level3_200_items", group="encoding")
+def to_encodable_payment_level3():
+    item = body_of(payment_kwargs(line_item_count=200))
+    return lambda: to_encodable(item=item, dump_with=params._SerializerPayment)
+
+
+@benchmark("to_encodable/payment_level3_500_items", group="encoding")
+def to_encodable_payment_level3_500():
+    item = body_of(payment_kwargs(line_item_count=500))
+    return lambda: to_encodable(item=item, dump_with=params._SerializerPayment)
+
+
+@benchmark("to_encodable/payment_structural", group="encoding")
+def to_encodable_payment_structural():
+    item = body_of(payment_kwargs())
+    return lambda: to_encodable(
+        item=item, dump_with=params._SerializerPayment, validate=False
+    )
+
+
+@benchmark("to_encodable/payment_level3_200_items_structural", group="encoding")
+def to_encodable_payment_level3_structural():
+    item = body_of(payment_kwargs(line_item_count=200))
+    return lambda: to_encodable(
+        item=item, dump_with=params._SerializerPayment, validate=False
+    )
+
+
+@benchmark("to_encodable/payment_json", group="encoding")
+def to_encodable_payment_json():
+    item = body_of(payment_kwargs())
+    return lambda: encode_json(
+        to_encodable(item=item, dump_with=params._SerializerPayment)
+    )
+
+
+@benchmark("to_encodable/payment_frozen_merchant", group="encoding")
+def to_encodable_payment_frozen():
+    item = body_of(payment_kwargs())
+    item["merchant"] = freeze(item["merchant"], dump_with=params._SerializerMerchant)
+    return lambda: to_encodable(item=item, dump_with=params._SerializerPayment)
+
+
+@benchmark("encode_payload/payment_level3_200_items", group="encoding")
+def encode_payload_payment_level3():
+    payload = body_of(payment_kwargs(line_item_count=200))
+    return lambda: encode_payload(payload=payload, dump_with=params._SerializerPayment)
+
+
+@benchmark("to_encodable/refund", group="encoding")
+def to_encodable_refund():
+    item = body_of(refund_kwargs())
+    return lambda: to_encodable(item=item, dump_with=params._SerializerRefund)
+
+
+@benchmark("build_request/payments.create", group="encoding")
+def build_request_payment():
+    client = authorize(
+        Client(
+            base_url="http://gateway.test/api/v2",
+            httpx_client=httpx.Client(transport=httpx.MockTransport(gateway_handler)),
+        )
+    )
+    base_client = client._base_client
+    body = to_encodable(
+        item=body_of(payment_kwargs()), dump_with=params._SerializerPayment
+    )
+    headers = {"merchant-id": MERCHANT_ID, "request-id": REQUEST_ID}
+
+    def op():
+        return base_client.build_request(
+            method="POST",
+            path="/payments",
+            auth_names=["auth"],
+            headers=headers,
+            json=body,
+        )
+
+    return op
+
+
+@benchmark("build_request/payments.get_by_id", group="encoding")
+def build_request_get_by_id():
+    client = authorize(
+        Client(
+            base_url="http://gateway.test/api/v2",
+            httpx_client=httpx.Client(transport=httpx.MockTransport(gateway_handler)),
+        )
+    )
+    base_client = client._base_client
+    headers = {"merchant-id": MERCHANT_ID}
+
+    def op():
+        return base_client.build_request(
+            method="GET",
+            path="/payments/{id}",
+            path_params={"id": "12cc0270-7bed-11e9-a188-1763956dd7f6"},
+            auth_names=["auth"],
+            headers=headers,
+        )
+
+    return op
+
+
+@benchmark("endpoint/payments.create", group="encoding")
+def endpoint_payment():
+    client = authorize(
+        Client(
+            base_url="http://gateway.test/api/v2",
+            httpx_client=httpx.Client(transport=httpx.MockTransport(gateway_handler)),
+        )
+    )
+    compiled = client._base_client.compile_endpoint(payments_client._CREATE_ENDPOINT)
+    body = to_encodable(
+        item=body_of(payment_kwargs()), dump_with=params._SerializerPayment
+    )
+    headers = {"merchant-id": MERCHANT_ID, "request-id": REQUEST_ID}
+    opts = default_request_options()
+    return lambda: compiled.build(opts=opts, headers=headers, json=body)
+
+
+@benchmark("endpoint/payments.get_by_id", group="encoding")
+def endpoint_get_by_id():
+    client = authorize(
+        Client(
+            base_url="http://gateway.test/api/v2",
+            httpx_client=httpx.Client(transport=httpx.MockTransport(gateway_handler)),
+        )
+    )
+    compiled = client._base_client.compile_endpoint(
+        payments_client._GET_BY_ID_ENDPOINT
+    )
+    headers = {"merchant-id": MERCHANT_ID}
+    path_params = {"id": "12cc0270-7bed-11e9-a188-1763956dd7f6"}
+    opts = default_request_options()
+    return lambda: compiled.build(opts=opts, path_params=path_params, headers=headers)
@@ -0,0 +1,60 @@
+import httpx
+
+from jpm_online_payments import AsyncClient, Client
+
+from .fixtures import MERCHANT_ID, TRANSACTION_ID, authorize, gateway_handler, payment_kwargs
+from .harness import benchmark
+
+
+def _client() -> Client:
+    return authorize(
+        Client(
+            base_url="http://gateway.test/api/v2",
+            httpx_client=httpx.Client(transport=httpx.MockTransport(gateway_handler)),
+        )
+    )
+
+
+def _async_client() -> AsyncClient:
+    return authorize(
+        AsyncClient(
+            base_url="http://gateway.test/api/v2",
+            httpx_client=httpx.AsyncClient(
+                transport=httpx.MockTransport(gateway_handler)
+            ),
+        )
+    )
+
+
+@benchmark("roundtrip/sync/payments.create", group="roundtrip")
+def sync_payments_create():
+    client = _client()
+    kwargs = payment_kwargs()
+    return lambda: client.payments.create(**kwargs)
+
+
+@benchmark("roundtrip/sync/payments.get_by_id", group="roundtrip")
+def sync_payments_get_by_id():
+    client = _client()
+    return lambda: client.payments.get_by_id(id=TRANSACTION_ID, merchant_id=MERCHANT_ID)
+
+
+@benchmark("roundtrip/async/payments.create", group="roundtrip")
+def async_payments_create():
+    client = _async_client()
+    kwargs = payment_kwargs()
+
+    async def op():
+        return await client.payments.create(**kwargs)
+
+    return op
+
+
+@benchmark("roundtrip/async/payments.get_by_id", group="roundtrip")
+def async_payments_get_by_id():
+    client = _async_client()
+
+    async def op():
+        return await client.payments.get_by_id(id=TRANSACTION_ID, merchant_id=MERCHANT_ID)
+
+    return op
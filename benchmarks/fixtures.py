@@ -0,0 +1,219 @@
+import datetime
+import json
+from typing import Any, Dict
+
+import httpx
+
+"""
+Representative request payloads and gateway responses shared by the benchmarks.
+"""
+
+MERCHANT_ID = "991234567890"
+REQUEST_ID = "10cc0270-7bed-11e9-a188-1763956dd7f6"
+TRANSACTION_ID = "12cc0270-7bed-11e9-a188-1763956dd7f6"
+
+MERCHANT: Dict[str, Any] = {
+    "merchant_software": {
+        "company_name": "Payment Company",
+        "product_name": "Application Name",
+        "version": "1.235",
+    },
+    "merchant_category_code": "4899",
+}
+
+CARD: Dict[str, Any] = {
+    "account_number": "4012000033330026",
+    "expiry": {"month": 5, "year": 2027},
+}
+
+
+def line_items(count: int) -> Any:
+    """Builds `count` Level 3 line items."""
+    return [
+        {
+            "line_item_description_text": f"Item {i}",
+            "merchant_product_identifier": f"SKU-{i:06d}",
+            "line_item_unit_quantity": "2",
+            "line_item_unitof_measure_code": "EA",
+            "unit_price_amount": 1250,
+            "tax_inclusive_line_item_total_amount": 2700,
+            "line_item_tax_indicator": True,
+            "line_item_taxes": [{"tax_amount": 200, "tax_percent": "8.0"}],
+        }
+        for i in range(count)
+    ]
+
+
+def payment_kwargs(*, line_item_count: int = 0) -> Dict[str, Any]:
+    """Keyword arguments for `payments.create`, optionally carrying Level 3 data."""
+    kwargs: Dict[str, Any] = {
+        "amount": 1234,
+        "currency": "USD",
+        "merchant": MERCHANT,
+        "merchant_id": MERCHANT_ID,
+        "payment_method_type": {"card": CARD},
+        "request_id": REQUEST_ID,
+        "capture_method": "NOW",
+        "initiator_type": "CARDHOLDER",
+        "account_on_file": "NOT_STORED",
+        "merchant_order_number": "order-000123",
+        "ship_to": {
+            "shipping_address": {
+                "line1": "123 Main St",
+                "city": "Tampa",
+                "state": "FL",
+                "postal_code": "33602",
+                "country_code": "USA",
+            }
+        },
+    }
+    if line_item_count:
+        kwargs["retail_addenda"] = {
+            "level3": {
+                "total_shipping_amount": 500,
+                "line_items": line_items(line_item_count),
+                "transaction_advices": [
+                    {"transaction_advice_text": f"advice {i}"}
+                    for i in range(line_item_count)
+                ],
+            }
+        }
+    return kwargs
+
+
+def refund_kwargs() -> Dict[str, Any]:
+    """Keyword arguments for `refunds.create`."""
+    return {
+        "merchant": MERCHANT,
+        "merchant_id": MERCHANT_ID,
+        "request_id": REQUEST_ID,
+        "amount": 1234,
+        "currency": "USD",
+        "payment_method_type": {"transaction_reference": {"transaction_reference_id": TRANSACTION_ID}},
+    }
+
+
+def body_of(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Strips the header arguments from resource method kwargs."""
+    return {k: v for k, v in kwargs.items() if k not in ("merchant_id", "request_id")}
+
+
+PAYMENT_RESPONSE: Dict[str, Any] = {
+    "transactionId": TRANSACTION_ID,
+    "requestId": REQUEST_ID,
+    "transactionState": "AUTHORIZED",
+    "responseStatus": "SUCCESS",
+    "responseCode": "APPROVED",
+    "responseMessage": "Transaction approved by Issuer",
+    "amount": 1234,
+    "currency": "USD",
+    "captureMethod": "NOW",
+    "initiatorType": "CARDHOLDER",
+    "accountOnFile": "NOT_STORED",
+    "isAmountFinal": True,
+    "isCapture": True,
+    "approvalCode": "tst313",
+    "hostMessage": "Approved",
+    "hostReferenceId": "bxkpPfK7hBXu4pcCvRm7Q6B1PC1zj4qE",
+    "transactionDate": "2024-01-08T13:08:39.876Z",
+    "paymentMethodType": {
+        "card": {
+            "accountNumber": "4012000033330026",
+            "expiry": {"month": 5, "year": 2027},
+            "cardType": "VI",
+            "cardTypeName": "VISA",
+            "maskedAccountNumber": "401200XXXXXX0026",
+            "networkResponse": {
+                "addressVerificationResult": "NOT_REQUESTED",
+                "addressVerificationResultCode": "",
+                "networkTransactionId": "123456789012345",
+            },
+            "cardTypeIndicators": {
+                "issuanceCountryCode": "USA",
+                "isDurbinRegulated": False,
+                "cardProductTypes": ["PINLESS_DEBIT"],
+            },
+        }
+    },
+    "merchant": {
+        "merchantId": MERCHANT_ID,
+        "merchantSoftware": {
+            "companyName": "Payment Company",
+            "productName": "Application Name",
+            "version": "1.235",
+        },
+        "merchantCategoryCode": "4899",
+    },
+    "risk": {"transactionRiskScore": 14, "requestFraudScore": True},
+}
+
+REFUND_RESPONSE: Dict[str, Any] = {
+    "transactionId": "22cc0270-7bed-11e9-a188-1763956dd7f6",
+    "requestId": REQUEST_ID,
+    "transactionState": "CLOSED",
+    "responseStatus": "SUCCESS",
+    "responseCode": "APPROVED",
+    "responseMessage": "Transaction approved by Issuer",
+    "amount": 1234,
+    "currency": "USD",
+    "hostMessage": "Approved",
+    "transactionDate": "2024-01-08T13:08:39.876Z",
+    "merchant": PAYMENT_RESPONSE["merchant"],
+}
+
+VERIFICATION_RESPONSE: Dict[str, Any] = {
+    "transactionId": "32cc0270-7bed-11e9-a188-1763956dd7f6",
+    "requestId": REQUEST_ID,
+    "responseStatus": "SUCCESS",
+    "responseCode": "APPROVED",
+    "responseMessage": "Transaction approved by Issuer",
+    "hostMessage": "Approved",
+    "currency": "USD",
+    "paymentMethodType": {
+        "card": {
+            "accountNumber": "4012000033330026",
+            "expiry": {"month": 5, "year": 2027},
+            "cardType": "VI",
+        }
+    },
+    "merchant": PAYMENT_RESPONSE["merchant"],
+}
+
+FRAUD_CHECK_RESPONSE: Dict[str, Any] = {
+    "transactionId": "42cc0270-7bed-11e9-a188-1763956dd7f6",
+    "requestId": REQUEST_ID,
+    "responseStatus": "SUCCESS",
+    "responseCode": "ACCEPT",
+    "responseMessage": "Transaction accepted",
+    "riskDecision": {"fraudRiskScore": "14", "fraudStatus": "LOW_RISK"},
+}
+
+
+def sse_body(events: int) -> bytes:
+    """Builds a Server-Sent Events stream carrying `events` JSON payloads."""
+    payload = json.dumps(PAYMENT_RESPONSE)
+    return b"".join(
+        f"event: payment\nid: {i}\ndata: {payload}\n\n".encode() for i in range(events)
+    )
+
+
+def gateway_handler(request: httpx.Request) -> httpx.Response:
+    """`httpx.MockTransport` handler answering like the payments gateway."""
+    path = request.url.path
+    if "/refunds" in path:
+        body = REFUND_RESPONSE
+    elif "/verifications" in path:
+        body = VERIFICATION_RESPONSE
+    elif "/fraudcheck" in path:
+        body = FRAUD_CHECK_RESPONSE
+    else:
+        body = PAYMENT_RESPONSE
+    return httpx.Response(200, json=body)
+
+
+def authorize(client: Any) -> Any:
+    """Pre-seeds the OAuth2 token of a Client/AsyncClient so no token request is made."""
+    auth = client._base_client._auths["auth"]
+    auth.access_token = "benchmark-token"
+    auth.expires_at = datetime.datetime.now() + datetime.timedelta(days=1)
+    return client
@@ -0,0 +1,180 @@
+import asyncio
+import gc
+import inspect
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+"""
+Minimal benchmark harness.
+
+Each benchmark is a zero-argument callable (or coroutine function) that
+performs one operation. The harness times every call individually to report
+throughput and latency percentiles, then repeats a shorter run under
+tracemalloc to report allocations per operation.
+"""
+
+Operation = Union[Callable[[], Any], Callable[[], Awaitable[Any]]]
+Setup = Callable[[], Operation]
+
+
+class Benchmark:
+    """A named benchmark whose `setup` returns the operation to measure."""
+
+    def __init__(self, *, name: str, group: str, setup: Setup) -> None:
+        self.name = name
+        self.group = group
+        self.setup = setup
+
+
+_REGISTRY: List[Benchmark] = []
+
+
+def benchmark(name: str, *, group: str) -> Callable[[Setup], Setup]:
+    """
+    Registers a benchmark.
+
+    The decorated function is called once to build the operation, so fixtures
+    and clients are created outside the measured loop.
+    """
+
+    def decorator(setup: Setup) -> Setup:
+        _REGISTRY.append(Benchmark(name=name, group=group, setup=setup))
+        return setup
+
+    return decorator
+
+
+def registered() -> List[Benchmark]:
+    """Returns all registered benchmarks in registration order."""
+    return list(_REGISTRY)
+
+
+def _percentile(sorted_values: List[int], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return float(sorted_values[index])
+
+
+def _time_sync(op: Callable[[], Any], iterations: int) -> List[int]:
+    timings = []
+    clock = time.perf_counter_ns
+    for _ in range(iterations):
+        start = clock()
+        op()
+        timings.append(clock() - start)
+    return timings
+
+
+async def _time_async(op: Callable[[], Awaitable[Any]], iterations: int) -> List[int]:
+    timings = []
+    clock = time.perf_counter_ns
+    for _ in range(iterations):
+        start = clock()
+        await op()
+        timings.append(clock() - start)
+    return timings
+
+
+def _trace_operation() -> int:
+    """Resets the traced peak before an operation and returns the traced memory."""
+    if hasattr(tracemalloc, "reset_peak"):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        return current
+    # Python 3.8 has no `reset_peak`, restarting clears the traces and the peak
+    tracemalloc.stop()
+    tracemalloc.start()
+    return 0
+
+
+def _allocations_sync(op: Callable[[], Any], iterations: int) -> Dict[str, float]:
+    peaks = retained = 0
+    tracemalloc.start()
+    try:
+        for _ in range(iterations):
+            before = _trace_operation()
+            op()
+            after, peak = tracemalloc.get_traced_memory()
+            peaks += peak - before
+            retained += after - before
+    finally:
+        tracemalloc.stop()
+    return {
+        "peak_bytes_per_op": peaks / iterations,
+        "retained_bytes_per_op": retained / iterations,
+    }
+
+
+async def _allocations_async(
+    op: Callable[[], Awaitable[Any]], iterations: int
+) -> Dict[str, float]:
+    peaks = retained = 0
+    tracemalloc.start()
+    try:
+        for _ in range(iterations):
+            before = _trace_operation()
+            await op()
+            after, peak = tracemalloc.get_traced_memory()
+            peaks += peak - before
+            retained += after - before
+    finally:
+        tracemalloc.stop()
+    return {
+        "peak_bytes_per_op": peaks / iterations,
+        "retained_bytes_per_op": retained / iterations,
+    }
+
+
+def run(
+    bench: Benchmark,
+    *,
+    iterations: int,
+    warmup: int,
+    alloc_iterations: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Runs a single benchmark and returns its results as a JSON-serializable dict.
+
+    Args:
+        bench: Benchmark to run
+        iterations: Number of timed operations
+        warmup: Number of untimed operations run first
+        alloc_iterations: Number of operations run under tracemalloc
+    """
+    op = bench.setup()
+    alloc_iterations = alloc_iterations or max(1, iterations // 10)
+    gc.collect()
+
+    if inspect.iscoroutinefunction(op):
+
+        async def measure() -> Any:
+            await _time_async(op, warmup)
+            timings = await _time_async(op, iterations)
+            allocations = await _allocations_async(op, alloc_iterations)
+            return timings, allocations
+
+        timings, allocations = asyncio.run(measure())
+    else:
+        _time_sync(op, warmup)
+        timings = _time_sync(op, iterations)
+        allocations = _allocations_sync(op, alloc_iterations)
+
+    total_ns = sum(timings)
+    ordered = sorted(timings)
+    return {
+        "name": bench.name,
+        "group": bench.group,
+        "iterations": iterations,
+        "ops_per_sec": iterations / (total_ns / 1e9) if total_ns else 0.0,
+        "latency_ns": {
+            "mean": total_ns / iterations,
+            "min": float(ordered[0]),
+            "p50": _percentile(ordered, 50),
+            "p90": _percentile(ordered, 90),
+            "p99": _percentile(ordered, 99),
+            "max": float(ordered[-1]),
+        },
+        "allocations": {"iterations": alloc_iterations, **allocations},
+    }
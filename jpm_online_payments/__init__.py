@@ -1,6 +1,14 @@
-from .core import ApiError, BinaryResponse
+from .core import ApiError, BinaryResponse, MetricsRegistry, render_prometheus
 from .client import AsyncClient, Client
 from .environment import Environment
 
 
-__all__ = ["ApiError", "AsyncClient", "BinaryResponse", "Client", "Environment"]
+__all__ = [
+    "ApiError",
+    "AsyncClient",
+    "BinaryResponse",
+    "Client",
+    "Environment",
+    "MetricsRegistry",
+    "render_prometheus",
+]
@@ -0,0 +1,39 @@
+from .captures import CaptureIntent, CaptureOutcome, CaptureScheduler, run_captures
+from .reconcile import (
+    Checkpoint,
+    ReconciliationRecord,
+    decode_result,
+    fetch_records,
+    read_records,
+    reconcile,
+    write_results,
+)
+from .sharded import (
+    BatchReport,
+    BatchResult,
+    RefundIntent,
+    ShardedExecutor,
+    run_sharded,
+    shard_of,
+)
+
+
+__all__ = [
+    "BatchReport",
+    "BatchResult",
+    "CaptureIntent",
+    "CaptureOutcome",
+    "CaptureScheduler",
+    "Checkpoint",
+    "ReconciliationRecord",
+    "RefundIntent",
+    "ShardedExecutor",
+    "decode_result",
+    "fetch_records",
+    "read_records",
+    "reconcile",
+    "run_captures",
+    "run_sharded",
+    "shard_of",
+    "write_results",
+]
@@ -0,0 +1,305 @@
+import asyncio
+import time
+import uuid
+from typing import (
+    Any,
+    AsyncIterable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Union,
+)
+
+from jpm_online_payments.client import AsyncClient
+from jpm_online_payments.core import ModelRequestOptions
+from jpm_online_payments.types import models
+
+"""
+Scheduling of captures for payments authorized with `capture_method="MANUAL"`.
+
+Capture intents are buffered per merchant and flushed as a batch once a
+merchant's buffer reaches `max_batch_size` or its oldest intent has waited
+`flush_interval` seconds. Captures of flushed batches run concurrently over the
+client's connection pool, at most `max_concurrency` at a time, and each one is
+reported as a `CaptureOutcome`. `submit` waits while `max_pending` captures are
+buffered or in flight, so producers cannot run ahead of the gateway.
+"""
+
+
+class CaptureIntent:
+    """
+    A capture to perform for an authorized payment.
+
+    Attributes:
+        transaction_id: Identifier of the authorized payment
+        merchant_id: Identifier for the merchant account
+        request_id: Unique identifier of the capture request; generated when not
+            given, and kept for retries of the same intent
+        fields: Additional keyword arguments for `payments.captures.create`, e.g.
+            `amount` for a partial capture
+    """
+
+    __slots__ = ("transaction_id", "merchant_id", "request_id", "fields")
+
+    def __init__(
+        self,
+        *,
+        transaction_id: str,
+        merchant_id: str,
+        request_id: Optional[str] = None,
+        **fields: Any,
+    ) -> None:
+        self.transaction_id = transaction_id
+        self.merchant_id = merchant_id
+        self.request_id = request_id or str(uuid.uuid4())
+        self.fields = fields
+
+    def __repr__(self) -> str:
+        return (
+            f"CaptureIntent(transaction_id={self.transaction_id!r}, "
+            f"merchant_id={self.merchant_id!r}, request_id={self.request_id!r})"
+        )
+
+
+class CaptureOutcome:
+    """
+    Result of a single capture.
+
+    Attributes:
+        intent: Capture intent this outcome belongs to
+        response: Gateway response, if the capture request succeeded
+        error: Exception raised by the capture request, if it failed
+        duration: Seconds spent on the capture request, excluding queueing
+    """
+
+    __slots__ = ("intent", "response", "error", "duration")
+
+    def __init__(
+        self,
+        *,
+        intent: CaptureIntent,
+        response: Optional[models.PaymentResponse] = None,
+        error: Optional[BaseException] = None,
+        duration: float = 0.0,
+    ) -> None:
+        self.intent = intent
+        self.response = response
+        self.error = error
+        self.duration = duration
+
+    @property
+    def ok(self) -> bool:
+        """Whether the gateway accepted the capture."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"CaptureOutcome({self.intent.transaction_id!r}, {status})"
+
+
+class CaptureScheduler:
+    """
+    Batches capture intents per merchant and runs them with bounded concurrency.
+
+    Use as an async context manager, which starts the periodic flush and on exit
+    flushes the remaining intents and waits for all captures to complete.
+
+    ```py
+    async with CaptureScheduler(client, on_outcome=record) as scheduler:
+        for order in orders:
+            await scheduler.submit(
+                CaptureIntent(
+                    transaction_id=order.transaction_id,
+                    merchant_id=order.merchant_id,
+                )
+            )
+    ```
+
+    Attributes:
+        succeeded: Number of captures accepted by the gateway
+        failed: Number of captures that raised an error
+    """
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        *,
+        max_batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_concurrency: int = 32,
+        max_pending: int = 10_000,
+        on_outcome: Optional[Callable[[CaptureOutcome], Any]] = None,
+        request_options: Optional[ModelRequestOptions] = None,
+    ) -> None:
+        """
+        Args:
+            client: Client performing the captures
+            max_batch_size: Number of buffered intents flushing a merchant's batch
+            flush_interval: Seconds after which a merchant's buffered intents are
+                flushed regardless of batch size
+            max_concurrency: Maximum number of capture requests in flight
+            max_pending: Maximum number of intents buffered or in flight before
+                `submit` waits
+            on_outcome: Called with each capture's outcome as it completes
+            request_options: Request options passed to every capture request
+
+        Raises:
+            ValueError: If a size, interval or limit is not positive
+        """
+        if min(max_batch_size, max_concurrency, max_pending) < 1:
+            raise ValueError(
+                "max_batch_size, max_concurrency and max_pending must be positive"
+            )
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
+        self._client = client
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.max_concurrency = max_concurrency
+        self.max_pending = max_pending
+        self._on_outcome = on_outcome
+        self._request_options = request_options
+        self._buffers: Dict[str, List[CaptureIntent]] = {}
+        self._buffered_at: Dict[str, float] = {}
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._concurrency: Optional[asyncio.Semaphore] = None
+        self._pending: Optional[asyncio.Semaphore] = None
+        self._timer: Optional["asyncio.Task[None]"] = None
+        self._closed = False
+        self.succeeded = 0
+        self.failed = 0
+
+    async def __aenter__(self) -> "CaptureScheduler":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        """Starts the periodic flush; requires a running event loop."""
+        if self._concurrency is None:
+            self._concurrency = asyncio.Semaphore(self.max_concurrency)
+            self._pending = asyncio.Semaphore(self.max_pending)
+        if self._timer is None:
+            self._timer = asyncio.ensure_future(self._flush_periodically())
+
+    async def submit(self, intent: CaptureIntent) -> None:
+        """
+        Buffers a capture intent, flushing its merchant's batch once full.
+
+        Waits while `max_pending` intents are buffered or in flight.
+
+        Raises:
+            RuntimeError: If the scheduler is closed
+        """
+        if self._closed:
+            raise RuntimeError("capture scheduler is closed")
+        self.start()
+        assert self._pending is not None
+        await self._pending.acquire()
+        merchant_id = intent.merchant_id
+        buffer = self._buffers.get(merchant_id)
+        if buffer is None:
+            buffer = self._buffers[merchant_id] = []
+            self._buffered_at[merchant_id] = time.monotonic()
+        buffer.append(intent)
+        if len(buffer) >= self.max_batch_size:
+            self._flush_merchant(merchant_id)
+
+    def flush(self) -> None:
+        """Dispatches the buffered intents of every merchant."""
+        for merchant_id in list(self._buffers):
+            self._flush_merchant(merchant_id)
+
+    async def close(self) -> None:
+        """Stops the periodic flush, flushes and waits for all captures."""
+        self._closed = True
+        if self._timer is not None:
+            self._timer.cancel()
+            try:
+                await self._timer
+            except asyncio.CancelledError:
+                pass
+            self._timer = None
+        self.flush()
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks))
+
+    def _flush_merchant(self, merchant_id: str) -> None:
+        batch = self._buffers.pop(merchant_id)
+        del self._buffered_at[merchant_id]
+        for intent in batch:
+            task = asyncio.ensure_future(self._capture(intent))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval / 4)
+            deadline = time.monotonic() - self.flush_interval
+            for merchant_id, buffered_at in list(self._buffered_at.items()):
+                if buffered_at <= deadline:
+                    self._flush_merchant(merchant_id)
+
+    async def _capture(self, intent: CaptureIntent) -> None:
+        assert self._concurrency is not None and self._pending is not None
+        try:
+            async with self._concurrency:
+                started = time.perf_counter()
+                try:
+                    response = await self._client.payments.captures.create(
+                        id=intent.transaction_id,
+                        merchant_id=intent.merchant_id,
+                        request_id=intent.request_id,
+                        request_options=self._request_options,
+                        **intent.fields,
+                    )
+                except Exception as exc:
+                    outcome = CaptureOutcome(
+                        intent=intent,
+                        error=exc,
+                        duration=time.perf_counter() - started,
+                    )
+                    self.failed += 1
+                else:
+                    outcome = CaptureOutcome(
+                        intent=intent,
+                        response=response,
+                        duration=time.perf_counter() - started,
+                    )
+                    self.succeeded += 1
+        finally:
+            self._pending.release()
+        if self._on_outcome is not None:
+            self._on_outcome(outcome)
+
+
+async def run_captures(
+    client: AsyncClient,
+    intents: Union[Iterable[CaptureIntent], AsyncIterable[CaptureIntent]],
+    **options: Any,
+) -> List[CaptureOutcome]:
+    """
+    Captures all `intents` through a `CaptureScheduler` and returns the outcomes
+    in completion order.
+
+    Args:
+        client: Client performing the captures
+        intents: Capture intents, from a regular or async iterable
+        options: Keyword arguments for `CaptureScheduler`, except `on_outcome`
+    """
+    outcomes: List[CaptureOutcome] = []
+    async with CaptureScheduler(
+        client, on_outcome=outcomes.append, **options
+    ) as scheduler:
+        if isinstance(intents, AsyncIterable):
+            async for intent in intents:
+                await scheduler.submit(intent)
+        else:
+            for intent in intents:
+                await scheduler.submit(intent)
+    return outcomes
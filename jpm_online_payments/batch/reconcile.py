@@ -0,0 +1,431 @@
+import asyncio
+import csv
+import json
+import os
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from jpm_online_payments.client import AsyncClient
+from jpm_online_payments.core import ApiError, RawResponse
+
+"""
+Streaming reconciliation of transaction IDs against the gateway.
+
+The pipeline is a chain of generator stages: `read_records` parses a JSONL or CSV
+file lazily, `fetch_records` looks each transaction up with `payments.get_by_id`
+or `refunds.get_by_id` with bounded concurrency, `decode_result` turns each
+response into an output record, and `write_results` appends JSONL. Every stage
+pulls from the previous one, and at most `concurrency` lookups are outstanding,
+so memory use does not depend on the input size. Results are written as lookups
+complete, so a slow lookup does not hold back the others and output records are
+not in input order; each carries its input `offset`.
+
+`reconcile` runs the whole pipeline and periodically writes a checkpoint holding
+the byte position in the input after the last record of the longest fully written
+prefix, the records written beyond that prefix and the output size. Running it
+again with the same checkpoint seeks the input to that position and skips the
+records already written, truncating output written after the checkpoint so no
+record is duplicated.
+"""
+
+KINDS = ("payment", "refund")
+
+
+class ReconciliationRecord:
+    """
+    A transaction to look up.
+
+    Attributes:
+        offset: Zero-based position of the record in the input
+        end: Byte offset in the input just past the record, where reading resumes
+            after it
+        transaction_id: Identifier of the transaction
+        merchant_id: Identifier for the merchant account
+        kind: `payment` or `refund`
+    """
+
+    __slots__ = ("offset", "end", "transaction_id", "merchant_id", "kind")
+
+    def __init__(
+        self,
+        *,
+        offset: int,
+        transaction_id: str,
+        merchant_id: str,
+        kind: str,
+        end: int = 0,
+    ) -> None:
+        if kind not in KINDS:
+            raise ValueError(f"unknown transaction kind {kind!r}, expected {KINDS}")
+        self.offset = offset
+        self.end = end
+        self.transaction_id = transaction_id
+        self.merchant_id = merchant_id
+        self.kind = kind
+
+    def __repr__(self) -> str:
+        return (
+            f"ReconciliationRecord(offset={self.offset}, "
+            f"transaction_id={self.transaction_id!r}, kind={self.kind!r})"
+        )
+
+
+class _Lines:
+    """Iterates the decoded lines of a binary file, tracking the byte position."""
+
+    __slots__ = ("file", "position")
+
+    def __init__(self, file: BinaryIO) -> None:
+        self.file = file
+        self.position = file.tell()
+
+    def __iter__(self) -> "_Lines":
+        return self
+
+    def __next__(self) -> str:
+        line = self.file.readline()
+        if not line:
+            raise StopIteration
+        self.position += len(line)
+        return line.decode("utf-8")
+
+
+def read_records(
+    path: str,
+    *,
+    start: int = 0,
+    position: int = 0,
+    merchant_id: Optional[str] = None,
+    kind: str = "payment",
+) -> Iterator[ReconciliationRecord]:
+    """
+    Lazily reads transactions from a JSONL or CSV file.
+
+    JSONL lines are either a bare transaction ID string or an object, and CSV files
+    have a header row; objects and rows carry `transaction_id` and optionally
+    `merchant_id` and `kind`. Files ending in `.csv` are read as CSV, others as
+    JSONL. Blank JSONL lines are skipped and do not count as records.
+
+    Args:
+        path: Input file
+        start: Offset of the first record to yield, e.g. from a checkpoint
+        position: Byte offset of record `start` in `path`, e.g. from a checkpoint.
+            Reading starts there instead of parsing and skipping the records
+            before `start`.
+        merchant_id: Merchant for records without a `merchant_id`
+        kind: Kind of records without a `kind`
+
+    Raises:
+        ValueError: If a record has no transaction ID or merchant
+    """
+    with open(path, "rb") as file:
+        lines = _Lines(file)
+        if path.endswith(".csv"):
+            header = next(csv.reader(lines), [])
+            if position:
+                file.seek(position)
+                lines.position = position
+            rows: Iterable[Any] = csv.DictReader(lines, fieldnames=header)
+        else:
+            if position:
+                file.seek(position)
+                lines.position = position
+            rows = (json.loads(line) for line in lines if line.strip())
+        offset = start if position else 0
+        for row in rows:
+            if offset < start:
+                offset += 1
+                continue
+            if isinstance(row, str):
+                row = {"transaction_id": row}
+            transaction_id = row.get("transaction_id")
+            record_merchant_id = row.get("merchant_id") or merchant_id
+            if not transaction_id or not record_merchant_id:
+                raise ValueError(
+                    f"record {offset} of {path} needs a transaction_id and merchant_id"
+                )
+            yield ReconciliationRecord(
+                offset=offset,
+                end=lines.position,
+                transaction_id=transaction_id,
+                merchant_id=record_merchant_id,
+                kind=row.get("kind") or kind,
+            )
+            offset += 1
+
+
+FetchResult = Union[RawResponse[Any], Exception]
+
+
+async def _fetch(client: AsyncClient, record: ReconciliationRecord) -> FetchResult:
+    resource = client.payments if record.kind == "payment" else client.refunds
+    try:
+        response = await resource.get_by_id(
+            id=record.transaction_id,
+            merchant_id=record.merchant_id,
+            request_options={"decode": "raw"},
+        )
+    except Exception as exc:
+        return exc
+    return response
+
+
+async def _iterate(
+    records: Iterable[ReconciliationRecord],
+) -> AsyncIterator[ReconciliationRecord]:
+    for record in records:
+        yield record
+
+
+async def fetch_records(
+    client: AsyncClient,
+    records: Union[Iterable[ReconciliationRecord], AsyncIterable[ReconciliationRecord]],
+    *,
+    concurrency: int = 32,
+) -> AsyncIterator[Tuple[ReconciliationRecord, FetchResult]]:
+    """
+    Looks up records with at most `concurrency` requests in flight.
+
+    Results are yielded as lookups complete, not in input order, with the
+    undecoded response or the exception raised by the lookup. The next record is
+    only read once a slot is free, so a slow consumer holds back the input.
+
+    Args:
+        client: Client performing the lookups
+        records: Records to look up, from a regular or async iterable
+        concurrency: Maximum number of lookups in flight
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be positive")
+    if not isinstance(records, AsyncIterable):
+        records = _iterate(records)
+    iterator = records.__aiter__()
+    in_flight: Dict["asyncio.Future[FetchResult]", ReconciliationRecord] = {}
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(in_flight) < concurrency:
+                try:
+                    record = await iterator.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                in_flight[asyncio.ensure_future(_fetch(client, record))] = record
+            if not in_flight:
+                return
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=lambda task: in_flight[task].offset):
+                yield in_flight.pop(task), task.result()
+    finally:
+        for task in in_flight:
+            task.cancel()
+
+
+def decode_result(record: ReconciliationRecord, result: FetchResult) -> Dict[str, Any]:
+    """
+    Builds the output record of a lookup.
+
+    The output carries the input `offset`, `transaction_id`, `merchant_id` and
+    `kind`, then `status_code` and either the gateway's JSON `response` or the
+    `error`.
+    """
+    output: Dict[str, Any] = {
+        "offset": record.offset,
+        "transaction_id": record.transaction_id,
+        "merchant_id": record.merchant_id,
+        "kind": record.kind,
+    }
+    if isinstance(result, ApiError):
+        output["status_code"] = result.status_code
+        output["error"] = result.body
+    elif isinstance(result, Exception):
+        output["status_code"] = None
+        output["error"] = repr(result)
+    else:
+        # raw responses are returned for error statuses too
+        output["status_code"] = result.status_code
+        try:
+            body: Any = json.loads(result.content)
+        except ValueError:
+            body = result.content.decode("utf-8", "replace")
+        output["response" if 200 <= result.status_code < 300 else "error"] = body
+    return output
+
+
+class Checkpoint:
+    """
+    Progress of a reconciliation run, stored as JSON.
+
+    Attributes:
+        offset: Offset of the first input record not known to be written
+        position: Byte offset of record `offset` in the input
+        completed: Byte offsets in the input past each record after `offset`
+            already written, by record offset
+        output_size: Size in bytes of the output file covering the records
+            before `offset` and the `completed` ones
+    """
+
+    __slots__ = ("path", "offset", "position", "completed", "output_size")
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.offset = 0
+        self.position = 0
+        self.completed: Dict[int, int] = {}
+        self.output_size = 0
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                data = json.load(file)
+            self.offset = data["offset"]
+            self.position = data.get("position", 0)
+            self.completed = {offset: end for offset, end in data.get("completed", [])}
+            self.output_size = data["output_size"]
+
+    def save(
+        self,
+        *,
+        offset: int,
+        position: int,
+        completed: Dict[int, int],
+        output_size: int,
+    ) -> None:
+        """Atomically replaces the stored checkpoint."""
+        self.offset = offset
+        self.position = position
+        self.completed = dict(completed)
+        self.output_size = output_size
+        data = {
+            "offset": offset,
+            "position": position,
+            "completed": sorted(completed.items()),
+            "output_size": output_size,
+        }
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.path)
+
+
+async def write_results(
+    results: AsyncIterable[Tuple[ReconciliationRecord, FetchResult]],
+    path: str,
+    *,
+    checkpoint: Optional[Checkpoint] = None,
+    checkpoint_every: int = 1000,
+) -> int:
+    """
+    Decodes results and appends them to a JSONL file.
+
+    With a checkpoint, output written after it is truncated first, and the output
+    is synced and the checkpoint saved every `checkpoint_every` records and at
+    the end. Results may arrive in any order, but their records must have
+    consecutive offsets from the checkpoint's `offset` on, apart from its
+    `completed` records, as `read_records` yields them.
+
+    Returns:
+        Number of records written
+
+    Raises:
+        FileNotFoundError: If the checkpoint has progress but the output is missing
+    """
+    exists = os.path.exists(path)
+    if checkpoint is not None and checkpoint.output_size and not exists:
+        raise FileNotFoundError(f"output {path} of checkpoint {checkpoint.path}")
+    mode = "r+b" if checkpoint is not None and exists else "wb"
+    count = 0
+    with open(path, mode) as file:
+        if checkpoint is not None:
+            file.truncate(checkpoint.output_size)
+            file.seek(checkpoint.output_size)
+            next_offset = checkpoint.offset
+            position = checkpoint.position
+            completed = dict(checkpoint.completed)
+        async for record, result in results:
+            line = json.dumps(decode_result(record, result), separators=(",", ":"))
+            file.write(line.encode("utf-8") + b"\n")
+            count += 1
+            if checkpoint is None:
+                continue
+            completed[record.offset] = record.end
+            while next_offset in completed:
+                position = completed.pop(next_offset)
+                next_offset += 1
+            if count % checkpoint_every == 0:
+                file.flush()
+                os.fsync(file.fileno())
+                checkpoint.save(
+                    offset=next_offset,
+                    position=position,
+                    completed=completed,
+                    output_size=file.tell(),
+                )
+        if checkpoint is not None and count:
+            file.flush()
+            os.fsync(file.fileno())
+            checkpoint.save(
+                offset=next_offset,
+                position=position,
+                completed=completed,
+                output_size=file.tell(),
+            )
+    return count
+
+
+async def reconcile(
+    client: AsyncClient,
+    source: str,
+    destination: str,
+    *,
+    checkpoint_path: Optional[str] = None,
+    checkpoint_every: int = 1000,
+    concurrency: int = 32,
+    merchant_id: Optional[str] = None,
+    kind: str = "payment",
+) -> int:
+    """
+    Looks up every transaction of `source` and writes the results to
+    `destination` as JSONL, resuming from `checkpoint_path` if it exists.
+
+    Args:
+        client: Client performing the lookups
+        source: JSONL or CSV file of transactions, see `read_records`
+        destination: JSONL output file
+        checkpoint_path: File recording progress; without it the output is
+            rewritten from the start
+        checkpoint_every: Number of records between checkpoints
+        concurrency: Maximum number of lookups in flight
+        merchant_id: Merchant for records without a `merchant_id`
+        kind: Kind of records without a `kind`
+
+    Returns:
+        Number of records written by this run
+    """
+    checkpoint = Checkpoint(checkpoint_path) if checkpoint_path else None
+    records: Iterator[ReconciliationRecord] = read_records(
+        source,
+        start=checkpoint.offset if checkpoint else 0,
+        position=checkpoint.position if checkpoint else 0,
+        merchant_id=merchant_id,
+        kind=kind,
+    )
+    if checkpoint is not None and checkpoint.completed:
+        completed = checkpoint.completed
+        records = (record for record in records if record.offset not in completed)
+    return await write_results(
+        fetch_records(client, records, concurrency=concurrency),
+        destination,
+        checkpoint=checkpoint,
+        checkpoint_every=checkpoint_every,
+    )
@@ -0,0 +1,551 @@
+import asyncio
+import collections
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+import zlib
+from multiprocessing.connection import Connection, wait
+from typing import (
+    Any,
+    Callable,
+    Counter,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+from jpm_online_payments.client import AsyncClient
+from jpm_online_payments.core import (
+    ApiError,
+    ModelRequestOptions,
+    RawRequestOptions,
+    RawResponse,
+)
+
+from .captures import CaptureIntent
+
+"""
+Capture and refund batches spread over a pool of worker processes.
+
+Encoding requests and decoding responses are CPU bound, so a single process runs
+out of CPU on large batches before the network is saturated. `ShardedExecutor`
+assigns each item to a worker process by a stable hash of its `merchant-id`, so
+all of a merchant's requests share one worker and its connections. Each worker
+runs its own `AsyncClient`, built from `client_options`, with at most
+`concurrency` requests in flight.
+
+Items are sent to the workers in chunks of plain tuples over one pipe per worker,
+and results come back the same way over a second pipe, so neither side pickles
+SDK objects. A worker reads items on a dedicated thread, so the parent can always
+hand over items while waiting for results. At most `max_pending` items per worker
+are outstanding, which bounds memory for inputs of any size. When the input is
+exhausted, every worker reports its totals, and the parent merges them into a
+`BatchReport`.
+"""
+
+KINDS = ("capture", "refund")
+
+# (index, kind, merchant_id, request_id, transaction_id, fields)
+_Item = Tuple[int, str, str, str, Optional[str], Dict[str, Any]]
+# (index, merchant_id, request_id, status_code, transaction_id, response_status,
+#  error, duration)
+_Result = Tuple[
+    int, str, str, Optional[int], Optional[str], Optional[str], Optional[str], float
+]
+
+
+class RefundIntent:
+    """
+    A refund to create.
+
+    Attributes:
+        merchant_id: Identifier for the merchant account
+        request_id: Unique identifier of the refund request; generated when not
+            given
+        fields: Additional keyword arguments for `refunds.create`, e.g. `merchant`,
+            `amount` and `payment_request_id`
+    """
+
+    __slots__ = ("merchant_id", "request_id", "fields")
+
+    def __init__(
+        self, *, merchant_id: str, request_id: Optional[str] = None, **fields: Any
+    ) -> None:
+        self.merchant_id = merchant_id
+        self.request_id = request_id or str(uuid.uuid4())
+        self.fields = fields
+
+    def __repr__(self) -> str:
+        return (
+            f"RefundIntent(merchant_id={self.merchant_id!r}, "
+            f"request_id={self.request_id!r})"
+        )
+
+
+BatchItem = Union[CaptureIntent, RefundIntent]
+
+
+class BatchResult:
+    """
+    Result of a single capture or refund.
+
+    Attributes:
+        index: Position of the item in the input
+        merchant_id: Identifier for the merchant account
+        request_id: Request identifier the item was sent with
+        status_code: HTTP status code, or None if no response was received
+        transaction_id: Transaction identifier from the response
+        response_status: `responseStatus` from the response, e.g. `SUCCESS`
+        error: Description of the failure, if the request failed
+        duration: Seconds spent on the request, excluding queueing
+    """
+
+    __slots__ = (
+        "index",
+        "merchant_id",
+        "request_id",
+        "status_code",
+        "transaction_id",
+        "response_status",
+        "error",
+        "duration",
+    )
+
+    def __init__(self, result: _Result) -> None:
+        (
+            self.index,
+            self.merchant_id,
+            self.request_id,
+            self.status_code,
+            self.transaction_id,
+            self.response_status,
+            self.error,
+            self.duration,
+        ) = result
+
+    @property
+    def ok(self) -> bool:
+        """Whether the gateway accepted the request."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"BatchResult(index={self.index}, {status})"
+
+
+class BatchReport:
+    """
+    Totals of a sharded batch, merged from every worker.
+
+    Attributes:
+        succeeded: Number of requests accepted by the gateway
+        failed: Number of requests that raised an error
+        status_codes: Number of responses per HTTP status code; requests without
+            a response are counted under `error`
+        merchants: Number of requests per merchant-id, as `[succeeded, failed]`
+        shards: Number of requests handled by each worker
+        cpu_time: CPU seconds used by all workers together
+        elapsed: Wall-clock seconds from start to the last result
+    """
+
+    __slots__ = (
+        "succeeded",
+        "failed",
+        "status_codes",
+        "merchants",
+        "shards",
+        "cpu_time",
+        "elapsed",
+    )
+
+    def __init__(self, *, processes: int) -> None:
+        self.succeeded = 0
+        self.failed = 0
+        self.status_codes: Counter[str] = collections.Counter()
+        self.merchants: Dict[str, List[int]] = {}
+        self.shards = [0] * processes
+        self.cpu_time = 0.0
+        self.elapsed = 0.0
+
+    @property
+    def total(self) -> int:
+        """Number of requests made."""
+        return self.succeeded + self.failed
+
+    def _merge(self, shard: int, summary: Dict[str, Any]) -> None:
+        self.succeeded += summary["succeeded"]
+        self.failed += summary["failed"]
+        self.status_codes.update(summary["status_codes"])
+        for merchant_id, (succeeded, failed) in summary["merchants"].items():
+            counts = self.merchants.setdefault(merchant_id, [0, 0])
+            counts[0] += succeeded
+            counts[1] += failed
+        self.shards[shard] = summary["succeeded"] + summary["failed"]
+        self.cpu_time += summary["cpu_time"]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the report as JSON-serializable data."""
+        return {
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "status_codes": dict(self.status_codes),
+            "merchants": self.merchants,
+            "shards": self.shards,
+            "cpu_time": self.cpu_time,
+            "elapsed": self.elapsed,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"BatchReport(total={self.total}, succeeded={self.succeeded}, "
+            f"failed={self.failed})"
+        )
+
+
+def shard_of(merchant_id: str, processes: int) -> int:
+    """Returns the worker a merchant's items are assigned to, stable across runs."""
+    return zlib.crc32(merchant_id.encode("utf-8")) % processes
+
+
+def _encode_item(index: int, item: BatchItem) -> _Item:
+    if isinstance(item, CaptureIntent):
+        return (
+            index,
+            "capture",
+            item.merchant_id,
+            item.request_id,
+            item.transaction_id,
+            item.fields,
+        )
+    if isinstance(item, RefundIntent):
+        return (index, "refund", item.merchant_id, item.request_id, None, item.fields)
+    raise TypeError(f"expected a CaptureIntent or RefundIntent, got {item!r}")
+
+
+class ShardedExecutor:
+    """
+    Runs captures and refunds on worker processes sharded by merchant-id.
+
+    ```py
+    executor = ShardedExecutor(
+        client_options={"auth": {...}}, processes=8, concurrency=64
+    )
+    for result in executor.results(read_intents("refunds.jsonl")):
+        if not result.ok:
+            log_failure(result)
+    print(executor.report.to_dict())
+    ```
+
+    Attributes:
+        report: Merged totals of the last completed run
+    """
+
+    def __init__(
+        self,
+        *,
+        client_options: Dict[str, Any],
+        processes: Optional[int] = None,
+        concurrency: int = 32,
+        max_pending: int = 1024,
+        chunk_size: int = 64,
+        request_options: Optional[ModelRequestOptions] = None,
+        mp_context: Optional[Any] = None,
+    ) -> None:
+        """
+        Args:
+            client_options: Keyword arguments for the `AsyncClient` of each worker,
+                e.g. `auth`, `environment` or `base_url`; must be picklable
+            processes: Number of worker processes, by default the number of CPUs
+            concurrency: Maximum number of requests in flight per worker
+            max_pending: Maximum number of items sent to a worker and not yet
+                answered
+            chunk_size: Number of items or results sent over a pipe at once
+            request_options: Request options passed to every request, which is
+                decoded in `raw` mode to report its actual status code
+            mp_context: `multiprocessing` context starting the workers, by default
+                the platform's default start method
+
+        Raises:
+            ValueError: If a count or size is not positive
+        """
+        processes = processes or os.cpu_count() or 1
+        if min(processes, concurrency, max_pending, chunk_size) < 1:
+            raise ValueError(
+                "processes, concurrency, max_pending and chunk_size must be positive"
+            )
+        self.client_options = client_options
+        self.processes = processes
+        self.concurrency = concurrency
+        self.max_pending = max(max_pending, chunk_size)
+        self.chunk_size = chunk_size
+        self.request_options = request_options
+        self._context = mp_context or multiprocessing.get_context()
+        self.report = BatchReport(processes=processes)
+
+    def results(self, items: Iterable[BatchItem]) -> Iterator[BatchResult]:
+        """
+        Sends every item and yields its result as soon as it arrives.
+
+        Results arrive in completion order. Once all results are yielded, `report`
+        holds the merged totals.
+
+        Raises:
+            RuntimeError: If a worker process exits before reporting its totals
+            TypeError: If an item is neither a `CaptureIntent` nor a `RefundIntent`
+        """
+        started = time.perf_counter()
+        report = BatchReport(processes=self.processes)
+        workers = [self._start_worker(shard) for shard in range(self.processes)]
+        pending = [0] * self.processes
+        chunks: List[List[_Item]] = [[] for _ in range(self.processes)]
+        running = {results: shard for shard, (_, _, results) in enumerate(workers)}
+
+        def receive(block: bool) -> Iterator[BatchResult]:
+            ready = wait(list(running), timeout=None if block else 0)
+            # `wait` returns the objects it was given, here only result pipes
+            for connection in cast(List[Connection], ready):
+                shard = running[connection]
+                try:
+                    message = connection.recv()
+                except EOFError:
+                    raise RuntimeError(
+                        f"batch worker {shard} exited with code "
+                        f"{workers[shard][0].exitcode}"
+                    ) from None
+                if isinstance(message, dict):
+                    report._merge(shard, message)
+                    del running[connection]
+                    continue
+                chunk = cast(List[_Result], message)
+                pending[shard] -= len(chunk)
+                for result in chunk:
+                    yield BatchResult(result)
+
+        def send(shard: int) -> Iterator[BatchResult]:
+            chunk = chunks[shard]
+            while pending[shard] + len(chunk) > self.max_pending:
+                yield from receive(block=True)
+            workers[shard][1].send(chunk)
+            pending[shard] += len(chunk)
+            chunks[shard] = []
+
+        try:
+            for index, item in enumerate(items):
+                encoded = _encode_item(index, item)
+                shard = shard_of(encoded[2], self.processes)
+                chunks[shard].append(encoded)
+                if len(chunks[shard]) >= self.chunk_size:
+                    yield from send(shard)
+                yield from receive(block=False)
+            for shard in range(self.processes):
+                if chunks[shard]:
+                    yield from send(shard)
+                workers[shard][1].send(None)
+            while running:
+                yield from receive(block=True)
+        finally:
+            for process, items_connection, results_connection in workers:
+                if running:
+                    process.terminate()
+                process.join()
+                items_connection.close()
+                results_connection.close()
+        report.elapsed = time.perf_counter() - started
+        self.report = report
+
+    def run(
+        self,
+        items: Iterable[BatchItem],
+        *,
+        on_result: Optional[Callable[[BatchResult], Any]] = None,
+    ) -> BatchReport:
+        """
+        Runs every item and returns the merged report.
+
+        Args:
+            items: Captures and refunds to run
+            on_result: Called with each result as it arrives
+        """
+        for result in self.results(items):
+            if on_result is not None:
+                on_result(result)
+        return self.report
+
+    def _start_worker(self, shard: int) -> Tuple[Any, Connection, Connection]:
+        items_receiver, items_sender = self._context.Pipe(duplex=False)
+        results_receiver, results_sender = self._context.Pipe(duplex=False)
+        process = self._context.Process(
+            target=_work,
+            name=f"jpm-online-payments-batch-{shard}",
+            args=(
+                items_receiver,
+                results_sender,
+                self.client_options,
+                self.concurrency,
+                self.chunk_size,
+                self.request_options,
+            ),
+            daemon=True,
+        )
+        process.start()
+        # the worker holds its own copies of these ends
+        items_receiver.close()
+        results_sender.close()
+        return process, items_sender, results_receiver
+
+
+def _work(
+    items: Connection,
+    results: Connection,
+    client_options: Dict[str, Any],
+    concurrency: int,
+    chunk_size: int,
+    request_options: Optional[ModelRequestOptions],
+) -> None:
+    asyncio.run(
+        _serve(items, results, client_options, concurrency, chunk_size, request_options)
+    )
+
+
+async def _serve(
+    items: Connection,
+    results: Connection,
+    client_options: Dict[str, Any],
+    concurrency: int,
+    chunk_size: int,
+    request_options: Optional[ModelRequestOptions],
+) -> None:
+    client = AsyncClient(**client_options)
+    loop = asyncio.get_running_loop()
+    chunks: "asyncio.Queue[Optional[List[_Item]]]" = asyncio.Queue()
+
+    def read() -> None:
+        # a thread keeps draining the items pipe while results are being sent
+        while True:
+            chunk = items.recv()
+            loop.call_soon_threadsafe(chunks.put_nowait, chunk)
+            if chunk is None:
+                return
+
+    threading.Thread(target=read, daemon=True).start()
+    semaphore = asyncio.Semaphore(concurrency)
+    # raw responses carry the actual status code, e.g. 201 for a created refund
+    raw_options: RawRequestOptions = {**(request_options or {}), "decode": "raw"}
+    buffer: List[_Result] = []
+    summary: Dict[str, Any] = {
+        "succeeded": 0,
+        "failed": 0,
+        "status_codes": collections.Counter(),
+        "merchants": {},
+        "cpu_time": 0.0,
+    }
+
+    async def run(item: _Item) -> None:
+        index, kind, merchant_id, request_id, transaction_id, fields = item
+        started = time.perf_counter()
+        status_code: Optional[int] = None
+        response_transaction_id = response_status = error = None
+        try:
+            if kind == "capture":
+                response: RawResponse[Any] = await client.payments.captures.create(
+                    id=cast(str, transaction_id),
+                    merchant_id=merchant_id,
+                    request_id=request_id,
+                    request_options=raw_options,
+                    **fields,
+                )
+            else:
+                response = await client.refunds.create(
+                    merchant_id=merchant_id,
+                    request_id=request_id,
+                    request_options=raw_options,
+                    **fields,
+                )
+            status_code = response.status_code
+            # decoding raises the `ApiError` of a response other than 2xx
+            response_transaction_id = response.transaction_id
+            response_status = response.response_status
+        except ApiError as exc:
+            status_code = exc.status_code
+            error = str(exc)
+        except Exception as exc:
+            error = repr(exc)
+        finally:
+            semaphore.release()
+        buffer.append(
+            (
+                index,
+                merchant_id,
+                request_id,
+                status_code,
+                response_transaction_id,
+                response_status,
+                error,
+                time.perf_counter() - started,
+            )
+        )
+        summary["succeeded" if error is None else "failed"] += 1
+        summary["status_codes"][str(status_code or "error")] += 1
+        counts = summary["merchants"].setdefault(merchant_id, [0, 0])
+        counts[0 if error is None else 1] += 1
+        if len(buffer) >= chunk_size:
+            flush()
+
+    def flush() -> None:
+        if buffer:
+            results.send(buffer[:])
+            buffer.clear()
+
+    async def flush_periodically() -> None:
+        while True:
+            await asyncio.sleep(0.05)
+            flush()
+
+    flusher = asyncio.ensure_future(flush_periodically())
+    tasks = set()
+    try:
+        while True:
+            chunk = await chunks.get()
+            if chunk is None:
+                break
+            for item in chunk:
+                await semaphore.acquire()
+                task = asyncio.ensure_future(run(item))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        while tasks:
+            await asyncio.gather(*list(tasks))
+    finally:
+        flusher.cancel()
+        await client._base_client.httpx_client.aclose()
+    flush()
+    cpu = os.times()
+    summary["cpu_time"] = cpu.user + cpu.system
+    results.send(summary)
+    results.close()
+
+
+def run_sharded(
+    items: Iterable[BatchItem],
+    *,
+    on_result: Optional[Callable[[BatchResult], Any]] = None,
+    **options: Any,
+) -> BatchReport:
+    """
+    Runs captures and refunds on worker processes sharded by merchant-id and
+    returns the merged report.
+
+    Args:
+        items: Captures and refunds to run
+        on_result: Called in the parent process with each result as it arrives
+        options: Keyword arguments for `ShardedExecutor`
+    """
+    return ShardedExecutor(**options).run(items, on_result=on_result)
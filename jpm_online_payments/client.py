@@ -1,14 +1,24 @@
+import concurrent.futures
 import httpx
 import typing
+import typing_extensions
 
 from jpm_online_payments.core import (
+    DEFAULT_MAX_WORKERS,
     AsyncBaseClient,
     AuthBearer,
     GrantType,
+    Journal,
+    JournalEntry,
+    MetricsRegistry,
     OAuth2,
     OAuth2ClientCredentialsForm,
+    RedactedEntryError,
+    RequestDeduplicator,
     SyncBaseClient,
+    Tracer,
 )
+from jpm_online_payments.core.executor import P, T
 from jpm_online_payments.environment import Environment
 from jpm_online_payments.resources.captures import (
     AsyncCapturesClient,
@@ -32,6 +42,8 @@ from jpm_online_payments.resources.verifications import (
     VerificationsClient,
 )
 
+DEFAULT_TOKEN_URL = "https://id.payments.jpmorgan.com/am/oauth2/alpha/access_token"
+
 
 class Client:
     def __init__(
@@ -42,12 +54,30 @@ class Client:
         httpx_client: typing.Optional[httpx.Client] = None,
         environment: Environment = Environment.PROD,
         auth: typing.Optional[OAuth2ClientCredentialsForm] = None,
+        metrics: typing.Optional[MetricsRegistry] = None,
+        tracer: typing.Optional[Tracer] = None,
+        token_url: str = DEFAULT_TOKEN_URL,
+        token_transport: typing.Optional[httpx.BaseTransport] = None,
+        validation_sample_rate: float = 0.0,
+        request_validation: typing_extensions.Literal[
+            "full", "structural", "sampled"
+        ] = "full",
+        journal: typing.Optional[Journal] = None,
+        deduplicator: typing.Optional[RequestDeduplicator] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ):
         self._base_client = SyncBaseClient(
             base_url=_get_base_url(base_url=base_url, environment=environment),
             httpx_client=(
                 httpx.Client(timeout=timeout) if httpx_client is None else httpx_client
             ),
+            metrics=metrics,
+            tracer=tracer,
+            validation_sample_rate=validation_sample_rate,
+            request_validation=request_validation,
+            journal=journal,
+            deduplicator=deduplicator,
+            max_workers=max_workers,
         )
 
         self.captures = CapturesClient(base_client=self._base_client)
@@ -64,7 +94,7 @@ class Client:
         self._base_client.register_auth(
             "auth",
             OAuth2(
-                token_url="https://id.payments.jpmorgan.com/am/oauth2/alpha/access_token",
+                token_url=token_url,
                 access_token_pointer="/access_token",
                 expires_in_pointer="/expires_in",
                 credentials_location="basic_authorization_header",
@@ -79,9 +109,49 @@ class Client:
                 client_secret=None if not auth else auth.get("client_secret"),
                 scope=None if not auth else auth.get("scope"),
                 request_mutator=AuthBearer(val=None),
+                token_transport=token_transport,
             ),
         )
 
+    def recover_journal(
+        self,
+    ) -> typing.List[
+        typing.Tuple[
+            JournalEntry,
+            typing.Union[httpx.Response, httpx.HTTPError, RedactedEntryError],
+        ]
+    ]:
+        """
+        Resends the requests left unfinished in the journal by an earlier run, with
+        their original `request-id`. See `SyncBaseClient.recover_journal`.
+        """
+        return self._base_client.recover_journal()
+
+    def submit(
+        self,
+        fn: typing.Callable[P, T],
+        /,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> "concurrent.futures.Future[T]":
+        """
+        Runs a call on the client's thread pool of at most `max_workers` threads,
+        which share the client's connection pool.
+
+        ```py
+        futures = [
+            client.submit(client.verifications.create, merchant_id=..., ...),
+            client.submit(client.fraudcheck.create, merchant_id=..., ...),
+        ]
+        verification, fraud_check = gather(futures)
+        ```
+        """
+        return self._base_client.submit(fn, *args, **kwargs)
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Shuts down the thread pool running calls passed to `submit`."""
+        self._base_client.executor.shutdown(wait=wait)
+
 
 class AsyncClient:
     def __init__(
@@ -92,6 +162,16 @@ class AsyncClient:
         httpx_client: typing.Optional[httpx.AsyncClient] = None,
         environment: Environment = Environment.PROD,
         auth: typing.Optional[OAuth2ClientCredentialsForm] = None,
+        metrics: typing.Optional[MetricsRegistry] = None,
+        tracer: typing.Optional[Tracer] = None,
+        token_url: str = DEFAULT_TOKEN_URL,
+        token_transport: typing.Optional[httpx.BaseTransport] = None,
+        validation_sample_rate: float = 0.0,
+        request_validation: typing_extensions.Literal[
+            "full", "structural", "sampled"
+        ] = "full",
+        journal: typing.Optional[Journal] = None,
+        deduplicator: typing.Optional[RequestDeduplicator] = None,
     ):
         self._base_client = AsyncBaseClient(
             base_url=_get_base_url(base_url=base_url, environment=environment),
@@ -100,6 +180,12 @@ class AsyncClient:
                 if httpx_client is None
                 else httpx_client
             ),
+            metrics=metrics,
+            tracer=tracer,
+            validation_sample_rate=validation_sample_rate,
+            request_validation=request_validation,
+            journal=journal,
+            deduplicator=deduplicator,
         )
 
         self.captures = AsyncCapturesClient(base_client=self._base_client)
@@ -116,7 +202,7 @@ class AsyncClient:
         self._base_client.register_auth(
             "auth",
             OAuth2(
-                token_url="https://id.payments.jpmorgan.com/am/oauth2/alpha/access_token",
+                token_url=token_url,
                 access_token_pointer="/access_token",
                 expires_in_pointer="/expires_in",
                 credentials_location="basic_authorization_header",
@@ -131,9 +217,24 @@ class AsyncClient:
                 client_secret=None if not auth else auth.get("client_secret"),
                 scope=None if not auth else auth.get("scope"),
                 request_mutator=AuthBearer(val=None),
+                token_transport=token_transport,
             ),
         )
 
+    async def recover_journal(
+        self,
+    ) -> typing.List[
+        typing.Tuple[
+            JournalEntry,
+            typing.Union[httpx.Response, httpx.HTTPError, RedactedEntryError],
+        ]
+    ]:
+        """
+        Resends the requests left unfinished in the journal by an earlier run, with
+        their original `request-id`. See `AsyncBaseClient.recover_journal`.
+        """
+        return await self._base_client.recover_journal()
+
 
 def _get_base_url(
     *, base_url: typing.Optional[str] = None, environment: Environment
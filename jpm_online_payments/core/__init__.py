@@ -13,23 +13,78 @@ from .auth import (
 )
 from .base_client import AsyncBaseClient, BaseClient, SyncBaseClient
 from .binary_response import BinaryResponse
+from .raw_response import RawResponse
+from .endpoint import CompiledEndpoint, Endpoint, ResponsePlan, response_plan
+from .deadline import Deadline, DeadlineExceeded
+from .dedup import RequestDeduplicator
+from .executor import DEFAULT_MAX_WORKERS, ClientExecutor, as_completed, gather
+from .journal import Journal, JournalEntry, RedactedEntryError
+from .metrics import (
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    log_linear_buckets,
+    render_prometheus,
+)
+from .tracing import (
+    FinishedSpan,
+    InMemorySpanExporter,
+    InMemoryTracer,
+    OpenTelemetryTracer,
+    Span,
+    Tracer,
+)
 from .request import (
     encode_param,
+    encode_payload,
     filter_not_given,
+    freeze,
+    FrozenFragment,
+    JsonContent,
     to_content,
     to_encodable,
+    AnyRequestOptions,
+    ModelRequestOptions,
+    RawRequestOptions,
     RequestOptions,
+    ViewRequestOptions,
     default_request_options,
     QueryParams,
 )
+from .redaction import REDACTED_FIELDS, redact
 from .response import from_encodable, AsyncStreamResponse, StreamResponse
+from .structural import RequestValidationWarning, structural_encoder
+from .views import ModelView, view_class
 
 __all__ = [
     "ApiError",
     "AsyncBaseClient",
     "BaseClient",
     "BinaryResponse",
+    "RawResponse",
+    "RequestValidationWarning",
+    "structural_encoder",
+    "CompiledEndpoint",
+    "Endpoint",
+    "ResponsePlan",
+    "response_plan",
+    "Deadline",
+    "DeadlineExceeded",
+    "RequestDeduplicator",
+    "DEFAULT_MAX_WORKERS",
+    "ClientExecutor",
+    "as_completed",
+    "gather",
+    "Journal",
+    "JournalEntry",
+    "RedactedEntryError",
+    "REDACTED_FIELDS",
+    "redact",
+    "AnyRequestOptions",
+    "ModelRequestOptions",
+    "RawRequestOptions",
     "RequestOptions",
+    "ViewRequestOptions",
     "default_request_options",
     "SyncBaseClient",
     "AuthKeyQuery",
@@ -44,10 +99,27 @@ __all__ = [
     "OAuth2PasswordForm",
     "to_encodable",
     "filter_not_given",
+    "freeze",
+    "FrozenFragment",
+    "JsonContent",
     "to_content",
     "encode_param",
+    "encode_payload",
     "from_encodable",
     "AsyncStreamResponse",
     "StreamResponse",
     "QueryParams",
+    "Counter",
+    "Histogram",
+    "MetricsRegistry",
+    "log_linear_buckets",
+    "render_prometheus",
+    "FinishedSpan",
+    "InMemorySpanExporter",
+    "InMemoryTracer",
+    "OpenTelemetryTracer",
+    "Span",
+    "Tracer",
+    "ModelView",
+    "view_class",
 ]
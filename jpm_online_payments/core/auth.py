@@ -1,10 +1,11 @@
 import abc
 import datetime
+import threading
 from typing import Any, Dict, TypedDict, Optional, List, Tuple, Literal
 
 import jsonpointer  # type: ignore
 import httpx
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 from .request import RequestConfig
 
 
@@ -243,12 +244,24 @@ class OAuth2(AuthProvider):
     client_secret: Optional[str] = None
     scope: Optional[List[str]] = None
 
+    # transport sending token requests, e.g. a recording or replaying transport;
+    # token requests go through `httpx.post` when not set
+    token_transport: Optional[httpx.BaseTransport] = None
+
     # access_token storage
     access_token: Optional[str] = None
     expires_at: Optional[datetime.datetime] = None
 
-    def _refresh(self) -> Tuple[str, datetime.datetime]:
+    # held while refreshing, so threads sharing a client fetch one token
+    _refresh_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _token_client: Optional[httpx.Client] = PrivateAttr(default=None)
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    def _refresh(self, timeout: Any = None) -> Tuple[str, datetime.datetime]:
         req_cfg: Dict[str, Any] = {"url": self.token_url}
+        if timeout is not None:
+            req_cfg["timeout"] = timeout
         req_data: Dict[str, Any] = {"grant_type": self.grant_type}
 
         # add client credentials
@@ -275,7 +288,12 @@ class OAuth2(AuthProvider):
             req_cfg["headers"] = {"content-type": "application/x-www-form-urlencoded"}
 
         # make access token request
-        token_res = httpx.post(**req_cfg)
+        if self.token_transport is None:
+            token_res = httpx.post(**req_cfg)
+        else:
+            if self._token_client is None:
+                self._token_client = httpx.Client(transport=self.token_transport)
+            token_res = self._token_client.post(**req_cfg)
         token_res.raise_for_status()
 
         # retrieve access token & optional expiry seconds
@@ -297,17 +315,33 @@ class OAuth2(AuthProvider):
 
         return (access_token, expires_at)
 
-    def add_to_request(self, cfg: RequestConfig) -> RequestConfig:
+    def _needs_refresh(self) -> bool:
         token_expired = (
             self.expires_at is not None and self.expires_at <= datetime.datetime.now()
         )
+        return self.access_token is None or token_expired
 
-        if self.access_token is None or token_expired:
-            access_token, expires_at = self._refresh()
-            self.expires_at = expires_at
-            self.access_token = access_token
-
-        self.request_mutator.set_value(self.access_token)
+    def add_to_request(self, cfg: RequestConfig) -> RequestConfig:
+        if self._needs_refresh():
+            # the timeout of the API request also bounds the token request and the
+            # wait for another thread's refresh
+            timeout = cfg.get("timeout")
+            wait = None if timeout is None else httpx.Timeout(timeout).read
+            if not self._refresh_lock.acquire(timeout=-1.0 if wait is None else wait):
+                raise httpx.PoolTimeout(
+                    "timed out waiting for another thread's token refresh"
+                )
+            try:
+                if self._needs_refresh():
+                    access_token, expires_at = self._refresh(timeout)
+                    self.expires_at = expires_at
+                    self.access_token = access_token
+            finally:
+                self._refresh_lock.release()
+
+        # only hand the token to the mutator when it changed, pydantic assignment is slow
+        if getattr(self.request_mutator, "val", None) != self.access_token:
+            self.request_mutator.set_value(self.access_token)
         return self.request_mutator.add_to_request(cfg)
 
     def set_value(self, _val: Optional[str]) -> None:
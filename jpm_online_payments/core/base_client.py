@@ -1,31 +1,53 @@
-from json import JSONDecodeError
+import asyncio
+import concurrent.futures
+import random
+import time
+import warnings
 from typing import (
     Any,
+    Callable,
     List,
     TypeVar,
     Dict,
     Optional,
+    Tuple,
     Type,
     Union,
-    cast,
 )
 
 import httpx
+import pydantic
 from pydantic import BaseModel
+from typing_extensions import Literal
 
-from .api_error import ApiError
 from .auth import AuthProvider
-from .request import RequestConfig, RequestOptions, default_request_options, QueryParams
-from .response import from_encodable, AsyncStreamResponse, StreamResponse
-from .utils import is_binary_content_type, get_content_type
-from .binary_response import BinaryResponse
+from .request import (
+    AnyRequestOptions,
+    RequestConfig,
+    default_request_options,
+    encode_json,
+    encode_payload,
+    to_encodable,
+    QueryParams,
+)
+from .response import AsyncStreamResponse, StreamResponse
+from .structural import RequestValidationWarning
+from .endpoint import CompiledEndpoint, Endpoint, ResponsePlan, response_plan
+from .deadline import Deadline, DeadlineExceeded, as_deadline
+from .dedup import RequestDeduplicator, dedup_key
+from .executor import DEFAULT_MAX_WORKERS, ClientExecutor, P
+from .journal import Journal, JournalEntry, RedactedEntryError
+from .metrics import MetricsRegistry
+from .tracing import Span, Tracer
 
-NoneType = type(None)
 T = TypeVar(
     "T",
     bound=Union[object, None, str, "BaseModel", List[Any], Dict[str, Any], Any],
 )
 
+# outcome of resending a journaled request in `recover_journal`
+RecoveryOutcome = Union[httpx.Response, httpx.HTTPError, RedactedEntryError]
+
 
 class BaseClient:
     """Base client class providing core HTTP client functionality.
@@ -36,20 +58,69 @@ class BaseClient:
     Attributes:
         _base_url: Base URL for the API endpoint
         _auths: Dictionary mapping auth provider IDs to AuthProvider instances
+        _compiled: Compiled endpoint templates keyed by endpoint
+        metrics: Optional registry recording request counts and latencies
+        tracer: Optional tracer creating a span per API call
+        validation_sample_rate: Fraction of request bodies fully validated in
+            `sampled` mode
+        request_validation: `full` validates every request body, `structural` only
+            maps field names to aliases and drops `NOT_GIVEN` values, `sampled`
+            encodes structurally and fully validates a `validation_sample_rate`
+            fraction of request bodies
+        journal: Optional write-ahead journal of requests that change state
+        deduplicator: Optional cache of recent and in-flight requests by
+            `merchant-id` and `request-id`
     """
 
     def __init__(
         self,
         *,
         base_url: str,
+        metrics: Optional[MetricsRegistry] = None,
+        tracer: Optional[Tracer] = None,
+        validation_sample_rate: float = 0.0,
+        request_validation: Literal["full", "structural", "sampled"] = "full",
+        journal: Optional[Journal] = None,
+        deduplicator: Optional[RequestDeduplicator] = None,
     ):
         """Initialize the base client.
 
         Args:
             base_url: Base URL for the API endpoint
+            metrics: Optional registry recording request counts and latencies
+            tracer: Optional tracer creating a span per API call
+            validation_sample_rate: Fraction of request bodies fully validated in
+                `sampled` mode; failures emit a `RequestValidationWarning`
+            request_validation: `full` validates every request body, `structural`
+                encodes request bodies without checking their values, `sampled`
+                encodes structurally and validates a sample
+            journal: Optional write-ahead journal recording requests other than
+                GET before they are sent and their status once answered
+            deduplicator: Optional cache answering requests that repeat the
+                `merchant-id` and `request-id` of a recent or in-flight request
+                with the response of the first one, instead of sending them
+
+        Raises:
+            ValueError: If `request_validation` or `validation_sample_rate` is
+                invalid
         """
+        if request_validation not in ("full", "structural", "sampled"):
+            raise ValueError(
+                f"request_validation must be 'full', 'structural' or 'sampled', "
+                f"got {request_validation!r}"
+            )
+        if not 0.0 <= validation_sample_rate <= 1.0:
+            raise ValueError("validation_sample_rate must be between 0 and 1")
         self._base_url = base_url
         self._auths: Dict[str, AuthProvider] = {}
+        self._compiled: Dict[Endpoint, CompiledEndpoint] = {}
+        self.metrics = metrics
+        self.tracer = tracer
+        self.validation_sample_rate = validation_sample_rate
+        self.request_validation = request_validation
+        self.journal = journal
+        self.deduplicator = deduplicator
+        self._sampler = random.Random()
 
     def register_auth(self, auth_id: str, provider: AuthProvider):
         """Register an authentication provider.
@@ -59,6 +130,7 @@ class BaseClient:
             provider: AuthProvider instance to handle authentication
         """
         self._auths[auth_id] = provider
+        self._compiled.clear()
 
     def default_headers(self) -> Dict[str, str]:
         """Get default headers for requests.
@@ -79,11 +151,12 @@ class BaseClient:
         """
         return self._base_url
 
-    def build_url(self, path: str) -> str:
+    def build_url(self, path: str, path_params: Optional[Dict[str, str]] = None) -> str:
         """Build a complete URL by combining base URL and path.
 
         Args:
-            path: API endpoint path
+            path: API endpoint path, optionally a template such as `/payments/{id}`
+            path_params: Values substituted into the path template
 
         Returns:
             Complete URL string
@@ -91,251 +164,429 @@ class BaseClient:
         base = self._base_url
         if base.endswith("/"):
             base = base[:-1]
+        if path_params:
+            path = path.format(**path_params)
         if path.startswith("/"):
             path = path[1:]
 
         return f"{base}/{path}"
 
-    def _apply_auth(
-        self, *, cfg: RequestConfig, auth_names: List[str]
-    ) -> RequestConfig:
-        """Apply authentication to the request configuration.
+    def compile_endpoint(self, endpoint: Endpoint) -> CompiledEndpoint:
+        """Compile an endpoint against this client, reusing earlier compilations.
+
+        The URL prefix, default headers and auth providers are resolved once per
+        endpoint; registering an auth provider discards compiled endpoints.
 
         Args:
-            cfg: Request configuration to modify
-            auth_names: List of auth provider IDs to apply
+            endpoint: Endpoint to compile
 
         Returns:
-            Modified request configuration
+            Compiled endpoint template
         """
-        for auth_name in auth_names:
-            auth_provider = self._auths.get(auth_name)
-            if auth_provider is not None:
-                cfg = auth_provider.add_to_request(cfg)
+        compiled = self._compiled.get(endpoint)
+        if compiled is None:
+            compiled = CompiledEndpoint(
+                endpoint=endpoint,
+                base_url=self._base_url,
+                default_headers=self.default_headers(),
+                auths=[
+                    self._auths[name]
+                    for name in endpoint.auth_names
+                    if name in self._auths
+                ],
+            )
+            self._compiled[endpoint] = compiled
+        return compiled
+
+    def _resolve_endpoint(
+        self,
+        *,
+        endpoint: Optional[Endpoint],
+        method: Optional[str],
+        path: Optional[str],
+        cast_to: Any,
+        auth_names: Optional[List[str]],
+        content_type: Optional[str],
+    ) -> Endpoint:
+        """Return `endpoint`, or describe one from the individual request arguments.
 
-        return cfg
+        Raises:
+            ValueError: If neither an endpoint nor a method and path are given
+        """
+        if endpoint is not None:
+            return endpoint
+        if method is None or path is None:
+            raise ValueError("either endpoint or both method and path are required")
+        return Endpoint(
+            method=method,
+            path=path,
+            cast_to=cast_to,
+            auth_names=auth_names or (),
+            content_type=content_type,
+        )
 
-    def _apply_headers(
+    def build_request(
         self,
         *,
-        cfg: RequestConfig,
-        opts: RequestOptions,
+        method: Optional[str] = None,
+        path: Optional[str] = None,
+        endpoint: Optional[Endpoint] = None,
+        path_params: Optional[Dict[str, str]] = None,
+        auth_names: Optional[List[str]] = None,
+        query_params: Optional[QueryParams] = None,
+        headers: Optional[Dict[str, str]] = None,
+        data: Optional[httpx._types.RequestData] = None,
+        files: Optional[httpx._types.RequestFiles] = None,
+        json: Optional[Any] = None,
         content_type: Optional[str] = None,
-        explicit_headers: Optional[Dict[str, str]] = None,
+        content: Optional[httpx._types.RequestContent] = None,
+        request_options: Optional[AnyRequestOptions] = None,
     ) -> RequestConfig:
-        """Apply headers to the request configuration.
+        """Build a complete request configuration.
 
         Args:
-            cfg: Request configuration to modify
-            opts: Request options containing additional headers
-            content_type: Optional content type header
-            explicit_headers: Optional explicitly specified headers
+            method: HTTP method, unless `endpoint` is given
+            path: API endpoint path or path template, unless `endpoint` is given
+            endpoint: Precompiled endpoint description
+            path_params: Values substituted into the path template
+            auth_names: List of auth provider IDs
+            query_params: Query parameters
+            headers: Request headers
+            data: Form data
+            files: Files to upload
+            json: JSON data
+            content_type: Content type header
+            content: Raw content
+            request_options: Additional request options
 
         Returns:
-            Modified request configuration
+            Complete request configuration
         """
-        headers = cfg.get("headers", {})
-        headers.update(self.default_headers())
+        endpoint = self._resolve_endpoint(
+            endpoint=endpoint,
+            method=method,
+            path=path,
+            cast_to=None,
+            auth_names=auth_names,
+            content_type=content_type,
+        )
+        return self.compile_endpoint(endpoint).build(
+            opts=request_options or default_request_options(),
+            path_params=path_params,
+            query_params=query_params,
+            headers=headers,
+            data=data,
+            files=files,
+            json=json,
+            content=content,
+        )
 
-        if content_type is not None:
-            headers["content-type"] = content_type
+    def process_response(
+        self,
+        *,
+        response=httpx.Response,
+        cast_to: Union[Type[T], Any],
+    ) -> T:
+        """Process an HTTP response and convert it to the desired type.
 
-        if explicit_headers is not None:
-            headers.update(explicit_headers)
+        Args:
+            response: HTTP response to process
+            cast_to: Type to cast the response data to
 
-        additional_headers = opts.get("additional_headers", None)
-        if additional_headers is not None:
-            headers.update(additional_headers)
+        Returns:
+            Processed response data of the specified type
 
-        if len(headers) > 0:
-            cfg["headers"] = headers
+        Raises:
+            ApiError: If the response indicates an error
+        """
+        return response_plan(cast_to).decode(response)
 
-        return cfg
+    def to_encodable(self, *, item: Any, dump_with: Any) -> Any:
+        """Encode a request body according to the client's request validation mode.
 
-    def _apply_query_params(
-        self,
-        *,
-        cfg: RequestConfig,
-        opts: RequestOptions,
-        query_params: Optional[QueryParams] = None,
-    ) -> RequestConfig:
-        """Apply query parameters to the request configuration.
+        In `sampled` mode a `validation_sample_rate` fraction of request bodies is
+        fully validated. When a sampled body fails validation, the failure is
+        reported and the body is sent as encoded structurally.
 
         Args:
-            cfg: Request configuration to modify
-            opts: Request options containing additional parameters
-            query_params: Optional query parameters to add
+            item: Request body built from the method's keyword arguments
+            dump_with: Serializer type of the request body
 
         Returns:
-            Modified request configuration
+            Encodable request body
         """
-        params = cfg.get("params", {})
+        if self.request_validation == "full":
+            return to_encodable(item=item, dump_with=dump_with)
+        if self._sample_request():
+            try:
+                return to_encodable(item=item, dump_with=dump_with)
+            except pydantic.ValidationError as exc:
+                self._report_request_validation_failure(dump_with, exc)
+        return to_encodable(item=item, dump_with=dump_with, validate=False)
+
+    def encode_payload(self, *, payload: Any, dump_with: Any) -> Any:
+        """Encode a prebuilt request body according to the request validation mode.
 
-        if query_params is not None:
-            params.update(query_params)
+        Args:
+            payload: Complete request body, or the body already encoded as JSON
+            dump_with: Serializer type of the request body
 
-        additional_params = opts.get("additional_params", None)
-        if additional_params is not None:
-            params.update(additional_params)
+        Returns:
+            Encodable request body
+        """
+        if self.request_validation == "full":
+            return encode_payload(payload=payload, dump_with=dump_with)
+        if self._sample_request():
+            try:
+                return encode_payload(payload=payload, dump_with=dump_with)
+            except pydantic.ValidationError as exc:
+                self._report_request_validation_failure(dump_with, exc)
+        return encode_payload(payload=payload, dump_with=dump_with, validate=False)
+
+    def _sample_request(self) -> bool:
+        return (
+            self.request_validation == "sampled"
+            and self.validation_sample_rate > 0.0
+            and self._sampler.random() < self.validation_sample_rate
+        )
 
-        if len(params) > 0:
-            cfg["params"] = params
+    def _report_request_validation_failure(
+        self, dump_with: Any, error: pydantic.ValidationError
+    ) -> None:
+        """Report a sampled request body that failed full validation.
 
-        return cfg
+        Args:
+            dump_with: Serializer type of the request body
+            error: Validation error raised by the sampled body
+        """
+        model = getattr(dump_with, "__name__", repr(dump_with))
+        if self.metrics is not None:
+            self.metrics.observe_request_validation_failure(model=model)
+        warnings.warn(
+            f"request body failed validation as {model}: {error}",
+            RequestValidationWarning,
+            stacklevel=4,
+        )
 
-    def _apply_timeout(
-        self,
-        *,
-        cfg: RequestConfig,
-        opts: RequestOptions,
-    ) -> RequestConfig:
-        """Apply timeout settings to the request configuration.
+    def _decode_response(
+        self, plan: ResponsePlan, response: httpx.Response, opts: AnyRequestOptions
+    ) -> Any:
+        """Decode a response with the requested decode mode.
 
         Args:
-            cfg: Request configuration to modify
-            opts: Request options containing timeout settings
+            plan: Response plan of the endpoint
+            response: HTTP response to decode
+            opts: Request options of the call
 
         Returns:
-            Modified request configuration
+            Decoded response
         """
-        timeout = opts.get("timeout", None)
-
-        if timeout is not None:
-            cfg["timeout"] = timeout
-
-        return cfg
+        fields = opts["fields"] if "fields" in opts else None
+        return plan.decode(response, opts.get("decode", "model"), fields)
 
-    def _apply_body(
+    def _journal_args(
         self,
-        *,
-        cfg: RequestConfig,
-        data: Optional[httpx._types.RequestData] = None,
-        files: Optional[httpx._types.RequestFiles] = None,
-        json: Optional[Any] = None,
-        content: Optional[httpx._types.RequestContent] = None,
-    ) -> RequestConfig:
-        """Apply request body content to the request configuration.
+        endpoint: Endpoint,
+        path_params: Optional[Dict[str, str]],
+        headers: Optional[Dict[str, str]],
+        req_cfg: RequestConfig,
+    ) -> Optional[Dict[str, Any]]:
+        """Prepare journaling a request other than GET, if journaling.
+
+        JSON, form and multipart bodies are encoded once, for both the journal and
+        the request. The content type of form and multipart bodies, which carries
+        the multipart boundary, is journaled with the headers.
 
         Args:
-            cfg: Request configuration to modify
-            data: Optional form data
-            files: Optional files to upload
-            json: Optional JSON data
-            content: Optional raw content
+            endpoint: Endpoint of the request
+            path_params: Values substituted into the path template
+            headers: Explicit request headers
+            req_cfg: Request configuration, updated to send the encoded body
 
         Returns:
-            Modified request configuration
+            Arguments of `Journal.begin`, or None if the request is not journaled
+
+        Raises:
+            ValueError: If the request streams its body, which cannot be journaled
         """
-        if data is not None:
-            cfg["data"] = data
+        if self.journal is None or endpoint.method == "GET":
+            return None
+        body = req_cfg.get("content")
+        if "json" in req_cfg:
+            body = encode_json(req_cfg.pop("json"))
+            req_cfg["content"] = body
+            req_cfg.setdefault("headers", {})["content-type"] = "application/json"
+        elif "data" in req_cfg or "files" in req_cfg:
+            encoded = httpx.Request(
+                endpoint.method,
+                "http://journal",
+                data=req_cfg.pop("data", None),
+                files=req_cfg.pop("files", None),
+            )
+            body = encoded.read()
+            content_type = encoded.headers["content-type"]
+            req_cfg["content"] = body
+            req_cfg.setdefault("headers", {})["content-type"] = content_type
+            headers = {**(headers or {}), "content-type": content_type}
+        elif isinstance(body, str):
+            body = body.encode("utf-8")
+        elif body is not None and not isinstance(body, bytes):
+            raise ValueError(
+                f"{endpoint.method} {endpoint.path} streams its body, which cannot "
+                "be journaled"
+            )
+        return {
+            "method": endpoint.method,
+            "path": endpoint.path,
+            "path_params": path_params,
+            "auth_names": list(endpoint.auth_names),
+            "headers": headers,
+            "body": body,
+        }
 
-        if files is not None:
-            cfg["files"] = files
+    def _record_deduplicated(
+        self,
+        endpoint: Endpoint,
+        headers: Optional[Dict[str, str]],
+        span: Optional[Span],
+    ) -> None:
+        """Record a request answered with the response of a duplicate.
 
-        if json is not None:
-            cfg["json"] = json
+        Args:
+            endpoint: Endpoint of the request
+            headers: Explicit request headers, used to label by merchant-id
+            span: Span of the API call, if tracing is enabled
+        """
+        if span is not None:
+            span.set_attribute("jpm.deduplicated", True)
+        if self.metrics is not None:
+            self.metrics.observe_deduplicated_request(
+                method=endpoint.method,
+                path=endpoint.path,
+                merchant_id=headers.get("merchant-id") if headers else None,
+            )
+
+    def _journal_response(self, entry_id: int, response: httpx.Response) -> None:
+        """Record the status of a journaled request once it is answered."""
+        assert self.journal is not None
+        self.journal.end(entry_id, status=response.status_code)
+
+    def _replay_config(self, entry: JournalEntry) -> RequestConfig:
+        """Build the request configuration replaying a journal entry.
 
-        if content is not None:
-            cfg["content"] = content
+        Args:
+            entry: Journaled request
 
-        return cfg
+        Returns:
+            Request configuration with the journaled headers and body
+        """
+        compiled = self.compile_endpoint(
+            Endpoint(
+                method=entry.method,
+                path=entry.path,
+                cast_to=Any,
+                auth_names=entry.auth_names,
+                content_type="application/json" if entry.body is not None else None,
+            )
+        )
+        return compiled.build(
+            opts=default_request_options(),
+            path_params=entry.path_params,
+            headers=entry.headers,
+            content=entry.body,
+        )
 
-    def build_request(
+    def _record_request(
         self,
         *,
         method: str,
         path: str,
-        auth_names: Optional[List[str]] = None,
-        query_params: Optional[QueryParams] = None,
-        headers: Optional[Dict[str, str]] = None,
-        data: Optional[httpx._types.RequestData] = None,
-        files: Optional[httpx._types.RequestFiles] = None,
-        json: Optional[Any] = None,
-        content_type: Optional[str] = None,
-        content: Optional[httpx._types.RequestContent] = None,
-        request_options: Optional[RequestOptions] = None,
-    ) -> RequestConfig:
-        """Build a complete request configuration.
+        headers: Optional[Dict[str, str]],
+        status: str,
+        started: float,
+        span: Optional[Span] = None,
+    ) -> None:
+        """Record a completed request in the metrics registry and span, if configured.
 
         Args:
             method: HTTP method
-            path: API endpoint path
-            auth_names: List of auth provider IDs
-            query_params: Query parameters
-            headers: Request headers
-            data: Form data
-            files: Files to upload
-            json: JSON data
-            content_type: Content type header
-            content: Raw content
-            request_options: Additional request options
-
-        Returns:
-            Complete request configuration
+            path: API endpoint path template
+            headers: Explicit request headers, used to label by merchant-id
+            status: Response status code, or `error` if no response was received
+            started: `time.perf_counter()` value taken before the request was sent
+            span: Span of the API call, if tracing is enabled
         """
-        opts = request_options or default_request_options()
-        req_cfg: RequestConfig = {"method": method, "url": self.build_url(path)}
-        req_cfg = self._apply_auth(cfg=req_cfg, auth_names=auth_names or [])
-        req_cfg = self._apply_headers(
-            cfg=req_cfg, opts=opts, content_type=content_type, explicit_headers=headers
-        )
-        req_cfg = self._apply_query_params(
-            cfg=req_cfg, opts=opts, query_params=query_params
-        )
-        req_cfg = self._apply_body(
-            cfg=req_cfg, data=data, files=files, json=json, content=content
+        if span is not None and status != "error":
+            span.set_attribute("http.response.status_code", int(status))
+        if self.metrics is None:
+            return
+        self.metrics.observe_request(
+            method=method,
+            path=path,
+            status=status,
+            merchant_id=headers.get("merchant-id") if headers else None,
+            duration=time.perf_counter() - started,
         )
-        req_cfg = self._apply_timeout(cfg=req_cfg, opts=opts)
 
-        return req_cfg
+    def _with_deadline(
+        self, opts: AnyRequestOptions
+    ) -> Tuple[AnyRequestOptions, Optional[Deadline]]:
+        """Start the deadline of a call given as a number of seconds.
 
-    def process_response(
+        Args:
+            opts: Request options of the call
+
+        Returns:
+            The options holding a `Deadline`, and the deadline if there is one
+        """
+        value = opts.get("deadline")
+        deadline = as_deadline(value)
+        if deadline is not None and deadline is not value:
+            opts = opts.copy()
+            opts["deadline"] = deadline
+        return opts, deadline
+
+    def _start_span(
         self,
         *,
-        response=httpx.Response,
-        cast_to: Union[Type[T], Any],
-    ) -> T:
-        """Process an HTTP response and convert it to the desired type.
+        method: str,
+        path: str,
+        headers: Optional[Dict[str, str]],
+    ) -> Optional[Span]:
+        """Start a span for an API call if a tracer is configured.
 
         Args:
-            response: HTTP response to process
-            cast_to: Type to cast the response data to
+            method: HTTP method
+            path: API endpoint path template
+            headers: Explicit request headers carrying merchant-id and request-id
 
         Returns:
-            Processed response data of the specified type
+            The started span, or None when tracing is disabled
+        """
+        if self.tracer is None:
+            return None
+        attributes: Dict[str, Any] = {
+            "http.request.method": method,
+            "url.template": path,
+        }
+        if headers:
+            if "merchant-id" in headers:
+                attributes["jpm.merchant_id"] = headers["merchant-id"]
+            if "request-id" in headers:
+                attributes["jpm.request_id"] = headers["request-id"]
+        return self.tracer.start_span(f"{method} {path}", attributes)
+
+    def _end_span(
+        self, span: Optional[Span], error: Optional[BaseException] = None
+    ) -> None:
+        """End the span of an API call, if tracing is enabled.
 
-        Raises:
-            ApiError: If the response indicates an error
+        Args:
+            span: Span returned by `_start_span`
+            error: Exception raised by the call, if it failed
         """
-        if 200 <= response.status_code < 300:
-            content_type = get_content_type(response.headers)
-            if response.status_code == 204 or cast_to == NoneType:
-                return cast(T, None)
-            elif cast_to == BinaryResponse:
-                return cast(
-                    T,
-                    BinaryResponse(content=response.content, headers=response.headers),
-                )
-            else:
-                if "json" in content_type or "form" in content_type:
-                    if cast_to is type(Any):
-                        return response.json()
-                    return from_encodable(data=response.json(), load_with=cast_to)
-                elif is_binary_content_type(content_type):
-                    return cast(
-                        T,
-                        BinaryResponse(
-                            content=response.content, headers=response.headers
-                        ),
-                    )
-                else:
-                    return from_encodable(data=response.content, load_with=cast_to)
-        else:
-            try:
-                response_json = response.json()
-            except JSONDecodeError:
-                raise ApiError(status_code=response.status_code, body=response.text)
-            raise ApiError(status_code=response.status_code, body=response_json)
+        if span is not None:
+            span.end(error=error)
 
 
 class SyncBaseClient(BaseClient):
@@ -349,22 +600,71 @@ class SyncBaseClient(BaseClient):
         *,
         base_url: str,
         httpx_client: httpx.Client,
+        metrics: Optional[MetricsRegistry] = None,
+        tracer: Optional[Tracer] = None,
+        validation_sample_rate: float = 0.0,
+        request_validation: Literal["full", "structural", "sampled"] = "full",
+        journal: Optional[Journal] = None,
+        deduplicator: Optional[RequestDeduplicator] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ):
         """Initialize the synchronous client.
 
         Args:
             base_url: Base URL for the API endpoint
             httpx_client: Synchronous HTTPX client instance
+            metrics: Optional registry recording request counts and latencies
+            tracer: Optional tracer creating a span per API call
+            validation_sample_rate: Fraction of request bodies fully validated in
+                `sampled` mode
+            request_validation: `full` validates every request body, `structural`
+                encodes request bodies without checking their values, `sampled`
+                encodes structurally and validates a sample
+            journal: Optional write-ahead journal of requests that change state
+            deduplicator: Optional cache answering requests that repeat the
+                `merchant-id` and `request-id` of a recent or in-flight request
+            max_workers: Maximum number of threads running calls passed to
+                `submit`
         """
-        super().__init__(base_url=base_url)
+        super().__init__(
+            base_url=base_url,
+            metrics=metrics,
+            tracer=tracer,
+            validation_sample_rate=validation_sample_rate,
+            request_validation=request_validation,
+            journal=journal,
+            deduplicator=deduplicator,
+        )
         self.httpx_client = httpx_client
+        self.executor = ClientExecutor(max_workers=max_workers)
+
+    def submit(
+        self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs
+    ) -> "concurrent.futures.Future[T]":
+        """Run a call on the client's thread pool.
+
+        Args:
+            fn: Callable to run, typically a resource method such as
+                `client.verifications.create`
+            *args: Positional arguments for `fn`
+            **kwargs: Keyword arguments for `fn`
+
+        Returns:
+            Future of the call's result
+
+        Raises:
+            RuntimeError: If the thread pool was shut down
+        """
+        return self.executor.submit(fn, *args, **kwargs)
 
     def request(
         self,
         *,
-        method: str,
-        path: str,
-        cast_to: Union[Type[T], Any],
+        method: Optional[str] = None,
+        path: Optional[str] = None,
+        cast_to: Union[Type[T], Any] = None,
+        endpoint: Optional[Endpoint] = None,
+        path_params: Optional[Dict[str, str]] = None,
         auth_names: Optional[List[str]] = None,
         query_params: Optional[QueryParams] = None,
         headers: Optional[Dict[str, str]] = None,
@@ -373,14 +673,16 @@ class SyncBaseClient(BaseClient):
         json: Optional[Any] = None,
         content_type: Optional[str] = None,
         content: Optional[httpx._types.RequestContent] = None,
-        request_options: Optional[RequestOptions] = None,
+        request_options: Optional[AnyRequestOptions] = None,
     ) -> T:
         """Make a synchronous HTTP request.
 
         Args:
-            method: HTTP method
-            path: API endpoint path
-            cast_to: Type to cast the response to
+            method: HTTP method, unless `endpoint` is given
+            path: API endpoint path or path template, unless `endpoint` is given
+            cast_to: Type to cast the response to, unless `endpoint` is given
+            endpoint: Precompiled endpoint description
+            path_params: Values substituted into the path template
             auth_names: List of auth provider IDs
             query_params: Query parameters
             headers: Request headers
@@ -397,28 +699,273 @@ class SyncBaseClient(BaseClient):
         Raises:
             ApiError: If the request fails
         """
-        req_cfg = self.build_request(
+        endpoint = self._resolve_endpoint(
+            endpoint=endpoint,
             method=method,
             path=path,
+            cast_to=cast_to,
             auth_names=auth_names,
-            query_params=query_params,
-            headers=headers,
-            data=data,
-            files=files,
-            json=json,
             content_type=content_type,
-            content=content,
-            request_options=request_options,
         )
-        response = self.httpx_client.request(**req_cfg)
-        return self.process_response(response=response, cast_to=cast_to)
+        span = self._start_span(
+            method=endpoint.method, path=endpoint.path, headers=headers
+        )
+        deadline: Optional[Deadline] = None
+        try:
+            compiled = self.compile_endpoint(endpoint)
+            opts, deadline = self._with_deadline(
+                request_options or default_request_options()
+            )
+            req_cfg = compiled.build(
+                opts=opts,
+                path_params=path_params,
+                query_params=query_params,
+                headers=headers,
+                data=data,
+                files=files,
+                json=json,
+                content=content,
+            )
+            if span is not None:
+                span.inject(req_cfg.setdefault("headers", {}))
+            response = self._send(
+                endpoint=endpoint,
+                path_params=path_params,
+                headers=headers,
+                req_cfg=req_cfg,
+                span=span,
+                deadline=deadline,
+            )
+            result = self._decode_response(compiled.response_plan, response, opts)
+            if deadline is not None:
+                deadline.check(phase="decode")
+        except httpx.TimeoutException as exc:
+            error = deadline.exceeded(exc) if deadline is not None else None
+            self._end_span(span, error=error or exc)
+            if error is None:
+                raise
+            raise error from exc
+        except BaseException as exc:
+            self._end_span(span, error=exc)
+            raise
+        self._end_span(span)
+        return result
+
+    def _send(
+        self,
+        *,
+        endpoint: Endpoint,
+        path_params: Optional[Dict[str, str]],
+        headers: Optional[Dict[str, str]],
+        req_cfg: RequestConfig,
+        span: Optional[Span],
+        deadline: Optional[Deadline] = None,
+    ) -> httpx.Response:
+        """Send a built request, unless a duplicate of it was already sent.
+
+        Journals the request and records it in metrics and the span when it is
+        sent. A duplicate waits for the request in flight at most until the
+        deadline.
+        """
+        deduplicator = self.deduplicator
+        key = None
+        if deduplicator is not None:
+            key = dedup_key(
+                method=endpoint.method, url=str(req_cfg["url"]), headers=headers
+            )
+        if deduplicator is None or key is None:
+            return self._send_once(
+                endpoint=endpoint,
+                path_params=path_params,
+                headers=headers,
+                req_cfg=req_cfg,
+                span=span,
+                deadline=deadline,
+            )
+        while True:
+            role, future = deduplicator.claim(key, concurrent.futures.Future)
+            if role == "cached":
+                self._record_deduplicated(endpoint, headers, span)
+                return future
+            if role == "wait":
+                try:
+                    response = future.result(
+                        timeout=_wait_timeout(
+                            req_cfg.get("timeout", self.httpx_client.timeout),
+                            deadline,
+                        )
+                    )
+                except concurrent.futures.TimeoutError:
+                    raise _duplicate_timeout(req_cfg) from None
+                except concurrent.futures.CancelledError:
+                    if not future.cancelled():
+                        raise
+                    # the sender was interrupted; send the request instead
+                    continue
+                self._record_deduplicated(endpoint, headers, span)
+                return response
+            try:
+                response = self._send_once(
+                    endpoint=endpoint,
+                    path_params=path_params,
+                    headers=headers,
+                    req_cfg=req_cfg,
+                    span=span,
+                    deadline=deadline,
+                )
+            except BaseException as exc:
+                deduplicator.fail(key, future, exc)
+                raise
+            deduplicator.complete(key, future, response)
+            return response
+
+    def _send_once(
+        self,
+        *,
+        endpoint: Endpoint,
+        path_params: Optional[Dict[str, str]],
+        headers: Optional[Dict[str, str]],
+        req_cfg: RequestConfig,
+        span: Optional[Span],
+        deadline: Optional[Deadline] = None,
+    ) -> httpx.Response:
+        """Journal, send and record a built request, read within the deadline."""
+        journal_args = self._journal_args(endpoint, path_params, headers, req_cfg)
+        entry_id = None
+        if journal_args is not None:
+            assert self.journal is not None
+            entry_id = self.journal.begin(**journal_args)
+        started = time.perf_counter()
+        try:
+            response = self._request_within(req_cfg, deadline)
+        except (httpx.HTTPError, DeadlineExceeded):
+            self._record_request(
+                method=endpoint.method,
+                path=endpoint.path,
+                headers=headers,
+                status="error",
+                started=started,
+                span=span,
+            )
+            raise
+        self._record_request(
+            method=endpoint.method,
+            path=endpoint.path,
+            headers=headers,
+            status=str(response.status_code),
+            started=started,
+            span=span,
+        )
+        if entry_id is not None:
+            self._journal_response(entry_id, response)
+        return response
+
+    def _request_within(
+        self, req_cfg: RequestConfig, deadline: Optional[Deadline]
+    ) -> httpx.Response:
+        """Send a request, reading its body in chunks checked against the deadline.
+
+        httpx timeouts only bound each socket operation, so a body trickling in
+        could otherwise be read long after the deadline.
+
+        Raises:
+            DeadlineExceeded: If the deadline passes while the body is read
+        """
+        if deadline is None:
+            return self.httpx_client.request(**req_cfg)
+        cfg: Dict[str, Any] = dict(req_cfg)
+        auth = cfg.pop("auth", httpx.USE_CLIENT_DEFAULT)
+        follow_redirects = cfg.pop("follow_redirects", httpx.USE_CLIENT_DEFAULT)
+        response = self.httpx_client.send(
+            self.httpx_client.build_request(**cfg),
+            auth=auth,
+            follow_redirects=follow_redirects,
+            stream=True,
+        )
+        if response.is_stream_consumed:
+            # the transport handed over a body it already read, e.g. a mock
+            response.close()
+            return response
+        chunks = []
+        try:
+            for chunk in response.iter_raw():
+                chunks.append(chunk)
+                deadline.check(phase="read")
+        finally:
+            response.close()
+        # the consumed stream cannot be read again, so the body is handed over in a
+        # loaded copy of the response, which decodes any content-encoding itself
+        loaded = httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            content=b"".join(chunks),
+            request=response.request,
+            extensions=response.extensions,
+            history=response.history,
+            default_encoding=response.default_encoding,
+        )
+        loaded.next_request = response.next_request
+        loaded.elapsed = response.elapsed
+        return loaded
+
+    def recover_journal(
+        self,
+    ) -> List[Tuple[JournalEntry, RecoveryOutcome]]:
+        """Resend the journaled requests left unfinished by an earlier run.
+
+        Each request is sent again with its original headers, including its
+        `request-id`, and body, so the gateway can recognize a request it already
+        processed. Entries answered with any status are closed in the journal;
+        entries whose request fails again stay open for the next recovery, as do
+        entries with a redacted body, which are not sent.
+
+        Returns:
+            Each recovered entry with its response, the error raised sending it or
+            a `RedactedEntryError`
+
+        Raises:
+            RuntimeError: If the client has no journal
+        """
+        if self.journal is None:
+            raise RuntimeError("recover_journal requires a client with a journal")
+        outcomes: List[Tuple[JournalEntry, RecoveryOutcome]] = []
+        for entry in self.journal.recovered():
+            if entry.redacted:
+                outcomes.append((entry, RedactedEntryError(entry)))
+                continue
+            req_cfg = self._replay_config(entry)
+            started = time.perf_counter()
+            try:
+                response = self.httpx_client.request(**req_cfg)
+            except httpx.HTTPError as exc:
+                self._record_request(
+                    method=entry.method,
+                    path=entry.path,
+                    headers=entry.headers,
+                    status="error",
+                    started=started,
+                )
+                outcomes.append((entry, exc))
+                continue
+            self._record_request(
+                method=entry.method,
+                path=entry.path,
+                headers=entry.headers,
+                status=str(response.status_code),
+                started=started,
+            )
+            self._journal_response(entry.id, response)
+            outcomes.append((entry, response))
+        return outcomes
 
     def stream_request(
         self,
         *,
-        method: str,
-        path: str,
-        cast_to: Union[Type[T], Any],
+        method: Optional[str] = None,
+        path: Optional[str] = None,
+        cast_to: Union[Type[T], Any] = None,
+        endpoint: Optional[Endpoint] = None,
+        path_params: Optional[Dict[str, str]] = None,
         auth_names: Optional[List[str]] = None,
         query_params: Optional[QueryParams] = None,
         headers: Optional[Dict[str, str]] = None,
@@ -427,14 +974,16 @@ class SyncBaseClient(BaseClient):
         json: Optional[Any] = None,
         content_type: Optional[str] = None,
         content: Optional[httpx._types.RequestContent] = None,
-        request_options: Optional[RequestOptions] = None,
+        request_options: Optional[AnyRequestOptions] = None,
     ) -> StreamResponse[T]:
         """Make a streaming synchronous HTTP request.
 
         Args:
-            method: HTTP method
-            path: API endpoint path
-            cast_to: Type to cast the response to
+            method: HTTP method, unless `endpoint` is given
+            path: API endpoint path or path template, unless `endpoint` is given
+            cast_to: Type to cast the response to, unless `endpoint` is given
+            endpoint: Precompiled endpoint description
+            path_params: Values substituted into the path template
             auth_names: List of auth provider IDs
             query_params: Query parameters
             headers: Request headers
@@ -446,27 +995,75 @@ class SyncBaseClient(BaseClient):
             request_options: Additional request options
 
         Returns:
-            StreamResponse containing the streaming response
+            StreamResponse containing the streaming response, holding a pooled
+            connection until it is read to the end or closed
 
         Raises:
             ApiError: If the request fails
         """
-        req_cfg = self.build_request(
+        endpoint = self._resolve_endpoint(
+            endpoint=endpoint,
             method=method,
             path=path,
+            cast_to=cast_to,
             auth_names=auth_names,
-            query_params=query_params,
-            headers=headers,
-            data=data,
-            files=files,
-            json=json,
             content_type=content_type,
-            content=content,
-            request_options=request_options,
         )
-        context = self.httpx_client.stream(**req_cfg)
-        response = context.__enter__()
-        return StreamResponse(response, context, cast_to)
+        span = self._start_span(
+            method=endpoint.method, path=endpoint.path, headers=headers
+        )
+        deadline: Optional[Deadline] = None
+        try:
+            compiled = self.compile_endpoint(endpoint)
+            opts, deadline = self._with_deadline(
+                request_options or default_request_options()
+            )
+            req_cfg = compiled.build(
+                opts=opts,
+                path_params=path_params,
+                query_params=query_params,
+                headers=headers,
+                data=data,
+                files=files,
+                json=json,
+                content=content,
+            )
+            if span is not None:
+                span.inject(req_cfg.setdefault("headers", {}))
+            started = time.perf_counter()
+            try:
+                context = self.httpx_client.stream(**req_cfg)
+                # owned by the stream from here on, closed by its finalizer at worst
+                result = StreamResponse(context.__enter__(), context, endpoint.cast_to)
+            except httpx.HTTPError:
+                self._record_request(
+                    method=endpoint.method,
+                    path=endpoint.path,
+                    headers=headers,
+                    status="error",
+                    started=started,
+                    span=span,
+                )
+                raise
+            self._record_request(
+                method=endpoint.method,
+                path=endpoint.path,
+                headers=headers,
+                status=str(result.response.status_code),
+                started=started,
+                span=span,
+            )
+        except httpx.TimeoutException as exc:
+            error = deadline.exceeded(exc) if deadline is not None else None
+            self._end_span(span, error=error or exc)
+            if error is None:
+                raise
+            raise error from exc
+        except BaseException as exc:
+            self._end_span(span, error=exc)
+            raise
+        self._end_span(span)
+        return result
 
 
 class AsyncBaseClient(BaseClient):
@@ -480,22 +1077,48 @@ class AsyncBaseClient(BaseClient):
         *,
         base_url: str,
         httpx_client: httpx.AsyncClient,
+        metrics: Optional[MetricsRegistry] = None,
+        tracer: Optional[Tracer] = None,
+        validation_sample_rate: float = 0.0,
+        request_validation: Literal["full", "structural", "sampled"] = "full",
+        journal: Optional[Journal] = None,
+        deduplicator: Optional[RequestDeduplicator] = None,
     ):
         """Initialize the asynchronous client.
 
         Args:
             base_url: Base URL for the API endpoint
             httpx_client: Asynchronous HTTPX client instance
+            metrics: Optional registry recording request counts and latencies
+            tracer: Optional tracer creating a span per API call
+            validation_sample_rate: Fraction of request bodies fully validated in
+                `sampled` mode
+            request_validation: `full` validates every request body, `structural`
+                encodes request bodies without checking their values, `sampled`
+                encodes structurally and validates a sample
+            journal: Optional write-ahead journal of requests that change state
+            deduplicator: Optional cache answering requests that repeat the
+                `merchant-id` and `request-id` of a recent or in-flight request
         """
-        super().__init__(base_url=base_url)
+        super().__init__(
+            base_url=base_url,
+            metrics=metrics,
+            tracer=tracer,
+            validation_sample_rate=validation_sample_rate,
+            request_validation=request_validation,
+            journal=journal,
+            deduplicator=deduplicator,
+        )
         self.httpx_client = httpx_client
 
     async def request(
         self,
         *,
-        method: str,
-        path: str,
-        cast_to: Union[Type[T], Any],
+        method: Optional[str] = None,
+        path: Optional[str] = None,
+        cast_to: Union[Type[T], Any] = None,
+        endpoint: Optional[Endpoint] = None,
+        path_params: Optional[Dict[str, str]] = None,
         auth_names: Optional[List[str]] = None,
         query_params: Optional[QueryParams] = None,
         headers: Optional[Dict[str, str]] = None,
@@ -504,14 +1127,16 @@ class AsyncBaseClient(BaseClient):
         json: Optional[Any] = None,
         content_type: Optional[str] = None,
         content: Optional[httpx._types.RequestContent] = None,
-        request_options: Optional[RequestOptions] = None,
+        request_options: Optional[AnyRequestOptions] = None,
     ) -> T:
         """Make an asynchronous HTTP request.
 
         Args:
-            method: HTTP method
-            path: API endpoint path
-            cast_to: Type to cast the response to
+            method: HTTP method, unless `endpoint` is given
+            path: API endpoint path or path template, unless `endpoint` is given
+            cast_to: Type to cast the response to, unless `endpoint` is given
+            endpoint: Precompiled endpoint description
+            path_params: Values substituted into the path template
             auth_names: List of auth provider IDs
             query_params: Query parameters
             headers: Request headers
@@ -528,28 +1153,248 @@ class AsyncBaseClient(BaseClient):
         Raises:
             ApiError: If the request fails
         """
-        req_cfg = self.build_request(
+        endpoint = self._resolve_endpoint(
+            endpoint=endpoint,
             method=method,
             path=path,
+            cast_to=cast_to,
             auth_names=auth_names,
-            query_params=query_params,
-            headers=headers,
-            data=data,
-            files=files,
-            json=json,
             content_type=content_type,
-            content=content,
-            request_options=request_options,
         )
-        response = await self.httpx_client.request(**req_cfg)
-        return self.process_response(response=response, cast_to=cast_to)
+        span = self._start_span(
+            method=endpoint.method, path=endpoint.path, headers=headers
+        )
+        deadline: Optional[Deadline] = None
+        try:
+            compiled = self.compile_endpoint(endpoint)
+            opts, deadline = self._with_deadline(
+                request_options or default_request_options()
+            )
+            req_cfg = compiled.build(
+                opts=opts,
+                path_params=path_params,
+                query_params=query_params,
+                headers=headers,
+                data=data,
+                files=files,
+                json=json,
+                content=content,
+            )
+            if span is not None:
+                span.inject(req_cfg.setdefault("headers", {}))
+            response = await self._send(
+                endpoint=endpoint,
+                path_params=path_params,
+                headers=headers,
+                req_cfg=req_cfg,
+                span=span,
+                deadline=deadline,
+            )
+            result = self._decode_response(compiled.response_plan, response, opts)
+            if deadline is not None:
+                deadline.check(phase="decode")
+        except httpx.TimeoutException as exc:
+            error = deadline.exceeded(exc) if deadline is not None else None
+            self._end_span(span, error=error or exc)
+            if error is None:
+                raise
+            raise error from exc
+        except BaseException as exc:
+            self._end_span(span, error=exc)
+            raise
+        self._end_span(span)
+        return result
+
+    async def _send(
+        self,
+        *,
+        endpoint: Endpoint,
+        path_params: Optional[Dict[str, str]],
+        headers: Optional[Dict[str, str]],
+        req_cfg: RequestConfig,
+        span: Optional[Span],
+        deadline: Optional[Deadline] = None,
+    ) -> httpx.Response:
+        """Send a built request, unless a duplicate of it was already sent.
+
+        Journals the request and records it in metrics and the span when it is
+        sent. A duplicate waits for the request in flight at most until the
+        deadline.
+        """
+        deduplicator = self.deduplicator
+        key = None
+        if deduplicator is not None:
+            key = dedup_key(
+                method=endpoint.method, url=str(req_cfg["url"]), headers=headers
+            )
+        if deduplicator is None or key is None:
+            return await self._send_once(
+                endpoint=endpoint,
+                path_params=path_params,
+                headers=headers,
+                req_cfg=req_cfg,
+                span=span,
+                deadline=deadline,
+            )
+        while True:
+            role, future = deduplicator.claim(
+                key, asyncio.get_running_loop().create_future
+            )
+            if role == "cached":
+                self._record_deduplicated(endpoint, headers, span)
+                return future
+            if role == "wait":
+                try:
+                    response = await asyncio.wait_for(
+                        asyncio.shield(future),
+                        _wait_timeout(
+                            req_cfg.get("timeout", self.httpx_client.timeout),
+                            deadline,
+                        ),
+                    )
+                except asyncio.TimeoutError:
+                    raise _duplicate_timeout(req_cfg) from None
+                except asyncio.CancelledError:
+                    if not future.cancelled():
+                        raise
+                    # the sender was interrupted; send the request instead
+                    continue
+                self._record_deduplicated(endpoint, headers, span)
+                return response
+            try:
+                response = await self._send_once(
+                    endpoint=endpoint,
+                    path_params=path_params,
+                    headers=headers,
+                    req_cfg=req_cfg,
+                    span=span,
+                    deadline=deadline,
+                )
+            except BaseException as exc:
+                deduplicator.fail(key, future, exc)
+                raise
+            deduplicator.complete(key, future, response)
+            return response
+
+    async def _send_once(
+        self,
+        *,
+        endpoint: Endpoint,
+        path_params: Optional[Dict[str, str]],
+        headers: Optional[Dict[str, str]],
+        req_cfg: RequestConfig,
+        span: Optional[Span],
+        deadline: Optional[Deadline] = None,
+    ) -> httpx.Response:
+        """Journal, send and record a built request, read within the deadline."""
+        journal_args = self._journal_args(endpoint, path_params, headers, req_cfg)
+        entry_id = None
+        if journal_args is not None:
+            assert self.journal is not None
+            entry_id = await self.journal.abegin(**journal_args)
+        started = time.perf_counter()
+        try:
+            response = await self._request_within(req_cfg, deadline)
+        except (httpx.HTTPError, DeadlineExceeded):
+            self._record_request(
+                method=endpoint.method,
+                path=endpoint.path,
+                headers=headers,
+                status="error",
+                started=started,
+                span=span,
+            )
+            raise
+        self._record_request(
+            method=endpoint.method,
+            path=endpoint.path,
+            headers=headers,
+            status=str(response.status_code),
+            started=started,
+            span=span,
+        )
+        if entry_id is not None:
+            self._journal_response(entry_id, response)
+        return response
+
+    async def _request_within(
+        self, req_cfg: RequestConfig, deadline: Optional[Deadline]
+    ) -> httpx.Response:
+        """Send a request, cancelling it once the deadline passes.
+
+        httpx timeouts only bound each socket operation, so a body trickling in
+        could otherwise be read long after the deadline.
+
+        Raises:
+            DeadlineExceeded: If the deadline passes before the body is read
+        """
+        if deadline is None:
+            return await self.httpx_client.request(**req_cfg)
+        try:
+            return await asyncio.wait_for(
+                self.httpx_client.request(**req_cfg), max(deadline.remaining(), 0.0)
+            )
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded(phase="read", budget=deadline.budget) from None
+
+    async def recover_journal(
+        self,
+    ) -> List[Tuple[JournalEntry, RecoveryOutcome]]:
+        """Resend the journaled requests left unfinished by an earlier run.
+
+        Each request is sent again with its original headers, including its
+        `request-id`, and body, so the gateway can recognize a request it already
+        processed. Entries answered with any status are closed in the journal;
+        entries whose request fails again stay open for the next recovery, as do
+        entries with a redacted body, which are not sent.
+
+        Returns:
+            Each recovered entry with its response, the error raised sending it or
+            a `RedactedEntryError`
+
+        Raises:
+            RuntimeError: If the client has no journal
+        """
+        if self.journal is None:
+            raise RuntimeError("recover_journal requires a client with a journal")
+        outcomes: List[Tuple[JournalEntry, RecoveryOutcome]] = []
+        for entry in self.journal.recovered():
+            if entry.redacted:
+                outcomes.append((entry, RedactedEntryError(entry)))
+                continue
+            req_cfg = self._replay_config(entry)
+            started = time.perf_counter()
+            try:
+                response = await self.httpx_client.request(**req_cfg)
+            except httpx.HTTPError as exc:
+                self._record_request(
+                    method=entry.method,
+                    path=entry.path,
+                    headers=entry.headers,
+                    status="error",
+                    started=started,
+                )
+                outcomes.append((entry, exc))
+                continue
+            self._record_request(
+                method=entry.method,
+                path=entry.path,
+                headers=entry.headers,
+                status=str(response.status_code),
+                started=started,
+            )
+            self._journal_response(entry.id, response)
+            outcomes.append((entry, response))
+        return outcomes
 
     async def stream_request(
         self,
         *,
-        method: str,
-        path: str,
-        cast_to: Union[Type[T], Any],
+        method: Optional[str] = None,
+        path: Optional[str] = None,
+        cast_to: Union[Type[T], Any] = None,
+        endpoint: Optional[Endpoint] = None,
+        path_params: Optional[Dict[str, str]] = None,
         auth_names: Optional[List[str]] = None,
         query_params: Optional[QueryParams] = None,
         headers: Optional[Dict[str, str]] = None,
@@ -558,14 +1403,16 @@ class AsyncBaseClient(BaseClient):
         json: Optional[Any] = None,
         content_type: Optional[str] = None,
         content: Optional[httpx._types.RequestContent] = None,
-        request_options: Optional[RequestOptions] = None,
+        request_options: Optional[AnyRequestOptions] = None,
     ) -> AsyncStreamResponse[T]:
         """Make a streaming asynchronous HTTP request.
 
         Args:
-            method: HTTP method
-            path: API endpoint path
-            cast_to: Type to cast the response to
+            method: HTTP method, unless `endpoint` is given
+            path: API endpoint path or path template, unless `endpoint` is given
+            cast_to: Type to cast the response to, unless `endpoint` is given
+            endpoint: Precompiled endpoint description
+            path_params: Values substituted into the path template
             auth_names: List of auth provider IDs
             query_params: Query parameters
             headers: Request headers
@@ -577,24 +1424,102 @@ class AsyncBaseClient(BaseClient):
             request_options: Additional request options
 
         Returns:
-            AsyncStreamResponse containing the streaming response
+            AsyncStreamResponse containing the streaming response, holding a pooled
+            connection until it is read to the end or closed
 
         Raises:
             ApiError: If the request fails
         """
-        req_cfg = self.build_request(
+        endpoint = self._resolve_endpoint(
+            endpoint=endpoint,
             method=method,
             path=path,
+            cast_to=cast_to,
             auth_names=auth_names,
-            query_params=query_params,
-            headers=headers,
-            data=data,
-            files=files,
-            json=json,
             content_type=content_type,
-            content=content,
-            request_options=request_options,
         )
-        context = self.httpx_client.stream(**req_cfg)
-        response = await context.__aenter__()
-        return AsyncStreamResponse(response, context, cast_to)
+        span = self._start_span(
+            method=endpoint.method, path=endpoint.path, headers=headers
+        )
+        deadline: Optional[Deadline] = None
+        try:
+            compiled = self.compile_endpoint(endpoint)
+            opts, deadline = self._with_deadline(
+                request_options or default_request_options()
+            )
+            req_cfg = compiled.build(
+                opts=opts,
+                path_params=path_params,
+                query_params=query_params,
+                headers=headers,
+                data=data,
+                files=files,
+                json=json,
+                content=content,
+            )
+            if span is not None:
+                span.inject(req_cfg.setdefault("headers", {}))
+            started = time.perf_counter()
+            try:
+                context = self.httpx_client.stream(**req_cfg)
+                # owned by the stream from here on, closed by its finalizer at worst
+                result = AsyncStreamResponse(
+                    await context.__aenter__(), context, endpoint.cast_to
+                )
+            except httpx.HTTPError:
+                self._record_request(
+                    method=endpoint.method,
+                    path=endpoint.path,
+                    headers=headers,
+                    status="error",
+                    started=started,
+                    span=span,
+                )
+                raise
+            self._record_request(
+                method=endpoint.method,
+                path=endpoint.path,
+                headers=headers,
+                status=str(result.response.status_code),
+                started=started,
+                span=span,
+            )
+        except httpx.TimeoutException as exc:
+            error = deadline.exceeded(exc) if deadline is not None else None
+            self._end_span(span, error=error or exc)
+            if error is None:
+                raise
+            raise error from exc
+        except BaseException as exc:
+            self._end_span(span, error=exc)
+            raise
+        self._end_span(span)
+        return result
+
+
+def _wait_timeout(
+    timeout: httpx._types.TimeoutTypes, deadline: Optional[Deadline]
+) -> Optional[float]:
+    """
+    Seconds a duplicate waits for the request in flight before giving up.
+
+    The sender may spend each of its connect, write, read and pool timeouts, so the
+    duplicate waits for their sum, or without limit if any of them is disabled, but
+    never past the deadline.
+    """
+    limits = httpx.Timeout(timeout)
+    phases = (limits.connect, limits.write, limits.read, limits.pool)
+    wait = None
+    if all(phase is not None for phase in phases):
+        wait = sum(phase for phase in phases if phase is not None)
+    if deadline is not None:
+        remaining = max(deadline.remaining(), 0.0)
+        wait = remaining if wait is None else min(wait, remaining)
+    return wait
+
+
+def _duplicate_timeout(req_cfg: RequestConfig) -> httpx.ReadTimeout:
+    """The error of a duplicate that gave up waiting for the request in flight."""
+    return httpx.ReadTimeout(
+        f"timed out waiting for the duplicate request in flight to {req_cfg['url']}"
+    )
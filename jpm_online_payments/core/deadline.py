@@ -0,0 +1,140 @@
+import time
+from typing import Optional, Union
+
+import httpx
+
+"""
+Deadline budgets for API calls.
+
+A `Deadline` is a point in time by which a call, or a sequence of calls sharing
+the same deadline, must complete. Before the access token is fetched and again
+before the request is sent, the remaining budget is checked, failing fast with
+`DeadlineExceeded` once it is spent, and turned into per-phase httpx timeouts so
+no phase waits past the deadline. httpx timeouts bound each socket operation, so
+the response is additionally read against the wall clock: the async client
+cancels the request at the deadline, and the sync client checks the budget after
+each chunk of the body. The budget is checked once more after decoding.
+"""
+
+# timeouts firing within this many seconds of the deadline are attributed to it
+_SLACK = 0.01
+
+_TIMEOUT_PHASES = (
+    (httpx.ConnectTimeout, "connect"),
+    (httpx.ReadTimeout, "read"),
+    (httpx.WriteTimeout, "write"),
+    (httpx.PoolTimeout, "pool"),
+)
+
+
+class DeadlineExceeded(TimeoutError):
+    """
+    Raised when an API call runs out of its deadline budget.
+
+    Attributes:
+        phase: Phase the budget ran out in: `authentication` before or during
+            the token request, `dispatch` before the API request, `decode`
+            while decoding the response, otherwise the httpx timeout phase of
+            the API request, `connect`, `read`, `write` or `pool`, where `read`
+            also covers reading the body past the deadline
+        budget: Seconds the deadline allowed in total
+    """
+
+    def __init__(self, *, phase: str, budget: float) -> None:
+        super().__init__(f"deadline of {budget:g}s exceeded during {phase}")
+        self.phase = phase
+        self.budget = budget
+
+
+class Deadline:
+    """
+    Time budget shared by everything an API call does.
+
+    ```py
+    deadline = Deadline(2.0, connect=0.5)
+    verification = client.verifications.create(
+        ..., request_options={"deadline": deadline}
+    )
+    fraud_check = client.fraudcheck.create(
+        ..., request_options={"deadline": deadline}
+    )
+    ```
+
+    Attributes:
+        budget: Seconds allowed from creation
+        connect: Upper bound of the connect timeout, if any
+        expires_at: `time.monotonic()` value of the deadline
+    """
+
+    __slots__ = ("budget", "connect", "expires_at")
+
+    def __init__(self, budget: float, *, connect: Optional[float] = None) -> None:
+        """
+        Args:
+            budget: Seconds from now until the deadline
+            connect: Upper bound of the connect timeout, so a slow connection
+                attempt cannot take the whole budget
+        """
+        self.budget = budget
+        self.connect = connect
+        self.expires_at = time.monotonic() + budget
+
+    def remaining(self) -> float:
+        """Seconds left until the deadline; negative once it has passed."""
+        return self.expires_at - time.monotonic()
+
+    def check(self, *, phase: str) -> None:
+        """
+        Fails once the budget is spent.
+
+        Args:
+            phase: Phase that just ran or is about to start, reported in the error
+
+        Raises:
+            DeadlineExceeded: If the budget is spent
+        """
+        if self.remaining() <= 0:
+            raise DeadlineExceeded(phase=phase, budget=self.budget)
+
+    def timeout(
+        self, *, phase: str, cap: Optional[float] = None
+    ) -> httpx.Timeout:
+        """
+        Derives the httpx timeouts of the next phase from the remaining budget.
+
+        Args:
+            phase: Phase about to start, reported if the budget is spent
+            cap: Upper bound of every timeout, e.g. the `timeout` request option
+
+        Raises:
+            DeadlineExceeded: If the budget is spent
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded(phase=phase, budget=self.budget)
+        if cap is not None:
+            remaining = min(remaining, cap)
+        connect = remaining if self.connect is None else min(remaining, self.connect)
+        return httpx.Timeout(remaining, connect=connect)
+
+    def exceeded(self, exc: httpx.TimeoutException) -> Optional[DeadlineExceeded]:
+        """
+        Returns the `DeadlineExceeded` error an httpx timeout amounts to, or None
+        if it fired well before the deadline, e.g. because of a smaller `cap`.
+        """
+        if self.remaining() > _SLACK:
+            return None
+        for timeout_type, phase in _TIMEOUT_PHASES:
+            if isinstance(exc, timeout_type):
+                return DeadlineExceeded(phase=phase, budget=self.budget)
+        return DeadlineExceeded(phase="read", budget=self.budget)
+
+    def __repr__(self) -> str:
+        return f"Deadline(budget={self.budget:g}, remaining={self.remaining():.3f})"
+
+
+def as_deadline(value: Union[Deadline, float, None]) -> Optional[Deadline]:
+    """Returns `value` as a deadline, starting a new one for a number of seconds."""
+    if value is None or isinstance(value, Deadline):
+        return value
+    return Deadline(value)
@@ -0,0 +1,140 @@
+import collections
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, OrderedDict, Tuple
+
+import httpx
+
+"""
+Suppression of duplicate submissions sharing a `request-id`.
+
+Requests are keyed by merchant-id and request-id, together with the method and
+URL, so captures of two payments reusing a request-id are never confused. While a
+request is in flight, a duplicate waits for it and receives the same HTTP response;
+after a 2xx response, duplicates within `ttl` seconds receive the cached response
+without contacting the gateway. Each caller decodes the shared response with its
+own request options. Responses other than 2xx and transport errors are only shared
+with duplicates already waiting, so a later retry reaches the gateway.
+"""
+
+DedupKey = Tuple[str, str, str, str]
+
+
+class RequestDeduplicator:
+    """
+    In-flight and recently completed requests, bounded by size and age.
+
+    A deduplicator is safe to share between threads; a client's deduplicator is
+    either used synchronously or from a single event loop.
+
+    Attributes:
+        max_size: Maximum number of completed responses kept
+        ttl: Seconds a completed response is reused for
+        suppressed: Number of requests answered without being sent
+    """
+
+    def __init__(self, *, max_size: int = 10_000, ttl: float = 60.0) -> None:
+        """
+        Args:
+            max_size: Maximum number of completed responses kept; the oldest are
+                evicted first
+            ttl: Seconds after completion during which a duplicate receives the
+                cached response
+
+        Raises:
+            ValueError: If `max_size` or `ttl` is not positive
+        """
+        if max_size < 1 or ttl <= 0:
+            raise ValueError("max_size and ttl must be positive")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.suppressed = 0
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Any] = {}
+        # completed responses in expiry order, as they all live for `ttl`
+        self._completed: OrderedDict[Hashable, Tuple[float, httpx.Response]] = (
+            collections.OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._completed)
+
+    def claim(self, key: Hashable, new_future: Callable[[], Any]) -> Tuple[str, Any]:
+        """
+        Looks up a request, registering it as in flight if it is new.
+
+        Args:
+            key: Request key, see `dedup_key`
+            new_future: Creates the future duplicates wait on
+
+        Returns:
+            `("cached", response)` for a recently completed request,
+            `("wait", future)` for a request in flight, or `("send", future)` if
+            the caller must send the request and then call `complete` or `fail`
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            cached = self._completed.get(key)
+            if cached is not None:
+                self.suppressed += 1
+                return "cached", cached[1]
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.suppressed += 1
+                return "wait", future
+            future = self._in_flight[key] = new_future()
+            return "send", future
+
+    def complete(self, key: Hashable, future: Any, response: httpx.Response) -> None:
+        """Records the response of a request claimed with `send`."""
+        with self._lock:
+            self._in_flight.pop(key, None)
+            if 200 <= response.status_code < 300:
+                self._completed[key] = (time.monotonic() + self.ttl, response)
+                self._completed.move_to_end(key)
+                while len(self._completed) > self.max_size:
+                    self._completed.popitem(last=False)
+        future.set_result(response)
+
+    def fail(self, key: Hashable, future: Any, error: BaseException) -> None:
+        """
+        Records that a request claimed with `send` raised `error`.
+
+        Waiting duplicates receive the error, or send the request themselves if
+        the sender was cancelled or interrupted.
+        """
+        with self._lock:
+            self._in_flight.pop(key, None)
+        if isinstance(error, Exception):
+            future.set_exception(error)
+            # marks the error as retrieved when nobody was waiting
+            future.exception()
+        else:
+            future.cancel()
+
+    def _expire(self, now: float) -> None:
+        completed = self._completed
+        while completed:
+            key, (expires, _) = next(iter(completed.items()))
+            if expires > now:
+                break
+            del completed[key]
+
+
+def dedup_key(
+    *, method: str, url: str, headers: Optional[Dict[str, str]]
+) -> Optional[DedupKey]:
+    """
+    Returns the deduplication key of a request, or None if it is not deduplicated.
+
+    Only requests other than GET carrying both a `merchant-id` and a `request-id`
+    header are deduplicated.
+    """
+    if method == "GET" or not headers:
+        return None
+    merchant_id = headers.get("merchant-id")
+    request_id = headers.get("request-id")
+    if not merchant_id or not request_id:
+        return None
+    return (merchant_id, request_id, method, url)
@@ -0,0 +1,356 @@
+import copy
+import json
+from json import JSONDecodeError
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple, Type
+
+import httpx
+import pydantic
+
+from .api_error import ApiError
+from .auth import AuthProvider
+from .binary_response import BinaryResponse
+from .deadline import DeadlineExceeded, as_deadline
+from .raw_response import RawResponse
+from .request import AnyRequestOptions, JsonContent, QueryParams, RequestConfig
+from .response import from_encodable
+from .utils import get_content_type, get_type_adapter, is_binary_content_type
+from .views import ModelView, is_viewable, view_class
+
+"""
+Precompiled endpoint templates.
+
+An `Endpoint` is the static description of an API operation, declared once per
+resource method. A base client compiles it into a `CompiledEndpoint` holding
+everything that does not change between calls (URL prefix, default headers,
+resolved auth providers), so building a request only fills in the variables.
+Likewise a `ResponsePlan` picks the decoding strategy for the response type once,
+instead of branching on the type for every response.
+"""
+
+NoneType = type(None)
+AnyType = type(Any)
+
+
+class ResponsePlan:
+    """
+    Decoding strategy for a response type.
+
+    `kind` is one of `none` (no content is decoded), `binary` (the content is
+    wrapped in a `BinaryResponse`), `any` (JSON is returned as parsed) or `json`
+    (JSON is validated into `cast_to` by a cached TypeAdapter). A cheap check on the
+    response content type falls back to generic decoding when a server does not
+    send what the endpoint declares. Model types can also be decoded into a
+    read-only `ModelView`, or into a projection model holding a subset of their
+    fields, and any response can be returned undecoded as a `RawResponse`.
+    """
+
+    __slots__ = ("cast_to", "kind", "_adapter", "_view", "_projections")
+
+    def __init__(self, cast_to: Any) -> None:
+        self.cast_to = cast_to
+        self._adapter = None
+        self._view: Optional[Type[ModelView]] = None
+        self._projections: Dict[FrozenSet[str], Type[pydantic.BaseModel]] = {}
+        if cast_to is NoneType:
+            self.kind = "none"
+        elif cast_to is BinaryResponse:
+            self.kind = "binary"
+        elif cast_to is AnyType:
+            self.kind = "any"
+        else:
+            self.kind = "json"
+            self._adapter = get_type_adapter(cast_to)
+            if is_viewable(cast_to):
+                self._view = view_class(cast_to)
+
+    def _projection(self, fields: FrozenSet[str]) -> Type[pydantic.BaseModel]:
+        """
+        Returns a model holding only `fields` of `cast_to`, built once per set.
+
+        Raises:
+            ValueError: If `cast_to` is not a model type or has no such fields
+        """
+        projection = self._projections.get(fields)
+        if projection is None:
+            if self._view is None:
+                raise ValueError(
+                    f"fields can only be selected from a model response type, "
+                    f"not {self.cast_to!r}"
+                )
+            model_fields = self.cast_to.model_fields
+            unknown = fields.difference(model_fields)
+            if unknown:
+                raise ValueError(
+                    f"unknown fields for {self.cast_to.__name__}: {sorted(unknown)}"
+                )
+            projection = pydantic.create_model(  # type: ignore[call-overload]
+                f"{self.cast_to.__name__}Projection",
+                __config__=self.cast_to.model_config,
+                __module__=self.cast_to.__module__,
+                **{
+                    name: (model_fields[name].annotation, copy.copy(model_fields[name]))
+                    for name in sorted(fields)
+                },
+            )
+            self._projections[fields] = projection
+        return projection
+
+    def decode(
+        self,
+        response: httpx.Response,
+        mode: str = "model",
+        fields: Optional[Sequence[str]] = None,
+    ) -> Any:
+        """
+        Decodes a response according to the plan.
+
+        Args:
+            response: HTTP response to decode
+            mode: `model`, `view` or `raw`; views are only built for model types,
+                `raw` returns a `RawResponse` that decodes in `model` mode on demand
+            fields: Model fields to decode into a projection model holding only
+                them, instead of `cast_to`; not supported in `view` mode
+
+        Raises:
+            ApiError: If the response status is not 2xx, except in `raw` mode, where
+                it is raised on access to the decoded value
+            ValueError: If `fields` are given in `view` mode, for a response type
+                other than a model, or name fields the model does not have
+        """
+        projection = None
+        if fields:
+            if mode == "view":
+                raise ValueError("fields cannot be combined with the view decode mode")
+            projection = self._projection(frozenset(fields))
+        status_code = response.status_code
+        if mode == "raw":
+            return RawResponse(
+                content=response.content,
+                status_code=status_code,
+                headers=response.headers,
+                decode=lambda: self.decode(response, "model", fields),
+            )
+        if not 200 <= status_code < 300:
+            raise api_error(response)
+        if status_code == 204 or self.kind == "none":
+            return None
+        if self.kind == "binary":
+            return BinaryResponse(content=response.content, headers=response.headers)
+
+        content_type = get_content_type(response.headers)
+        if "json" in content_type:
+            if self._adapter is None:
+                return response.json()
+            if projection is not None:
+                return projection.model_validate_json(response.content)
+            if self._view is not None and mode == "view":
+                return self._view(json.loads(response.content))
+            return self._adapter.validate_json(response.content)
+        load_with = self.cast_to if projection is None else projection
+        if "form" in content_type:
+            if self._adapter is None:
+                return response.json()
+            return from_encodable(data=response.json(), load_with=load_with)
+        if is_binary_content_type(content_type):
+            return BinaryResponse(content=response.content, headers=response.headers)
+        return from_encodable(data=response.content, load_with=load_with)
+
+
+_RESPONSE_PLANS: Dict[Any, ResponsePlan] = {}
+
+
+def response_plan(cast_to: Any) -> ResponsePlan:
+    """Returns the response plan for `cast_to`, building it once per type."""
+    try:
+        plan = _RESPONSE_PLANS.get(cast_to)
+    except TypeError:
+        return ResponsePlan(cast_to)
+    if plan is None:
+        plan = ResponsePlan(cast_to)
+        _RESPONSE_PLANS[cast_to] = plan
+    return plan
+
+
+def api_error(response: httpx.Response) -> ApiError:
+    """Builds the `ApiError` for a non-2xx response, with the JSON body if any."""
+    try:
+        return ApiError(status_code=response.status_code, body=response.json())
+    except JSONDecodeError:
+        return ApiError(status_code=response.status_code, body=response.text)
+
+
+class Endpoint:
+    """
+    Static description of an API operation.
+
+    Attributes:
+        method: HTTP method
+        path: Path template, e.g. `/payments/{id}`
+        cast_to: Type the response is decoded into
+        auth_names: IDs of the auth providers applied to requests
+        content_type: Content type header sent with every request, if any
+    """
+
+    __slots__ = ("method", "path", "cast_to", "auth_names", "content_type", "_key")
+
+    def __init__(
+        self,
+        *,
+        method: str,
+        path: str,
+        cast_to: Any,
+        auth_names: Sequence[str] = (),
+        content_type: Optional[str] = None,
+    ) -> None:
+        self.method = method
+        self.path = path
+        self.cast_to = cast_to
+        self.auth_names: Tuple[str, ...] = tuple(auth_names)
+        self.content_type = content_type
+        self._key = (method, path, cast_to, self.auth_names, content_type)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Endpoint) and self._key == other._key
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __repr__(self) -> str:
+        return f"Endpoint({self.method} {self.path})"
+
+
+class CompiledEndpoint:
+    """
+    An `Endpoint` bound to a base client's URL, default headers and auth providers.
+
+    Attributes:
+        endpoint: Endpoint this template was compiled from
+        url: Complete URL when the path has no variables, otherwise None
+        response_plan: Decoding strategy for the endpoint's response type
+    """
+
+    __slots__ = (
+        "endpoint",
+        "url",
+        "response_plan",
+        "_url_prefix",
+        "_path",
+        "_headers",
+        "_auths",
+    )
+
+    def __init__(
+        self,
+        *,
+        endpoint: Endpoint,
+        base_url: str,
+        default_headers: Dict[str, str],
+        auths: List[AuthProvider],
+    ) -> None:
+        self.endpoint = endpoint
+        base = base_url[:-1] if base_url.endswith("/") else base_url
+        self._url_prefix = f"{base}/"
+        self._path = endpoint.path.lstrip("/")
+        self.url: Optional[str] = (
+            None if "{" in self._path else self._url_prefix + self._path
+        )
+        headers = dict(default_headers)
+        if endpoint.content_type is not None:
+            headers["content-type"] = endpoint.content_type
+        self._headers = headers
+        self._auths = auths
+        self.response_plan = response_plan(endpoint.cast_to)
+
+    def build_url(self, path_params: Optional[Dict[str, str]] = None) -> str:
+        """Fills the path template and returns the complete URL."""
+        if self.url is not None:
+            return self.url
+        return self._url_prefix + self._path.format(**(path_params or {}))
+
+    def build(
+        self,
+        *,
+        opts: AnyRequestOptions,
+        path_params: Optional[Dict[str, str]] = None,
+        query_params: Optional[QueryParams] = None,
+        headers: Optional[Dict[str, str]] = None,
+        data: Optional[httpx._types.RequestData] = None,
+        files: Optional[httpx._types.RequestFiles] = None,
+        json: Optional[Any] = None,
+        content: Optional[httpx._types.RequestContent] = None,
+    ) -> RequestConfig:
+        """
+        Builds the request configuration for a single call.
+
+        Headers are layered as default headers, auth, explicit headers and finally
+        `additional_headers` from the request options. With a `deadline` option,
+        the timeouts of the token request and of the API request are derived from
+        the remaining budget.
+
+        Args:
+            opts: Request options of the call
+            path_params: Values substituted into the path template
+            query_params: Query parameters
+            headers: Explicit request headers
+            data: Form data
+            files: Files to upload
+            json: JSON data, or a body already encoded as `JsonContent`
+            content: Raw content
+
+        Returns:
+            Complete request configuration
+        """
+        cfg: RequestConfig = {
+            "method": self.endpoint.method,
+            "url": self.build_url(path_params),
+            "headers": self._headers.copy(),
+        }
+        timeout = opts.get("timeout")
+        deadline = as_deadline(opts.get("deadline"))
+        if deadline is not None:
+            # bounds the token request made by auth providers, if any
+            cfg["timeout"] = deadline.timeout(phase="authentication", cap=timeout)
+        elif timeout is not None:
+            cfg["timeout"] = timeout
+        try:
+            for auth in self._auths:
+                cfg = auth.add_to_request(cfg)
+        except httpx.TimeoutException as exc:
+            if deadline is None or deadline.exceeded(exc) is None:
+                raise
+            raise DeadlineExceeded(
+                phase="authentication", budget=deadline.budget
+            ) from exc
+
+        if headers:
+            cfg["headers"].update(headers)
+        additional_headers = opts.get("additional_headers")
+        if additional_headers:
+            cfg["headers"].update(additional_headers)
+
+        additional_params = opts.get("additional_params")
+        if query_params or additional_params:
+            params = cfg.get("params", {})
+            if query_params:
+                params.update(query_params)
+            if additional_params:
+                params.update(additional_params)
+            cfg["params"] = params
+
+        if data is not None:
+            cfg["data"] = data
+        if files is not None:
+            cfg["files"] = files
+        if isinstance(json, JsonContent):
+            # already encoded, e.g. with frozen fragments spliced in
+            cfg["content"] = json
+            cfg["headers"]["content-type"] = "application/json"
+        elif json is not None:
+            cfg["json"] = json
+        if content is not None:
+            cfg["content"] = content
+
+        if deadline is not None:
+            cfg["timeout"] = deadline.timeout(phase="dispatch", cap=timeout)
+
+        return cfg
@@ -0,0 +1,127 @@
+import concurrent.futures
+import contextvars
+import threading
+import time
+from concurrent.futures import Future, as_completed  # noqa: F401
+from typing import Any, Callable, Iterable, List, Optional, TypeVar
+
+from typing_extensions import ParamSpec
+
+"""
+Thread pool running calls of the synchronous client in the background.
+
+`SyncBaseClient.submit` hands calls to a `ClientExecutor` owned by the client.
+Worker threads share the client's `httpx.Client` and so its connection pool;
+keep `max_workers` at or below the pool's connection limit (100 by default), or
+workers queue for connections instead of sending. Each call runs in a copy of
+the submitting thread's context, so tracing context carries over to the worker.
+"""
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 16
+
+
+class ClientExecutor:
+    """
+    Lazily started, size-bounded thread pool.
+
+    Attributes:
+        max_workers: Maximum number of worker threads
+    """
+
+    def __init__(self, *, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        """
+        Args:
+            max_workers: Maximum number of worker threads
+
+        Raises:
+            ValueError: If `max_workers` is not positive
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive")
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._shutdown = False
+
+    def submit(
+        self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs
+    ) -> "Future[T]":
+        """
+        Schedules `fn(*args, **kwargs)` on a worker thread.
+
+        Raises:
+            RuntimeError: If the executor was shut down
+        """
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot submit calls after shutdown")
+            if self._pool is None:
+                self._pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="jpm-online-payments",
+                )
+            pool = self._pool
+        context = contextvars.copy_context()
+
+        def run() -> T:
+            return context.run(fn, *args, **kwargs)
+
+        return pool.submit(run)
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """
+        Stops accepting calls and releases the worker threads once queued calls
+        have run.
+
+        Args:
+            wait: Wait for running and queued calls to finish
+        """
+        with self._lock:
+            self._shutdown = True
+            pool = self._pool
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+
+def gather(
+    futures: Iterable["Future[T]"],
+    *,
+    timeout: Optional[float] = None,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """
+    Waits for `futures` and returns their results in the given order.
+
+    Args:
+        futures: Futures, e.g. from `Client.submit`
+        timeout: Seconds to wait for all futures together
+        return_exceptions: Return the exception of a failed future in place of its
+            result instead of raising it
+
+    Raises:
+        Exception: The exception of the first failed future, in the given order,
+            unless `return_exceptions`; futures that have not started are
+            cancelled
+        concurrent.futures.TimeoutError: If the futures are not done in time
+    """
+    futures = list(futures)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    results: List[Any] = []
+    try:
+        for future in futures:
+            remaining = None
+            if deadline is not None:
+                remaining = max(0.0, deadline - time.monotonic())
+            if return_exceptions:
+                error = future.exception(timeout=remaining)
+                results.append(error if error is not None else future.result())
+            else:
+                results.append(future.result(timeout=remaining))
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+    return results
@@ -0,0 +1,444 @@
+import asyncio
+import base64
+import json
+import os
+import sys
+import threading
+import time
+from typing import IO, Any, Dict, FrozenSet, List, Optional, Tuple
+
+from .redaction import redact
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+"""
+Write-ahead journal for requests that move money.
+
+Before a journaled request is sent, a `begin` record holding its method, path,
+headers (including `request-id`) and encoded body is appended to the journal,
+and once a response is received an `end` record with the status code follows.
+A request without an `end` record may or may not have reached the gateway, so
+after a crash it is replayed with the same `request-id`, which the gateway uses
+to deduplicate it. Bodies are journaled in full by default, card data included,
+so that every unfinished request can be replayed; the journal file is created
+readable by its owner only and must be protected like any other store of card
+data. Passing `redact_fields`, e.g. `REDACTED_FIELDS`, keeps those values out of
+the journal instead, and recovery reports the affected entries rather than
+sending them again.
+
+Records are JSON lines written to the operating system with a single unbuffered
+`write` each, which survives the process dying but not the machine. With
+`fsync=True`, `begin` additionally waits until the record is flushed to disk,
+and `abegin` awaits it in a worker thread; concurrent callers share one `fsync`
+(group commit), so the cost per request drops as concurrency rises. `end` records
+are never waited for, since losing one only causes a redundant replay.
+"""
+
+
+class JournalEntry:
+    """
+    A journaled request.
+
+    Attributes:
+        id: Sequence number of the entry within the journal
+        method: HTTP method
+        path: Path template, e.g. `/payments/{id}/captures`
+        path_params: Values substituted into the path template
+        auth_names: IDs of the auth providers applied to the request
+        headers: Explicit request headers, such as `merchant-id` and `request-id`
+        body: Encoded body, if any
+        redacted: Whether values of the body were redacted, so the request cannot
+            be sent again
+        started: Unix time the request was journaled at
+    """
+
+    __slots__ = (
+        "id",
+        "method",
+        "path",
+        "path_params",
+        "auth_names",
+        "headers",
+        "body",
+        "redacted",
+        "started",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: int,
+        method: str,
+        path: str,
+        path_params: Dict[str, str],
+        auth_names: List[str],
+        headers: Dict[str, str],
+        body: Optional[bytes],
+        started: float,
+        redacted: bool = False,
+    ) -> None:
+        self.id = id
+        self.method = method
+        self.path = path
+        self.path_params = path_params
+        self.auth_names = auth_names
+        self.headers = headers
+        self.body = body
+        self.redacted = redacted
+        self.started = started
+
+    @property
+    def request_id(self) -> Optional[str]:
+        """The `request-id` header of the request, if any."""
+        return self.headers.get("request-id")
+
+    def to_record(self) -> Dict[str, Any]:
+        record = {
+            "op": "begin",
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "path_params": self.path_params,
+            "auth_names": self.auth_names,
+            "headers": self.headers,
+            "body": None,
+            "redacted": self.redacted,
+            "started": self.started,
+        }
+        if self.body is not None:
+            try:
+                record["body"] = self.body.decode("utf-8")
+            except UnicodeDecodeError:
+                # e.g. multipart bodies holding binary files
+                record["body_base64"] = base64.b64encode(self.body).decode("ascii")
+        return record
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "JournalEntry":
+        body: Optional[bytes] = None
+        if record.get("body") is not None:
+            body = record["body"].encode("utf-8")
+        elif record.get("body_base64") is not None:
+            body = base64.b64decode(record["body_base64"])
+        return cls(
+            id=record["id"],
+            method=record["method"],
+            path=record["path"],
+            path_params=record.get("path_params") or {},
+            auth_names=record.get("auth_names") or [],
+            headers=record.get("headers") or {},
+            body=body,
+            started=record.get("started", 0.0),
+            redacted=record.get("redacted", False),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"JournalEntry(id={self.id}, {self.method} {self.path}, "
+            f"request_id={self.request_id!r})"
+        )
+
+
+class RedactedEntryError(Exception):
+    """
+    Reported by `recover_journal` for an entry whose body was redacted in the
+    journal and therefore cannot be sent again. The entry stays open until it is
+    closed with `Journal.end`, e.g. after looking the request up by its
+    `request-id` with `payments.get`.
+    """
+
+    def __init__(self, entry: JournalEntry) -> None:
+        super().__init__(
+            f"journal entry {entry.id} (request_id={entry.request_id!r}) has a "
+            "redacted body and cannot be sent again"
+        )
+        self.entry = entry
+
+
+class Journal:
+    """
+    Append-only journal file of requests and their outcomes.
+
+    A journal is used by one process at a time: opening it takes an exclusive
+    lock on a `.lock` file next to it, held until it is closed. Under that lock,
+    the entries left unfinished by earlier runs are loaded, available from
+    `recovered()`, and the file is compacted down to them.
+
+    Request bodies are written as sent unless `redact_fields` is given, so a
+    journal of card payments holds card data and must be stored accordingly.
+    Redacted entries cannot be replayed; `recover_journal` reports them with a
+    `RedactedEntryError`.
+
+    Attributes:
+        path: Journal file
+        fsync: Whether `begin` waits for the record to be flushed to disk
+        redact_fields: JSON body keys whose values are not written to the journal
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        fsync: bool = False,
+        redact_fields: FrozenSet[str] = frozenset(),
+    ) -> None:
+        """
+        Args:
+            path: Journal file, created if missing
+            fsync: Wait for `begin` records to be flushed to disk, protecting
+                against machine crashes in addition to process crashes
+            redact_fields: JSON body keys whose values are redacted, such as
+                `REDACTED_FIELDS`; none by default. Requests with redacted values
+                are not sent again by recovery.
+
+        Raises:
+            RuntimeError: If another process has the journal open
+        """
+        self.path = path
+        self.fsync = fsync
+        self.redact_fields = redact_fields
+        self._lock = threading.Lock()
+        self._sync = threading.Condition()
+        self._syncing = False
+        self._written = 0
+        self._synced = 0
+        self._lock_file = _lock_exclusively(f"{path}.lock")
+        try:
+            self._recovered = self._load(path)
+            self._next_id = max(self._recovered, default=0) + 1
+            self._compact(list(self._recovered.values()))
+            self._file: IO[bytes] = os.fdopen(
+                _open_private(path, os.O_WRONLY | os.O_APPEND), "ab", buffering=0
+            )
+        except BaseException:
+            self._lock_file.close()
+            raise
+
+    @staticmethod
+    def _load(path: str) -> Dict[int, JournalEntry]:
+        entries: Dict[int, JournalEntry] = {}
+        if not os.path.exists(path):
+            return entries
+        with open(path, "rb") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # a record torn by a crash; nothing after it was acknowledged
+                    break
+                if record["op"] == "begin":
+                    entries[record["id"]] = JournalEntry.from_record(record)
+                else:
+                    entries.pop(record["id"], None)
+        return entries
+
+    def _compact(self, entries: List[JournalEntry]) -> None:
+        temp_path = f"{self.path}.tmp"
+        with os.fdopen(
+            _open_private(temp_path, os.O_WRONLY | os.O_TRUNC), "wb"
+        ) as file:
+            for entry in entries:
+                file.write(_encode(entry.to_record()))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.path)
+
+    def recovered(self) -> List[JournalEntry]:
+        """Returns the entries left unfinished by earlier runs, oldest first."""
+        return sorted(self._recovered.values(), key=lambda entry: entry.id)
+
+    def begin(
+        self,
+        *,
+        method: str,
+        path: str,
+        path_params: Optional[Dict[str, str]] = None,
+        auth_names: Optional[List[str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        body: Optional[bytes] = None,
+    ) -> int:
+        """
+        Journals a request about to be sent.
+
+        Returns:
+            ID of the entry, to pass to `end`
+
+        Raises:
+            RuntimeError: If the journal is closed
+        """
+        entry_id, position = self._begin(
+            method=method,
+            path=path,
+            path_params=path_params,
+            auth_names=auth_names,
+            headers=headers,
+            body=body,
+        )
+        if self.fsync:
+            self._wait_synced(position)
+        return entry_id
+
+    async def abegin(
+        self,
+        *,
+        method: str,
+        path: str,
+        path_params: Optional[Dict[str, str]] = None,
+        auth_names: Optional[List[str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        body: Optional[bytes] = None,
+    ) -> int:
+        """
+        Journals a request about to be sent, like `begin`, but waits for the
+        `fsync` in a worker thread instead of blocking the event loop.
+        """
+        entry_id, position = self._begin(
+            method=method,
+            path=path,
+            path_params=path_params,
+            auth_names=auth_names,
+            headers=headers,
+            body=body,
+        )
+        if self.fsync and self._synced < position:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._wait_synced, position)
+        return entry_id
+
+    def _begin(
+        self,
+        *,
+        method: str,
+        path: str,
+        path_params: Optional[Dict[str, str]],
+        auth_names: Optional[List[str]],
+        headers: Optional[Dict[str, str]],
+        body: Optional[bytes],
+    ) -> Tuple[int, int]:
+        """Appends the `begin` record of a request, returning its ID and position."""
+        with self._lock:
+            entry_id = self._next_id
+            self._next_id += 1
+        body, redacted = _redact_body(body, self.redact_fields)
+        entry = JournalEntry(
+            id=entry_id,
+            method=method,
+            path=path,
+            path_params=dict(path_params or {}),
+            auth_names=list(auth_names or []),
+            headers=dict(headers or {}),
+            body=body,
+            redacted=redacted,
+            started=time.time(),
+        )
+        return entry_id, self._append(_encode(entry.to_record()))
+
+    def end(
+        self, entry_id: int, *, status: Optional[int], error: Optional[str] = None
+    ) -> None:
+        """
+        Records the outcome of a journaled request.
+
+        Args:
+            entry_id: ID returned by `begin`
+            status: HTTP status code of the response
+            error: Description of a failure, if no status is known
+
+        Raises:
+            RuntimeError: If the journal is closed
+        """
+        self._append(
+            _encode({"op": "end", "id": entry_id, "status": status, "error": error})
+        )
+        self._recovered.pop(entry_id, None)
+
+    def _append(self, record: bytes) -> int:
+        with self._lock:
+            if self._file.closed:
+                raise RuntimeError(f"journal {self.path} is closed")
+            self._file.write(record)
+            self._written += 1
+            return self._written
+
+    def _wait_synced(self, position: int) -> None:
+        with self._sync:
+            while self._synced < position:
+                if self._syncing:
+                    self._sync.wait()
+                    continue
+                # this caller flushes everything written so far for all waiters
+                self._syncing = True
+                target = self._written
+                self._sync.release()
+                try:
+                    os.fsync(self._file.fileno())
+                finally:
+                    self._sync.acquire()
+                    self._syncing = False
+                self._synced = max(self._synced, target)
+                self._sync.notify_all()
+
+    def close(self) -> None:
+        """Flushes and closes the journal file, releasing its lock."""
+        with self._lock:
+            if not self._file.closed:
+                os.fsync(self._file.fileno())
+                self._file.close()
+                self._lock_file.close()
+
+    def __enter__(self) -> "Journal":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _lock_exclusively(path: str) -> IO[bytes]:
+    """
+    Opens `path` and takes an exclusive lock on it without waiting, released when
+    the returned file is closed.
+
+    Raises:
+        RuntimeError: If another process holds the lock
+    """
+    file = open(path, "a+b")
+    try:
+        if sys.platform == "win32":
+            msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        file.close()
+        raise RuntimeError(f"journal {path[:-5]} is in use by another process")
+    return file
+
+
+def _open_private(path: str, flags: int) -> int:
+    """Opens `path` with `flags`, creating it readable by the owner only."""
+    return os.open(path, flags | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o600)
+
+
+def _redact_body(
+    body: Optional[bytes], fields: FrozenSet[str]
+) -> Tuple[Optional[bytes], bool]:
+    """Redacts `fields` from a JSON body, returning it and whether it changed."""
+    if not body or not fields:
+        return body, False
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return body, False
+    redacted = redact(data, fields)
+    if redacted == data:
+        return body, False
+    return _encode(redacted)[:-1], True
+
+
+def _encode(record: Dict[str, Any]) -> bytes:
+    return (
+        json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        + b"\n"
+    )
@@ -0,0 +1,409 @@
+import bisect
+import threading
+import weakref
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, cast
+
+"""
+In-process metrics for API calls made through the base clients.
+
+Metrics are recorded into per-thread shards so the request path never contends
+on a shared lock; shards are only merged when the registry is exported in the
+Prometheus text exposition format. The shard of a thread that exits is folded
+into a shared shard, so short-lived threads do not accumulate shards.
+"""
+
+LabelValues = Tuple[str, ...]
+
+REQUEST_LABELS: Tuple[str, ...] = ("method", "path", "status", "merchant_id")
+
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+def log_linear_buckets(
+    *, start: float, end: float, steps_per_decade: int = 4
+) -> Tuple[float, ...]:
+    """
+    Builds log-linear histogram bucket bounds.
+
+    Each decade between `start` and `end` is split into `steps_per_decade`
+    linearly spaced bounds, e.g. start=0.001, steps_per_decade=4 yields
+    0.001, 0.0025, 0.005, 0.0075, 0.01, ...
+    """
+    if start <= 0 or end <= start or steps_per_decade < 1:
+        raise ValueError("expected 0 < start < end and steps_per_decade >= 1")
+
+    bounds: List[float] = [start]
+    decade = start
+    while decade < end:
+        for i in range(1, steps_per_decade + 1):
+            bound = round(decade * 10 * i / steps_per_decade, 12)
+            if decade < bound < end:
+                bounds.append(bound)
+        decade *= 10
+    bounds.append(end)
+    return tuple(sorted(set(bounds)))
+
+
+class _Metric:
+    """
+    Shared sharding logic for metric types.
+
+    Every thread writes into its own dictionary keyed by label values, so
+    writers never block each other; readers snapshot each shard with a single
+    dict copy, which is atomic under the GIL. When a thread exits, its shard is
+    folded into the retired shard and dropped.
+    """
+
+    type_name = "untyped"
+
+    def __init__(self, *, name: str, documentation: str, label_names: Sequence[str]):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._local = threading.local()
+        self._retired: Dict[LabelValues, object] = {}
+        self._shards: List[Dict[LabelValues, object]] = [self._retired]
+        self._shards_lock = threading.Lock()
+
+    def _shard(self) -> Dict[LabelValues, object]:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = {}
+            with self._shards_lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            # thread-local values are released when their thread exits
+            self._local.exit_marker = marker = _ExitMarker()
+            weakref.finalize(marker, self._retire, shard)
+        return shard
+
+    def _retire(self, shard: Dict[LabelValues, object]) -> None:
+        with self._shards_lock:
+            self._fold(self._retired, shard)
+            # removed by identity, `list.remove` could drop an equal retired shard
+            self._shards = [other for other in self._shards if other is not shard]
+
+    def _fold(
+        self, into: Dict[LabelValues, object], shard: Dict[LabelValues, object]
+    ) -> None:
+        """Adds the series of `shard` to `into`."""
+        raise NotImplementedError
+
+    def _snapshots(self) -> List[Dict[LabelValues, object]]:
+        # copied under the lock so a shard being retired is never counted twice
+        with self._shards_lock:
+            return [shard.copy() for shard in self._shards]
+
+    def samples(self) -> Iterable[Tuple[str, LabelValues, Tuple[str, ...], float]]:
+        """Yields (sample name, label values, extra label pairs, value) tuples."""
+        raise NotImplementedError
+
+
+class _ExitMarker:
+    """Held only by a thread's `threading.local`, so it dies with the thread."""
+
+    __slots__ = ("__weakref__",)
+
+
+class Counter(_Metric):
+    """A monotonically increasing counter, partitioned by label values."""
+
+    type_name = "counter"
+
+    def inc(self, labels: LabelValues, amount: float = 1.0) -> None:
+        """
+        Increments the counter for the given label values.
+
+        Args:
+            labels: Label values in the order of `label_names`
+            amount: Non-negative amount to add
+        """
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0.0) + amount  # type: ignore[operator]
+
+    def _fold(
+        self, into: Dict[LabelValues, object], shard: Dict[LabelValues, object]
+    ) -> None:
+        for labels, value in shard.items():
+            into[labels] = into.get(labels, 0.0) + value  # type: ignore[operator]
+
+    def value(self, labels: LabelValues) -> float:
+        """Returns the current total for the given label values."""
+        return sum(
+            shard.get(labels, 0.0) for shard in self._snapshots()  # type: ignore[misc]
+        )
+
+    def samples(self) -> Iterable[Tuple[str, LabelValues, Tuple[str, ...], float]]:
+        totals: Dict[LabelValues, float] = {}
+        for shard in self._snapshots():
+            for labels, value in shard.items():
+                totals[labels] = totals.get(labels, 0.0) + value  # type: ignore[operator]
+        for labels in sorted(totals):
+            yield (self.name, labels, (), totals[labels])
+
+
+class Histogram(_Metric):
+    """
+    A fixed-bucket histogram, partitioned by label values.
+
+    Each series is stored as a flat list of per-bucket counts (the last slot
+    counting observations above the largest bound) followed by the running sum.
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(
+            name=name, documentation=documentation, label_names=label_names
+        )
+        self.buckets = tuple(sorted(buckets))
+        if not self.buckets:
+            raise ValueError("histogram requires at least one bucket")
+
+    def observe(self, labels: LabelValues, value: float) -> None:
+        """
+        Records a single observation for the given label values.
+
+        Args:
+            labels: Label values in the order of `label_names`
+            value: Observed value, e.g. a latency in seconds
+        """
+        shard = self._shard()
+        series = shard.get(labels)
+        if series is None:
+            series = [0.0] * (len(self.buckets) + 2)
+            shard[labels] = series
+        series[bisect.bisect_left(self.buckets, value)] += 1  # type: ignore[index]
+        series[-1] += value  # type: ignore[index]
+
+    def _fold(
+        self, into: Dict[LabelValues, object], shard: Dict[LabelValues, object]
+    ) -> None:
+        for labels, series in shard.items():
+            totals = cast(
+                List[float], into.get(labels, [0.0] * (len(self.buckets) + 2))
+            )
+            into[labels] = [
+                total + value for total, value in zip(totals, cast(List[float], series))
+            ]
+
+    def _merged(self) -> Dict[LabelValues, List[float]]:
+        merged: Dict[LabelValues, List[float]] = {}
+        for shard in self._snapshots():
+            for labels, series in shard.items():
+                totals = merged.setdefault(labels, [0.0] * (len(self.buckets) + 2))
+                for i, value in enumerate(cast(List[float], series)):
+                    totals[i] += value
+        return merged
+
+    def count(self, labels: LabelValues) -> float:
+        """Returns the number of observations for the given label values."""
+        series = self._merged().get(labels)
+        return sum(series[:-1]) if series else 0.0
+
+    def samples(self) -> Iterable[Tuple[str, LabelValues, Tuple[str, ...], float]]:
+        merged = self._merged()
+        for labels in sorted(merged):
+            series = merged[labels]
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                yield (
+                    f"{self.name}_bucket",
+                    labels,
+                    ("le", _format_value(bound)),
+                    cumulative,
+                )
+            cumulative += series[-2]
+            yield (f"{self.name}_bucket", labels, ("le", "+Inf"), cumulative)
+            yield (f"{self.name}_sum", labels, (), series[-1])
+            yield (f"{self.name}_count", labels, (), cumulative)
+
+
+class MetricsRegistry:
+    """
+    Collection of metrics recorded by a client.
+
+    Comes pre-populated with request counters and latency histograms labelled
+    by method, path template (e.g. `/payments/{id}`), status code and
+    merchant-id. Additional metrics can be registered with `counter` and
+    `histogram`.
+    """
+
+    def __init__(
+        self,
+        *,
+        namespace: str = "jpm",
+        latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        """
+        Initialize the registry with the standard request metrics.
+
+        Args:
+            namespace: Prefix applied to the standard metric names
+            latency_buckets: Upper bounds, in seconds, of the latency histogram buckets
+        """
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        self.requests = self.counter(
+            name=f"{namespace}_requests_total",
+            documentation="Total number of API requests.",
+            label_names=REQUEST_LABELS,
+        )
+        self.latency = self.histogram(
+            name=f"{namespace}_request_duration_seconds",
+            documentation="API request latency in seconds.",
+            label_names=REQUEST_LABELS,
+            buckets=latency_buckets,
+        )
+        self.request_validation_failures = self.counter(
+            name=f"{namespace}_request_validation_failures_total",
+            documentation="Sampled request bodies that failed full validation.",
+            label_names=("model",),
+        )
+        self.deduplicated_requests = self.counter(
+            name=f"{namespace}_deduplicated_requests_total",
+            documentation="Requests answered with the response of a duplicate.",
+            label_names=("method", "path", "merchant_id"),
+        )
+
+    def _register(self, metric: _Metric) -> None:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+
+    def counter(
+        self, *, name: str, documentation: str, label_names: Sequence[str] = ()
+    ) -> Counter:
+        """Registers and returns a new counter."""
+        metric = Counter(
+            name=name, documentation=documentation, label_names=label_names
+        )
+        self._register(metric)
+        return metric
+
+    def histogram(
+        self,
+        *,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Registers and returns a new histogram."""
+        metric = Histogram(
+            name=name,
+            documentation=documentation,
+            label_names=label_names,
+            buckets=buckets,
+        )
+        self._register(metric)
+        return metric
+
+    def metrics(self) -> List[_Metric]:
+        """Returns the registered metrics in registration order."""
+        with self._lock:
+            return list(self._metrics.values())
+
+    def observe_request(
+        self,
+        *,
+        method: str,
+        path: str,
+        status: str,
+        merchant_id: Optional[str],
+        duration: float,
+    ) -> None:
+        """
+        Records a completed API request in the standard request metrics.
+
+        Args:
+            method: HTTP method
+            path: Path template of the endpoint, e.g. `/payments/{id}`
+            status: Response status code, or `error` if no response was received
+            merchant_id: Value of the `merchant-id` header, if any
+            duration: Request latency in seconds
+        """
+        labels = (method, path, status, merchant_id or "")
+        self.requests.inc(labels)
+        self.latency.observe(labels, duration)
+
+    def observe_request_validation_failure(self, *, model: str) -> None:
+        """
+        Records a sampled request body that failed full validation.
+
+        Args:
+            model: Name of the serializer the request body failed to validate as
+        """
+        self.request_validation_failures.inc((model,))
+
+    def observe_deduplicated_request(
+        self, *, method: str, path: str, merchant_id: Optional[str]
+    ) -> None:
+        """
+        Records a request answered with the response of an earlier or in-flight
+        request with the same `merchant-id` and `request-id`.
+
+        Args:
+            method: HTTP method
+            path: Path template of the endpoint, e.g. `/payments/{id}`
+            merchant_id: Value of the `merchant-id` header, if any
+        """
+        self.deduplicated_requests.inc((method, path, merchant_id or ""))
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return f"{value:.1f}"
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render_prometheus(registry: MetricsRegistry) -> str:
+    """
+    Renders every metric in the registry in the Prometheus text exposition format.
+
+    The output can be served from any HTTP handler or written to a file for the
+    node exporter textfile collector; no server is started by this function.
+    """
+    lines: List[str] = []
+    for metric in registry.metrics():
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.type_name}")
+        for sample_name, labels, extra, value in metric.samples():
+            pairs = [
+                f'{name}="{_escape_label(label)}"'
+                for name, label in zip(metric.label_names, labels)
+            ]
+            if extra:
+                pairs.append(f'{extra[0]}="{extra[1]}"')
+            label_str = "{" + ",".join(pairs) + "}" if pairs else ""
+            lines.append(f"{sample_name}{label_str} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
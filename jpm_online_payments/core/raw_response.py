@@ -0,0 +1,64 @@
+from typing import Any, Callable, Generic, TypeVar
+
+from httpx._models import Headers
+
+T = TypeVar("T")
+
+_UNDECODED = object()
+
+
+class RawResponse(Generic[T]):
+    """
+    Represents an undecoded HTTP response.
+
+    Holds the original response bytes, status code and headers so they can be
+    forwarded unchanged. The body is decoded into the endpoint's response type only
+    when `parsed` or one of the response type's attributes is first accessed. Error
+    responses are returned as well; decoding one raises its `ApiError`.
+    """
+
+    __slots__ = ("content", "status_code", "headers", "_decode", "_parsed")
+
+    content: bytes
+    status_code: int
+    headers: Headers
+
+    def __init__(
+        self,
+        content: bytes,
+        status_code: int,
+        headers: Headers,
+        decode: Callable[[], T],
+    ) -> None:
+        """
+        Initialize a raw response.
+
+        `decode` is called at most once, on first access to the decoded value.
+        """
+        self.content = content
+        self.status_code = status_code
+        self.headers = headers
+        self._decode = decode
+        self._parsed: Any = _UNDECODED
+
+    @property
+    def parsed(self) -> T:
+        """
+        The response decoded into the endpoint's response type.
+
+        Raises:
+            ApiError: If the response status is not 2xx
+        """
+        if self._parsed is _UNDECODED:
+            self._parsed = self._decode()
+        return self._parsed
+
+    def __getattr__(self, name: str) -> Any:
+        # private and special names are never delegated, so probes by copy and
+        # pickle on an instance without slots set do not recurse through `parsed`
+        if name.startswith("_") or name == "parsed":
+            raise AttributeError(name)
+        return getattr(self.parsed, name)
+
+    def __repr__(self) -> str:
+        return f"RawResponse(status_code={self.status_code}, {len(self.content)} bytes)"
@@ -0,0 +1,35 @@
+from typing import Any, FrozenSet
+
+"""
+Redaction of card data from JSON bodies written to disk.
+"""
+
+REDACTED = "REDACTED"
+
+# card numbers, verification values, PIN blocks, network tokens and bank accounts,
+# along with OAuth2 access tokens
+REDACTED_FIELDS: FrozenSet[str] = frozenset(
+    {
+        "accountNumber",
+        "unmaskedAccountNumber",
+        "cvv",
+        "pinBlock",
+        "cardMagneticStripe",
+        "tokenNumber",
+        "tokenAuthenticationValue",
+        "internationalBankAccountNumber",
+        "access_token",
+    }
+)
+
+
+def redact(value: Any, fields: FrozenSet[str] = REDACTED_FIELDS) -> Any:
+    """Returns a copy of JSON data with the values of `fields` replaced."""
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if key in fields else redact(item, fields)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [redact(item, fields) for item in value]
+    return value
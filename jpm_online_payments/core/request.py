@@ -1,9 +1,25 @@
-from typing import Any, Dict, Type, Union, Sequence, List
+import json
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Type,
+    TypeVar,
+    Union,
+    Sequence,
+    List,
+    Tuple,
+    cast,
+)
 from urllib.parse import quote_plus
 import httpx
-from typing_extensions import TypedDict, Required, NotRequired
-from pydantic import TypeAdapter, BaseModel
+from typing_extensions import Literal, TypedDict, Required, NotRequired, final
+from pydantic import BaseModel, ValidationError, create_model
+from .deadline import Deadline
+from .structural import structural_encoder
 from .type_utils import NotGiven
+from .utils import get_type_adapter
 
 """
 Request configuration and utility functions for handling HTTP requests.
@@ -11,6 +27,10 @@ This module provides type definitions and helper functions for building
 and processing HTTP requests in a type-safe manner.
 """
 
+T = TypeVar("T")
+
+_PARTIAL_SERIALIZERS: Dict[Tuple[type, FrozenSet[str]], Type[BaseModel]] = {}
+
 # Type alias for query parameters that can handle both primitive data and sequences
 QueryParams = Dict[
     str, Union[httpx._types.PrimitiveData, Sequence[httpx._types.PrimitiveData]]
@@ -41,7 +61,16 @@ class RequestConfig(TypedDict):
     extensions: NotRequired[httpx._types.RequestExtensions]
 
 
-class RequestOptions(TypedDict):
+class _BaseRequestOptions(TypedDict):
+    """Request options shared by every decode mode, see `RequestOptions`."""
+
+    timeout: NotRequired[int]
+    additional_headers: NotRequired[Dict[str, str]]
+    additional_params: NotRequired[QueryParams]
+    deadline: NotRequired[Union[Deadline, float]]
+
+
+class RequestOptions(_BaseRequestOptions):
     """
     Additional options for customizing request behavior.
 
@@ -52,11 +81,56 @@ class RequestOptions(TypedDict):
         timeout: Number of seconds to await an API call before timing out
         additional_headers: Extra headers to include in the request
         additional_params: Extra query parameters to include in the request
+        decode: `model` (default) validates the response into its model, `view`
+            returns a read-only view that validates nested models on access and
+            `raw` returns the undecoded bytes, decoding only on first access
+        fields: Response model fields to decode into a projection model holding
+            only them, instead of the response model; not supported in `view` mode
+        deadline: `Deadline` shared by the call and its token acquisition, or a
+            number of seconds from the start of the call; the remaining budget
+            bounds every httpx timeout, and the call fails fast with
+            `DeadlineExceeded` once it is spent
     """
 
-    timeout: NotRequired[int]
-    additional_headers: NotRequired[Dict[str, str]]
-    additional_params: NotRequired[QueryParams]
+    decode: NotRequired[Literal["model", "view", "raw"]]
+    fields: NotRequired[List[str]]
+
+
+@final
+class ModelRequestOptions(_BaseRequestOptions):
+    """
+    Request options decoding the response into its model, typing the result as
+    the model. See `RequestOptions`.
+    """
+
+    decode: NotRequired[Literal["model"]]
+
+
+@final
+class ViewRequestOptions(_BaseRequestOptions):
+    """
+    Request options decoding the response into a `ModelView`, typing the result
+    as a view. See `RequestOptions`.
+    """
+
+    decode: Required[Literal["view"]]
+
+
+@final
+class RawRequestOptions(_BaseRequestOptions):
+    """
+    Request options returning the response undecoded, typing the result as a
+    `RawResponse` of the model. See `RequestOptions`.
+    """
+
+    decode: Required[Literal["raw"]]
+
+
+# request options accepted by API calls; the narrower types select the return
+# type of the overloads of resource methods
+AnyRequestOptions = Union[
+    RequestOptions, ModelRequestOptions, ViewRequestOptions, RawRequestOptions
+]
 
 
 def default_request_options() -> RequestOptions:
@@ -84,20 +158,201 @@ def model_dump(item: Any) -> Any:
         return item
 
 
+class FrozenFragment(Dict[str, Any]):
+    """
+    A request body fragment validated and encoded to JSON once by `freeze`.
+
+    It is a dictionary holding the original values, so it can be passed wherever
+    the fragment's params type is expected. When passed as a top-level field of a
+    request body, its pre-encoded JSON is spliced into the body instead of the
+    fragment being validated and serialized again. Fragments must not be modified
+    after freezing.
+
+    Attributes:
+        model: Serializer instance the fragment was validated into
+        encoded: JSON encoding of the fragment
+    """
+
+    __slots__ = ("model", "encoded")
+
+    model: BaseModel
+    encoded: bytes
+
+
+class JsonContent(bytes):
+    """A request body already encoded to JSON, sent as `application/json`."""
+
+
+def freeze(value: T, *, dump_with: Type[BaseModel]) -> T:
+    """
+    Validates and encodes a reusable request body fragment once.
+
+    Args:
+        value: Fragment params, e.g. a `params.Merchant`
+        dump_with: Serializer of the fragment's params, e.g.
+            `params._SerializerMerchant`
+
+    Returns:
+        A `FrozenFragment` typed as `value`
+
+    Raises:
+        pydantic.ValidationError: If `value` does not validate against `dump_with`
+    """
+    filtered_value = filter_not_given(value)
+    fragment = FrozenFragment(filtered_value)
+    fragment.model = dump_with.model_validate(filtered_value)
+    fragment.encoded = fragment.model.model_dump_json(
+        exclude_unset=True, by_alias=True
+    ).encode("utf-8")
+    return cast(T, fragment)
+
+
+def encode_json(value: Any) -> JsonContent:
+    """Encodes a request body the same way httpx encodes its `json` argument."""
+    return JsonContent(
+        json.dumps(
+            value, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode("utf-8")
+    )
+
+
+def _frozen_fields(item: Any, dump_with: Any) -> FrozenSet[str]:
+    """Returns the top-level fields of a model body holding frozen fragments."""
+    if not (
+        isinstance(item, dict)
+        and isinstance(dump_with, type)
+        and issubclass(dump_with, BaseModel)
+    ):
+        return frozenset()
+    fields = dump_with.model_fields
+    return frozenset(
+        name
+        for name, value in item.items()
+        if isinstance(value, FrozenFragment) and name in fields
+    )
+
+
+def _without_fields(
+    dump_with: Type[BaseModel], frozen: FrozenSet[str]
+) -> Type[BaseModel]:
+    """
+    Returns a serializer with the fields of `dump_with` except `frozen`, building
+    it only once per serializer and set of frozen fields.
+    """
+    key = (dump_with, frozen)
+    serializer = _PARTIAL_SERIALIZERS.get(key)
+    if serializer is None:
+        fields: Dict[str, Any] = {
+            name: (field.annotation, field)
+            for name, field in dump_with.model_fields.items()
+            if name not in frozen
+        }
+        serializer = create_model(
+            dump_with.__name__,
+            __config__=dump_with.model_config,
+            __module__=dump_with.__module__,
+            **fields,
+        )
+        _PARTIAL_SERIALIZERS[key] = serializer
+    return serializer
+
+
+def _splice_fragments(
+    *,
+    item: Dict[str, Any],
+    dump_with: Type[BaseModel],
+    frozen: FrozenSet[str],
+    filter_values: bool = True,
+    validate: bool = True,
+) -> JsonContent:
+    """
+    Validates and encodes `item` without its frozen fragments, which are neither
+    validated nor dumped again but spliced into the encoded body as their
+    pre-encoded JSON.
+    """
+    rest = {
+        name: value
+        for name, value in item.items()
+        if name not in frozen and not (filter_values and isinstance(value, NotGiven))
+    }
+    if validate:
+        serializer = _without_fields(dump_with, frozen)
+        if filter_values:
+            validated_item = validate_without_not_given(serializer.model_validate, rest)
+        else:
+            validated_item = serializer.model_validate(rest)
+        encoded = validated_item.model_dump_json(exclude_unset=True, by_alias=True)
+        body = encoded.encode("utf-8")
+    else:
+        body = encode_json(structural_encoder(dump_with)(rest))
+    fields = dump_with.model_fields
+    pieces = b",".join(
+        encode_json(fields[name].alias or name) + b":" + item[name].encoded
+        for name in frozen
+    )
+    if body == b"{}":
+        return JsonContent(b"{" + pieces + b"}")
+    return JsonContent(body[:-1] + b"," + pieces + b"}")
+
+
 def to_encodable(
-    *, item: Any, dump_with: Union[Type, Union[Type, Any], List[Type]]
+    *,
+    item: Any,
+    dump_with: Union[Type, Union[Type, Any], List[Type]],
+    validate: bool = True,
 ) -> Any:
     """
     Validates and converts an item to an encodable format using a specified type.
     Uses Pydantic's TypeAdapter for validation and converts the result
     to a format suitable for encoding in requests.
+
+    When top-level fields of a model body are `FrozenFragment`s, the body is
+    returned as `JsonContent` with the fragments' pre-encoded JSON spliced in.
+    With `validate=False` the item is only mapped to aliases and stripped of
+    `NOT_GIVEN` values, without checking its values.
     """
-    filtered_item = filter_not_given(item)
-    adapter: TypeAdapter = TypeAdapter(dump_with)
-    validated_item = adapter.validate_python(filtered_item)
+    frozen = _frozen_fields(item, dump_with)
+    if frozen:
+        return _splice_fragments(
+            item=item,
+            dump_with=cast(Type[BaseModel], dump_with),
+            frozen=frozen,
+            validate=validate,
+        )
+    if not validate:
+        return structural_encoder(dump_with)(item)
+    adapter = get_type_adapter(dump_with)
+    validated_item = validate_without_not_given(adapter.validate_python, item)
     return model_dump(validated_item)
 
 
+def encode_payload(
+    *, payload: Any, dump_with: Type[BaseModel], validate: bool = True
+) -> Any:
+    """
+    Validates and converts a complete request body built by the caller.
+
+    Unlike `to_encodable`, the payload is expected to hold only the fields to send,
+    so it is validated directly without searching it for `NOT_GIVEN` values.
+    Bytes are taken as an already encoded JSON body and sent without validation.
+    With `validate=False` the payload is only mapped to aliases.
+    """
+    if isinstance(payload, (bytes, bytearray)):
+        return payload if isinstance(payload, JsonContent) else JsonContent(payload)
+    frozen = _frozen_fields(payload, dump_with)
+    if frozen:
+        return _splice_fragments(
+            item=payload,
+            dump_with=dump_with,
+            frozen=frozen,
+            filter_values=False,
+            validate=validate,
+        )
+    if not validate:
+        return structural_encoder(dump_with)(payload)
+    return model_dump(get_type_adapter(dump_with).validate_python(payload))
+
+
 def to_content(*, file: httpx._types.FileTypes) -> httpx._types.RequestContent:
     """
     Converts the various ways files can be provided to something that is accepted by
@@ -149,6 +404,45 @@ def filter_not_given(value: Any) -> Any:
     return value
 
 
+def _contains_not_given(value: Any) -> bool:
+    """Helper function to recursively search for NotGiven values"""
+    if isinstance(value, NotGiven):
+        return True
+    elif isinstance(value, dict):
+        return any(_contains_not_given(v) for v in value.values())
+    elif isinstance(value, (list, tuple)):
+        return any(_contains_not_given(item) for item in value)
+    return False
+
+
+def validate_without_not_given(validate: Callable[[Any], T], item: Any) -> T:
+    """
+    Validates an item with NotGiven values treated as absent.
+
+    Generated methods only leave NotGiven values at the top level of a request
+    body, so only that level is filtered, without copying the nested structure.
+    NotGiven values nested deeper fail validation, in which case the item is
+    filtered recursively and validated again.
+
+    Args:
+        validate: Validation function, e.g. `TypeAdapter.validate_python`
+        item: Item to validate
+    """
+    filtered_item: Any
+    if isinstance(item, dict):
+        filtered_item = {k: v for k, v in item.items() if not isinstance(v, NotGiven)}
+    elif isinstance(item, (list, tuple)):
+        filtered_item = type(item)(v for v in item if not isinstance(v, NotGiven))
+    else:
+        filtered_item = item
+    try:
+        return validate(filtered_item)
+    except ValidationError:
+        if not _contains_not_given(filtered_item):
+            raise
+    return validate(filter_not_given(filtered_item))
+
+
 def _get_default_for_type(value_type: Any) -> Any:
     """Helper to provide appropriate default values for required fields"""
     if value_type is dict or isinstance(value_type, dict):
@@ -1,13 +1,24 @@
+import asyncio
 import json
-from typing import Any, Union, Dict, Type, TypeVar, List, Generic, Optional
+import warnings
+from typing import Any, Union, Dict, Type, TypeVar, List, Generic, Optional, Set
 from pydantic import BaseModel
 import httpx
 
+from .utils import get_type_adapter
+
 """
 Provides functionality for handling Server-Sent Events (SSE) streams and response data encoding.
 Includes utilities for both synchronous and asynchronous stream processing.
+
+A stream holds a pooled connection until it is closed: when iteration is exhausted
+or fails, when its `with` block exits, or when `close()` is called. A stream dropped
+while still open is closed when it is garbage collected, with a `ResourceWarning`.
 """
 
+# closes of abandoned async streams, referenced until they finish
+_pending_closes: Set["asyncio.Task[Any]"] = set()
+
 EncodableT = TypeVar(
     "EncodableT",
     bound=Union[
@@ -27,15 +38,10 @@ def from_encodable(*, data: Any, load_with: Type[EncodableT]) -> Any:
     """
     Converts raw data into a specified type using Pydantic validation.
 
-    Uses a dynamic Pydantic model to validate and convert incoming data
-    into the specified target type.
+    Uses a TypeAdapter, cached per target type, to validate and convert
+    incoming data into the specified target type.
     """
-
-    class Caster(BaseModel):
-        data: load_with  # type: ignore
-
-    print(data)
-    return Caster(data=data).data
+    return get_type_adapter(load_with).validate_python(data)
 
 
 T = TypeVar("T")
@@ -47,7 +53,14 @@ class StreamResponse(Generic[T]):
 
     Processes a streaming HTTP response by buffering chunks of data
     and parsing them according to SSE format, converting each event
-    into the specified type.
+    into the specified type. Use it as a context manager, or call
+    `close()`, to release the connection when not reading to the end.
+
+    ```py
+    with client.stream_request(...) as events:
+        for event in events:
+            ...
+    ```
     """
 
     def __init__(self, response: httpx.Response, stream_context, cast_to: Type[T]):
@@ -65,6 +78,30 @@ class StreamResponse(Generic[T]):
         self.iterator = response.iter_bytes()
         self.buffer = bytearray()
         self.position = 0
+        self.closed = False
+
+    def __enter__(self) -> "StreamResponse[T]":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the response, returning its connection to the pool."""
+        if not self.closed:
+            self.closed = True
+            self._context.__exit__(None, None, None)
+
+    def __del__(self) -> None:
+        if getattr(self, "closed", True):
+            return
+        warnings.warn(
+            f"unclosed stream of {self.response.request.url}", ResourceWarning
+        )
+        try:
+            self.close()
+        except Exception:
+            pass
 
     def __iter__(self):
         """Enables iteration over the stream events."""
@@ -78,8 +115,10 @@ class StreamResponse(Generic[T]):
         converting each complete event into the specified type.
 
         Raises:
-            StopIteration: When the stream is exhausted
+            StopIteration: When the stream is exhausted or closed
         """
+        if self.closed:
+            raise StopIteration
         try:
             while True:
                 event = self._process_buffer()
@@ -90,10 +129,13 @@ class StreamResponse(Generic[T]):
                 self.buffer += chunk
 
         except StopIteration:
+            self.close()
             event = self._process_buffer(final=True)
             if event:
                 return event
-            self._context.__exit__(None, None, None)
+            raise
+        except BaseException:
+            self.close()
             raise
 
     def _process_buffer(self, final=False) -> Optional[T]:
@@ -175,7 +217,9 @@ class AsyncStreamResponse(Generic[T]):
     Handles asynchronous streaming of Server-Sent Events (SSE).
 
     Asynchronous version of StreamResponse, providing the same functionality
-    but compatible with async/await syntax.
+    but compatible with async/await syntax. Use it as an async context
+    manager, or call `aclose()`, to release the connection when not reading
+    to the end.
     """
 
     def __init__(self, response: httpx.Response, stream_context, cast_to: Type[T]):
@@ -193,6 +237,42 @@ class AsyncStreamResponse(Generic[T]):
         self.iterator = response.aiter_bytes()
         self.buffer = bytearray()
         self.position = 0
+        self.closed = False
+        self._loop = asyncio.get_running_loop()
+
+    async def __aenter__(self) -> "AsyncStreamResponse[T]":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Closes the response, returning its connection to the pool."""
+        if not self.closed:
+            self.closed = True
+            await self._context.__aexit__(None, None, None)
+
+    def __del__(self) -> None:
+        if getattr(self, "closed", True):
+            return
+        warnings.warn(
+            f"unclosed stream of {self.response.request.url}", ResourceWarning
+        )
+        # the close has to run on the loop the stream belongs to
+        self.closed = True
+        context, loop = self._context, self._loop
+        if loop.is_closed():
+            return
+
+        def schedule() -> None:
+            task = loop.create_task(context.__aexit__(None, None, None))
+            _pending_closes.add(task)
+            task.add_done_callback(_pending_closes.discard)
+
+        try:
+            loop.call_soon_threadsafe(schedule)
+        except RuntimeError:
+            pass
 
     def __aiter__(self):
         """Enables async iteration over the stream events."""
@@ -206,8 +286,10 @@ class AsyncStreamResponse(Generic[T]):
         iteration and context management.
 
         Raises:
-            StopAsyncIteration: When the stream is exhausted
+            StopAsyncIteration: When the stream is exhausted or closed
         """
+        if self.closed:
+            raise StopAsyncIteration
         try:
             while True:
                 event = self._process_buffer()
@@ -218,10 +300,13 @@ class AsyncStreamResponse(Generic[T]):
                 self.buffer += chunk
 
         except StopAsyncIteration:
+            await self.aclose()
             event = self._process_buffer(final=True)
             if event:
                 return event
-            await self._context.__aexit__(None, None, None)
+            raise
+        except BaseException:
+            await self.aclose()
             raise
 
     def _process_buffer(self, final=False) -> Optional[T]:
@@ -0,0 +1,129 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import typing_extensions
+from pydantic import BaseModel
+
+from .type_utils import NotGiven
+from .utils import get_type_adapter
+
+"""
+Non-validating encoding of request bodies.
+
+Used by the `structural` and `sampled` request validation modes. An encoder is
+derived once per serializer type; it maps field names to their aliases, drops
+`NOT_GIVEN` values and recurses into nested models and lists, but does not check
+the values themselves, so request bodies are expected to come from already
+validated data. The output matches the serializer's
+`model_dump(exclude_unset=True, by_alias=True)` for valid input.
+"""
+
+Encoder = Callable[[Any], Any]
+
+
+class RequestValidationWarning(UserWarning):
+    """
+    Emitted when a request body sampled for full validation in `sampled` mode fails
+    to validate, which indicates the caller sends data the models do not accept.
+    """
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _list_encoder(encode_item: Optional[Encoder]) -> Encoder:
+    def encode(value: Any) -> Any:
+        if not isinstance(value, (list, tuple)):
+            return value
+        if encode_item is None:
+            return [item for item in value if not isinstance(item, NotGiven)]
+        return [encode_item(item) for item in value if not isinstance(item, NotGiven)]
+
+    return encode
+
+
+def _validating_encoder(annotation: Any) -> Encoder:
+    adapter = get_type_adapter(annotation)
+
+    def encode(value: Any) -> Any:
+        return adapter.dump_python(
+            adapter.validate_python(value), exclude_unset=True, by_alias=True
+        )
+
+    return encode
+
+
+def _model_encoder(model: Any) -> Encoder:
+    encoder = _MODEL_ENCODERS.get(model)
+    if encoder is not None:
+        return encoder
+
+    # filled after registering the encoder so self-referencing models terminate
+    fields: Dict[str, Tuple[str, Optional[Encoder]]] = {}
+    keep_extra = model.model_config.get("extra") == "allow"
+
+    def encode(value: Any) -> Any:
+        if isinstance(value, BaseModel):
+            return value.model_dump(exclude_unset=True, by_alias=True)
+        if not isinstance(value, dict):
+            return value
+        encoded = {}
+        for key, item in value.items():
+            if isinstance(item, NotGiven):
+                continue
+            field = fields.get(key)
+            if field is None:
+                if keep_extra:
+                    encoded[key] = item
+                continue
+            alias, encode_field = field
+            encoded[alias] = item if encode_field is None else encode_field(item)
+        return encoded
+
+    _MODEL_ENCODERS[model] = encode
+    for name, field_info in model.model_fields.items():
+        entry = (field_info.alias or name, _encoder(field_info.annotation))
+        fields[name] = entry
+        fields[entry[0]] = entry
+    return encode
+
+
+def _encoder(annotation: Any) -> Optional[Encoder]:
+    """Returns the encoder for `annotation`, or None if values are kept as is."""
+    origin = typing_extensions.get_origin(annotation)
+    args = typing_extensions.get_args(annotation)
+
+    if origin is Union:
+        members = [arg for arg in args if arg is not type(None)]
+        if len(members) == 1:
+            return _encoder(members[0])
+        if any(_encoder(member) is not None for member in members):
+            # which model applies is only known after validating the value
+            return _validating_encoder(annotation)
+        return None
+    if origin in (list, List) and args:
+        return _list_encoder(_encoder(args[0]))
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _model_encoder(annotation)
+    return None
+
+
+_MODEL_ENCODERS: Dict[Any, Encoder] = {}
+_ENCODERS: Dict[Any, Encoder] = {}
+
+
+def structural_encoder(annotation: Any) -> Encoder:
+    """
+    Returns the non-validating encoder for `annotation`, building it once per type.
+
+    Unions of several models cannot be told apart without validation, so values
+    of such fields are validated.
+
+    Args:
+        annotation: Request body serializer type, e.g. `params._SerializerPayment`
+    """
+    encoder = _ENCODERS.get(annotation)
+    if encoder is None:
+        encoder = _encoder(annotation) or _identity
+        _ENCODERS[annotation] = encoder
+    return encoder
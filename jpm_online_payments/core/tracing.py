@@ -0,0 +1,250 @@
+import abc
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+"""
+Tracing hooks for API calls made through the base clients.
+
+A `Tracer` creates one `Span` per API call. Spans carry the endpoint template,
+merchant-id, request-id and response status, and inject context propagation
+headers into the outgoing request. Tracing is disabled unless a tracer is
+passed to the client.
+"""
+
+
+class Span(abc.ABC):
+    """
+    Abstract base class for a single traced API call.
+    """
+
+    @abc.abstractmethod
+    def set_attribute(self, key: str, value: Any) -> None:
+        """
+        Sets an attribute on the span.
+
+        Args:
+            key: Attribute name
+            value: Attribute value
+        """
+
+    @abc.abstractmethod
+    def inject(self, headers: Dict[str, str]) -> None:
+        """
+        Adds context propagation headers for this span to an outgoing request.
+
+        Args:
+            headers: Request headers to modify in place
+        """
+
+    @abc.abstractmethod
+    def end(self, *, error: Optional[BaseException] = None) -> None:
+        """
+        Finishes the span.
+
+        Args:
+            error: Exception raised by the call, if it failed
+        """
+
+
+class Tracer(abc.ABC):
+    """
+    Abstract base class for tracers that create a span per API call.
+    """
+
+    @abc.abstractmethod
+    def start_span(self, name: str, attributes: Dict[str, Any]) -> Span:
+        """
+        Starts a span for an API call.
+
+        Args:
+            name: Span name, e.g. `POST /payments/{id}/captures`
+            attributes: Initial span attributes
+
+        Returns:
+            The started span
+        """
+
+
+class FinishedSpan:
+    """
+    Immutable record of a span collected by the `InMemorySpanExporter`.
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    attributes: Dict[str, Any]
+    start_time: float
+    end_time: float
+    error: Optional[BaseException]
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        trace_id: str,
+        span_id: str,
+        attributes: Dict[str, Any],
+        start_time: float,
+        end_time: float,
+        error: Optional[BaseException],
+    ) -> None:
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.attributes = attributes
+        self.start_time = start_time
+        self.end_time = end_time
+        self.error = error
+
+    @property
+    def duration(self) -> float:
+        """Span duration in seconds."""
+        return self.end_time - self.start_time
+
+    def __repr__(self) -> str:
+        return f"FinishedSpan(name={self.name!r}, attributes={self.attributes!r})"
+
+
+class InMemorySpanExporter:
+    """
+    Collects finished spans in memory, intended for tests.
+    """
+
+    def __init__(self) -> None:
+        self._spans: List[FinishedSpan] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: FinishedSpan) -> None:
+        """Stores a finished span."""
+        with self._lock:
+            self._spans.append(span)
+
+    def get_finished_spans(self) -> List[FinishedSpan]:
+        """Returns a copy of all spans collected so far."""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        """Discards all collected spans."""
+        with self._lock:
+            self._spans.clear()
+
+
+class _InMemorySpan(Span):
+    def __init__(
+        self, *, name: str, attributes: Dict[str, Any], exporter: InMemorySpanExporter
+    ) -> None:
+        self._name = name
+        self._attributes = dict(attributes)
+        self._exporter = exporter
+        self._trace_id = os.urandom(16).hex()
+        self._span_id = os.urandom(8).hex()
+        self._start_time = time.time()
+        self._ended = False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self._attributes[key] = value
+
+    def inject(self, headers: Dict[str, str]) -> None:
+        headers["traceparent"] = f"00-{self._trace_id}-{self._span_id}-01"
+
+    def end(self, *, error: Optional[BaseException] = None) -> None:
+        if self._ended:
+            return
+        self._ended = True
+        self._exporter.export(
+            FinishedSpan(
+                name=self._name,
+                trace_id=self._trace_id,
+                span_id=self._span_id,
+                attributes=self._attributes,
+                start_time=self._start_time,
+                end_time=time.time(),
+                error=error,
+            )
+        )
+
+
+class InMemoryTracer(Tracer):
+    """
+    Tracer recording spans into an `InMemorySpanExporter`.
+
+    Propagates context using the W3C `traceparent` header.
+    """
+
+    def __init__(self, exporter: Optional[InMemorySpanExporter] = None) -> None:
+        """
+        Initialize the tracer.
+
+        Args:
+            exporter: Exporter receiving finished spans; a new one is created if omitted
+        """
+        self.exporter = exporter or InMemorySpanExporter()
+
+    def start_span(self, name: str, attributes: Dict[str, Any]) -> Span:
+        return _InMemorySpan(name=name, attributes=attributes, exporter=self.exporter)
+
+
+class _OpenTelemetrySpan(Span):
+    def __init__(self, span: Any, trace_api: Any, propagate_api: Any) -> None:
+        self._span = span
+        self._trace = trace_api
+        self._propagate = propagate_api
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self._span.set_attribute(key, value)
+
+    def inject(self, headers: Dict[str, str]) -> None:
+        self._propagate.inject(
+            headers, context=self._trace.set_span_in_context(self._span)
+        )
+
+    def end(self, *, error: Optional[BaseException] = None) -> None:
+        if error is not None:
+            self._span.record_exception(error)
+            self._span.set_status(
+                self._trace.Status(self._trace.StatusCode.ERROR, str(error))
+            )
+        self._span.end()
+
+
+class OpenTelemetryTracer(Tracer):
+    """
+    Adapter exporting spans through OpenTelemetry.
+
+    Requires the `opentelemetry-api` package. Spans are created as CLIENT spans
+    under the current OpenTelemetry context and propagated with the globally
+    configured propagator.
+    """
+
+    def __init__(self, tracer_provider: Optional[Any] = None) -> None:
+        """
+        Initialize the adapter.
+
+        Args:
+            tracer_provider: OpenTelemetry tracer provider; the global provider is used if omitted
+
+        Raises:
+            ImportError: If `opentelemetry-api` is not installed
+        """
+        try:
+            from opentelemetry import propagate, trace
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetryTracer requires the `opentelemetry-api` package"
+            ) from e
+
+        self._trace = trace
+        self._propagate = propagate
+        self._tracer = trace.get_tracer(
+            "jpm_online_payments", tracer_provider=tracer_provider
+        )
+
+    def start_span(self, name: str, attributes: Dict[str, Any]) -> Span:
+        span = self._tracer.start_span(
+            name, kind=self._trace.SpanKind.CLIENT, attributes=attributes
+        )
+        return _OpenTelemetrySpan(span, self._trace, self._propagate)
@@ -1,5 +1,22 @@
 import typing
 import httpx
+from pydantic import TypeAdapter
+
+_BINARY_CONTENT_TYPES = (
+    "application/octet-stream",
+    "application/pdf",
+    "application/zip",
+    "image/",
+    "audio/",
+    "video/",
+    "application/msword",
+    "application/vnd.openxmlformats-officedocument",
+    "application/x-binary",
+    "application/vnd.ms-excel",
+    "application/vnd.ms-powerpoint",
+)
+
+_TYPE_ADAPTERS: typing.Dict[typing.Any, TypeAdapter] = {}
 
 
 def remove_none_from_dict(
@@ -14,25 +31,26 @@ def remove_none_from_dict(
 
 def is_binary_content_type(content_type: str) -> bool:
     """Check if the content type indicates binary data."""
-    binary_types = [
-        "application/octet-stream",
-        "application/pdf",
-        "application/zip",
-        "image/",
-        "audio/",
-        "video/",
-        "application/msword",
-        "application/vnd.openxmlformats-officedocument",
-        "application/x-binary",
-        "application/vnd.ms-excel",
-        "application/vnd.ms-powerpoint",
-    ]
-    return any(binary_type in content_type for binary_type in binary_types)
+    return any(binary_type in content_type for binary_type in _BINARY_CONTENT_TYPES)
 
 
 def get_content_type(headers: httpx.Headers) -> str:
     """Get content type in a case-insensitive manner."""
-    for key, value in headers.items():
-        if key.lower() == "content-type":
-            return value.lower()
-    return ""
+    return headers.get("content-type", "").lower()
+
+
+def get_type_adapter(tp: typing.Any) -> TypeAdapter:
+    """
+    Returns a pydantic TypeAdapter for `tp`, building it only once per type.
+
+    Building an adapter compiles a validator and serializer, which costs far more
+    than using one. Unhashable type expressions are not cached.
+    """
+    try:
+        adapter = _TYPE_ADAPTERS.get(tp)
+    except TypeError:
+        return TypeAdapter(tp)
+    if adapter is None:
+        adapter = TypeAdapter(tp)
+        _TYPE_ADAPTERS[tp] = adapter
+    return adapter
@@ -0,0 +1,137 @@
+from typing import Any, Dict, Optional, Type, Union
+
+import typing_extensions
+from pydantic import BaseModel
+
+from .utils import get_type_adapter
+
+"""
+Read-only views over decoded JSON responses.
+
+A view exposes the same attribute names as the response model but keeps the parsed
+JSON as is. Scalar fields (`str`, `int`, `bool`, literals) are returned without
+validation, and nested models are validated only when first accessed, so reading a
+handful of fields from a large response costs little more than `json.loads`.
+Call `to_model()` for a fully validated model.
+"""
+
+_SCALAR_TYPES = (str, int, bool)
+_MISSING = object()
+
+
+def _is_scalar(annotation: Any) -> bool:
+    origin = typing_extensions.get_origin(annotation)
+    if origin is Union:
+        return all(
+            arg is type(None) or _is_scalar(arg)
+            for arg in typing_extensions.get_args(annotation)
+        )
+    if origin is typing_extensions.Literal:
+        return True
+    return annotation in _SCALAR_TYPES
+
+
+class ModelView:
+    """
+    Base class of the read-only views built by `view_class`.
+
+    Attributes:
+        model: Response model this view mirrors
+    """
+
+    __slots__ = ("_data", "_cache")
+
+    model: Type[BaseModel]
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        """
+        Args:
+            data: Parsed JSON object, keyed by the model's aliases
+        """
+        self._data = data
+        self._cache: Optional[Dict[str, Any]] = None
+
+    def to_model(self) -> Any:
+        """Validates the underlying data into the full response model."""
+        return self.model.model_validate(self._data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the underlying parsed JSON."""
+        return self._data
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._data == other._data  # type: ignore[attr-defined]
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+
+def _scalar_property(name: str, alias: str, default: Any) -> property:
+    def get(self: ModelView) -> Any:
+        value = self._data.get(alias, _MISSING)
+        if value is _MISSING:
+            if default is _MISSING:
+                raise AttributeError(f"required field {name!r} is missing")
+            return default
+        return value
+
+    return property(get)
+
+
+def _nested_property(name: str, alias: str, default: Any, annotation: Any) -> property:
+    def get(self: ModelView) -> Any:
+        cache = self._cache
+        if cache is None:
+            cache = self._cache = {}
+        elif name in cache:
+            return cache[name]
+        value = self._data.get(alias, _MISSING)
+        if value is _MISSING:
+            if default is _MISSING:
+                raise AttributeError(f"required field {name!r} is missing")
+            return default
+        value = get_type_adapter(annotation).validate_python(value)
+        cache[name] = value
+        return value
+
+    return property(get)
+
+
+_VIEW_CLASSES: Dict[Type[BaseModel], Type[ModelView]] = {}
+
+
+def view_class(model: Type[BaseModel]) -> Type[ModelView]:
+    """
+    Returns the view class mirroring `model`, building it once per model.
+
+    Args:
+        model: Pydantic response model
+    """
+    cls = _VIEW_CLASSES.get(model)
+    if cls is not None:
+        return cls
+
+    namespace: Dict[str, Any] = {"__slots__": (), "model": model}
+    for name, field in model.model_fields.items():
+        alias = field.alias or name
+        if field.is_required():
+            default = _MISSING
+        else:
+            default = field.get_default(call_default_factory=True)
+        if _is_scalar(field.annotation):
+            namespace[name] = _scalar_property(name, alias, default)
+        else:
+            namespace[name] = _nested_property(name, alias, default, field.annotation)
+    cls = type(f"{model.__name__}View", (ModelView,), namespace)
+    _VIEW_CLASSES[model] = cls
+    return cls
+
+
+def is_viewable(cast_to: Any) -> bool:
+    """Checks whether responses of type `cast_to` can be decoded into a view."""
+    return isinstance(cast_to, type) and issubclass(cast_to, BaseModel)
+
@@ -0,0 +1,4 @@
+from .runner import LatencyRecorder, LoadTest, format_report, parse_mix, run
+
+
+__all__ = ["LatencyRecorder", "LoadTest", "format_report", "parse_mix", "run"]
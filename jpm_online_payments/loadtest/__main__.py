@@ -0,0 +1,135 @@
+import argparse
+import asyncio
+import json
+import os
+import shlex
+import subprocess
+import sys
+from typing import List, Optional
+
+import httpx
+
+from jpm_online_payments.client import AsyncClient
+
+from .runner import LoadTest, format_report, parse_mix, run
+
+
+def _spawn_gateway(args: List[str]) -> "tuple[subprocess.Popen, str, str]":
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "jpm_online_payments.mock_gateway",
+            "--port",
+            "0",
+            *args,
+        ],
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    assert process.stderr is not None
+    base_url = process.stderr.readline().split(":", 1)[1].strip()
+    token_url = process.stderr.readline().split(":", 1)[1].strip()
+    return process, base_url, token_url
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m jpm_online_payments.loadtest",
+        description="Drive AsyncClient with a mix of payment operations.",
+    )
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--rate", type=float, help="open-loop target rate in requests/s")
+    mode.add_argument("--concurrency", type=int, help="closed-loop concurrent workers")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds")
+    parser.add_argument(
+        "--mix",
+        default="create=60,patch=10,refund=10,get=20",
+        help="relative weights of create, patch, refund and get operations",
+    )
+    parser.add_argument(
+        "--base-url", help="API base URL, e.g. http://127.0.0.1:8080/api/v2"
+    )
+    parser.add_argument("--token-url", help="OAuth2 token URL")
+    parser.add_argument("--client-id", default=os.getenv("OAUTH_CLIENT_ID", "loadtest"))
+    parser.add_argument(
+        "--client-secret", default=os.getenv("OAUTH_CLIENT_SECRET", "loadtest")
+    )
+    parser.add_argument("--merchant-id", default="991234567890")
+    parser.add_argument("--max-in-flight", type=int, default=1000)
+    parser.add_argument("--max-connections", type=int, default=100)
+    parser.add_argument(
+        "--prime", type=int, default=20, help="payments created before the run"
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--spawn-gateway",
+        action="store_true",
+        help="start a local mock_gateway subprocess on a free port",
+    )
+    parser.add_argument(
+        "--gateway-args",
+        default="",
+        help="arguments for the spawned gateway, e.g. '--latency lognormal:20,0.5'",
+    )
+    parser.add_argument("-o", "--output", help="write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    gateway = None
+    base_url, token_url = args.base_url, args.token_url
+    if args.spawn_gateway:
+        gateway, base_url, token_url = _spawn_gateway(shlex.split(args.gateway_args))
+    if base_url is None:
+        parser.error("--base-url or --spawn-gateway is required")
+
+    async def execute() -> dict:
+        limits = httpx.Limits(
+            max_connections=args.max_connections,
+            max_keepalive_connections=args.max_connections,
+        )
+        async with httpx.AsyncClient(limits=limits, timeout=60) as httpx_client:
+            client_kwargs = {"token_url": token_url} if token_url else {}
+            credentials = {
+                "client_id": args.client_id,
+                "client_secret": args.client_secret,
+            }
+            client = AsyncClient(
+                base_url=base_url,
+                httpx_client=httpx_client,
+                auth=credentials,  # type: ignore[arg-type]
+                **client_kwargs,
+            )
+            test = LoadTest(
+                client=client,
+                merchant_id=args.merchant_id,
+                mix=parse_mix(args.mix),
+                seed=args.seed,
+            )
+            return await run(
+                test,
+                duration=args.duration,
+                rate=args.rate,
+                concurrency=args.concurrency,
+                max_in_flight=args.max_in_flight,
+                prime=args.prime,
+            )
+
+    try:
+        report = asyncio.run(execute())
+    finally:
+        if gateway is not None:
+            gateway.terminate()
+            gateway.wait()
+
+    print(format_report(report), file=sys.stderr)
+    encoded = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(encoded)
+    else:
+        print(encoded)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
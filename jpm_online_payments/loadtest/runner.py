@@ -0,0 +1,336 @@
+import array
+import asyncio
+import collections
+import random
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from jpm_online_payments.client import AsyncClient
+from jpm_online_payments.core import ApiError
+
+"""
+Load generator driving `AsyncClient` with a weighted mix of operations.
+
+Open-loop mode issues requests on a fixed schedule regardless of how long
+earlier requests take, and measures latency from each request's intended start
+time so queueing delay is not hidden (coordinated omission correction).
+Closed-loop mode runs a fixed number of concurrent workers back to back.
+"""
+
+OPERATIONS = ("create", "patch", "refund", "get")
+
+DEFAULT_MERCHANT: Dict[str, Any] = {
+    "merchant_software": {
+        "company_name": "Payment Company",
+        "product_name": "Load Test",
+    }
+}
+
+DEFAULT_PAYMENT_METHOD: Dict[str, Any] = {
+    "card": {"account_number": "4012000033330026", "expiry": {"month": 5, "year": 2030}}
+}
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """
+    Parses an operation mix such as `create=70,patch=10,refund=10,get=10`.
+
+    Weights are relative and need not sum to 100.
+    """
+    mix: Dict[str, float] = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise ValueError(
+                f"unknown operation {name!r}, expected one of {OPERATIONS}"
+            )
+        mix[name] = float(weight or 1)
+    if not mix or sum(mix.values()) <= 0:
+        raise ValueError("operation mix must have a positive total weight")
+    return mix
+
+
+class LatencyRecorder:
+    """Compact latency store reporting exact percentiles."""
+
+    def __init__(self) -> None:
+        self._values = array.array("d")
+
+    def record(self, seconds: float) -> None:
+        self._values.append(seconds)
+
+    def extend(self, other: "LatencyRecorder") -> None:
+        self._values.extend(other._values)
+
+    def clear(self) -> None:
+        self._values = array.array("d")
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def summary(self) -> Dict[str, float]:
+        """Returns count, mean and percentile latencies in milliseconds."""
+        values = sorted(self._values)
+        if not values:
+            return {"count": 0}
+
+        def pct(p: float) -> float:
+            return values[min(len(values) - 1, int(p / 100 * len(values)))] * 1000
+
+        return {
+            "count": len(values),
+            "mean_ms": sum(values) / len(values) * 1000,
+            "p50_ms": pct(50),
+            "p90_ms": pct(90),
+            "p99_ms": pct(99),
+            "p999_ms": pct(99.9),
+            "max_ms": values[-1] * 1000,
+        }
+
+
+class LoadTest:
+    """
+    Drives a configurable mix of operations against a client.
+
+    Attributes:
+        client: Client under test
+        merchant_id: Merchant account used for every request
+        mix: Relative operation weights keyed by operation name
+    """
+
+    def __init__(
+        self,
+        *,
+        client: AsyncClient,
+        merchant_id: str,
+        mix: Dict[str, float],
+        amount: int = 1234,
+        currency: str = "USD",
+        seed: Optional[int] = None,
+    ) -> None:
+        self.client = client
+        self.merchant_id = merchant_id
+        self.mix = mix
+        self.amount = amount
+        self.currency = currency
+        self._rng = random.Random(seed)
+        self._operations: List[str] = list(mix)
+        self._weights: List[float] = [mix[op] for op in self._operations]
+        self._transactions: Deque[str] = collections.deque(maxlen=10_000)
+        self.latency: Dict[str, LatencyRecorder] = {
+            op: LatencyRecorder() for op in self._operations
+        }
+        self.service_time: Dict[str, LatencyRecorder] = {
+            op: LatencyRecorder() for op in self._operations
+        }
+        self.outcomes: Dict[str, Dict[str, int]] = {
+            op: collections.Counter() for op in self._operations
+        }
+
+    def _operation(self, name: str) -> Callable[[], Awaitable[Any]]:
+        request_id = str(uuid.uuid4())
+        if name == "create" or not self._transactions:
+            return lambda: self._create(request_id)
+        transaction_id = self._rng.choice(self._transactions)
+        if name == "patch":
+            return lambda: self.client.payments.patch(
+                id=transaction_id,
+                merchant_id=self.merchant_id,
+                request_id=request_id,
+                capture_method="NOW",
+            )
+        if name == "refund":
+            return lambda: self.client.refunds.create(  # type: ignore[call-overload]
+                merchant=DEFAULT_MERCHANT,
+                merchant_id=self.merchant_id,
+                request_id=request_id,
+                amount=self.amount,
+                currency=self.currency,
+                payment_method_type={
+                    "transaction_reference": {
+                        "transaction_reference_id": transaction_id
+                    }
+                },
+            )
+        return lambda: self.client.payments.get_by_id(
+            id=transaction_id, merchant_id=self.merchant_id
+        )
+
+    async def _create(self, request_id: str) -> Any:
+        payment = await self.client.payments.create(  # type: ignore[call-overload]
+            amount=self.amount,
+            currency=self.currency,
+            merchant=DEFAULT_MERCHANT,
+            merchant_id=self.merchant_id,
+            payment_method_type=DEFAULT_PAYMENT_METHOD,
+            request_id=request_id,
+            capture_method="MANUAL",
+        )
+        self._transactions.append(payment.transaction_id)
+        return payment
+
+    def _choose(self) -> str:
+        return self._rng.choices(self._operations, self._weights)[0]
+
+    async def _execute(self, name: str, intended_start: float) -> None:
+        operation = self._operation(name)
+        started = time.perf_counter()
+        try:
+            await operation()
+            outcome = "ok"
+        except ApiError as e:
+            outcome = str(e.status_code)
+        except Exception as e:  # noqa: BLE001
+            # transport failures are tallied, not raised
+            outcome = type(e).__name__
+        finished = time.perf_counter()
+        self.latency[name].record(finished - intended_start)
+        self.service_time[name].record(finished - started)
+        self.outcomes[name][outcome] += 1
+
+    async def prime(self, payments: int) -> None:
+        """Creates payments up front so patch, refund and get have targets."""
+        for _ in range(payments):
+            await self._create(str(uuid.uuid4()))
+
+    def reset(self) -> None:
+        """Discards recorded latencies and outcomes, e.g. after priming."""
+        for recorder in (*self.latency.values(), *self.service_time.values()):
+            recorder.clear()
+        for counter in self.outcomes.values():
+            counter.clear()
+
+    async def run_open_loop(
+        self, *, rate: float, duration: float, max_in_flight: int = 1000
+    ) -> None:
+        """
+        Issues requests at a fixed arrival rate.
+
+        Args:
+            rate: Target requests per second
+            duration: Test duration in seconds
+            max_in_flight: Upper bound on concurrent requests; time spent waiting
+                for a slot is included in the corrected latency
+        """
+        slots = asyncio.Semaphore(max_in_flight)
+        tasks = set()
+        interval = 1.0 / rate
+        start = time.perf_counter()
+        total = int(rate * duration)
+
+        async def issue(name: str, intended: float) -> None:
+            async with slots:
+                await self._execute(name, intended)
+
+        for i in range(total):
+            intended = start + i * interval
+            delay = intended - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            task = asyncio.ensure_future(issue(self._choose(), intended))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    async def run_closed_loop(self, *, concurrency: int, duration: float) -> None:
+        """
+        Runs `concurrency` workers issuing requests back to back.
+
+        Args:
+            concurrency: Number of concurrent workers
+            duration: Test duration in seconds
+        """
+        deadline = time.perf_counter() + duration
+
+        async def worker() -> None:
+            while time.perf_counter() < deadline:
+                await self._execute(self._choose(), time.perf_counter())
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    def report(self, *, wall_seconds: float, cpu_seconds: float) -> Dict[str, Any]:
+        """Builds the JSON-serializable report of a completed run."""
+        total = sum(len(recorder) for recorder in self.latency.values())
+        overall = LatencyRecorder()
+        for recorder in self.latency.values():
+            overall.extend(recorder)
+        return {
+            "requests": total,
+            "wall_seconds": wall_seconds,
+            "throughput_rps": total / wall_seconds if wall_seconds else 0.0,
+            "client_cpu_seconds": cpu_seconds,
+            "client_cpu_us_per_request": cpu_seconds / total * 1e6 if total else 0.0,
+            "latency": overall.summary(),
+            "operations": {
+                op: {
+                    "latency": self.latency[op].summary(),
+                    "service_time": self.service_time[op].summary(),
+                    "outcomes": dict(self.outcomes[op]),
+                }
+                for op in self._operations
+            },
+        }
+
+
+async def run(
+    test: LoadTest,
+    *,
+    duration: float,
+    rate: Optional[float] = None,
+    concurrency: Optional[int] = None,
+    max_in_flight: int = 1000,
+    prime: int = 20,
+) -> Dict[str, Any]:
+    """
+    Primes the test, runs it in open-loop (`rate`) or closed-loop (`concurrency`)
+    mode and returns the report.
+    """
+    if (rate is None) == (concurrency is None):
+        raise ValueError("exactly one of rate or concurrency must be given")
+    await test.prime(prime)
+    test.reset()
+
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    if rate is not None:
+        await test.run_open_loop(
+            rate=rate, duration=duration, max_in_flight=max_in_flight
+        )
+    else:
+        await test.run_closed_loop(concurrency=concurrency or 1, duration=duration)
+    wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+    report = test.report(wall_seconds=wall, cpu_seconds=cpu)
+    report["mode"] = "open" if rate is not None else "closed"
+    report["target_rate"] = rate
+    report["concurrency"] = concurrency
+    report["mix"] = test.mix
+    return report
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Renders a report as a human-readable table."""
+    lines: List[str] = [
+        f"mode={report['mode']} requests={report['requests']} "
+        f"throughput={report['throughput_rps']:.1f} req/s "
+        f"client_cpu={report['client_cpu_us_per_request']:.0f} us/req",
+        f"{'operation':10} {'count':>8} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} "
+        f"{'p99.9 ms':>9} {'max ms':>9}  outcomes",
+    ]
+    rows: List[Tuple[str, Dict[str, Any], Dict[str, int]]] = [
+        (op, stats["latency"], stats["outcomes"])
+        for op, stats in report["operations"].items()
+    ]
+    rows.append(("all", report["latency"], {}))
+    for name, latency, outcomes in rows:
+        if not latency.get("count"):
+            continue
+        lines.append(
+            f"{name:10} {latency['count']:8d} {latency['p50_ms']:9.2f} "
+            f"{latency['p90_ms']:9.2f} {latency['p99_ms']:9.2f} "
+            f"{latency['p999_ms']:9.2f} {latency['max_ms']:9.2f}  "
+            + " ".join(f"{k}={v}" for k, v in sorted(outcomes.items()))
+        )
+    return "\n".join(lines)
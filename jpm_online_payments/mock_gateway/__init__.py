@@ -0,0 +1,16 @@
+from .server import (
+    TOKEN_PATH,
+    Gateway,
+    GatewayConfig,
+    GatewayServer,
+    LatencyDistribution,
+)
+
+
+__all__ = [
+    "TOKEN_PATH",
+    "Gateway",
+    "GatewayConfig",
+    "GatewayServer",
+    "LatencyDistribution",
+]
@@ -0,0 +1,88 @@
+import argparse
+import sys
+from typing import Dict, List, Optional
+
+from .server import GatewayConfig, GatewayServer, LatencyDistribution
+
+
+def _route_latency(values: Optional[List[str]]) -> Dict[str, LatencyDistribution]:
+    overrides: Dict[str, LatencyDistribution] = {}
+    for value in values or []:
+        route, sep, spec = value.partition("=")
+        if not sep:
+            raise SystemExit(f"--route-latency expects ROUTE=SPEC, got {value!r}")
+        overrides[route] = LatencyDistribution.parse(spec)
+    return overrides
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m jpm_online_payments.mock_gateway",
+        description="Local stand-in for the Online Payments gateway.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--base-path", default="/api/v2")
+    parser.add_argument(
+        "--latency",
+        default="constant:0",
+        help="service time distribution in ms, e.g. constant:20, uniform:10,40, "
+        "normal:25,5, lognormal:25,0.5, exponential:25",
+    )
+    parser.add_argument(
+        "--route-latency",
+        action="append",
+        metavar="ROUTE=SPEC",
+        help="per-route latency override, e.g. /payments/{id}=constant:5 (repeatable)",
+    )
+    parser.add_argument("--token-latency", default="constant:0")
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="fraction of 500 responses"
+    )
+    parser.add_argument(
+        "--throttle-rate", type=float, default=0.0, help="fraction of 429 responses"
+    )
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument(
+        "--token-ttl", type=int, default=3600, help="access token lifetime in seconds"
+    )
+    parser.add_argument(
+        "--token-error-rate",
+        type=float,
+        default=0.0,
+        help="fraction of 503 responses from the token endpoint",
+    )
+    parser.add_argument(
+        "--no-auth", action="store_true", help="accept API requests without a token"
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args(argv)
+
+    config = GatewayConfig(
+        base_path=args.base_path,
+        latency=LatencyDistribution.parse(args.latency),
+        route_latency=_route_latency(args.route_latency),
+        token_latency=LatencyDistribution.parse(args.token_latency),
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        token_ttl=args.token_ttl,
+        token_error_rate=args.token_error_rate,
+        require_auth=not args.no_auth,
+        seed=args.seed,
+    )
+    server = GatewayServer((args.host, args.port), config, verbose=args.verbose)
+    print(f"base_url:  {server.base_url}", file=sys.stderr)
+    print(f"token_url: {server.token_url}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
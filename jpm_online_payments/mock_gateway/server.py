@@ -0,0 +1,542 @@
+import base64
+import collections
+import json
+import random
+import re
+import secrets
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from jpm_online_payments.simulation import TOKEN_PATH, LatencyDistribution
+
+"""
+Local stand-in for the Online Payments gateway.
+
+Implements the payments, captures, refunds, verifications, fraudcheck and
+healthcheck routes plus an OAuth2 client-credentials token endpoint, with
+configurable latency, error injection, 429 throttling and token expiry so the
+client can be load-tested end to end without network access to JPM.
+"""
+
+
+class GatewayConfig:
+    """
+    Behaviour of the local gateway.
+
+    Attributes:
+        base_path: Path prefix of the API routes, matching `Environment` URLs
+        latency: Default service time distribution for API routes
+        route_latency: Per-route overrides keyed by path template, e.g. `/payments/{id}`
+        token_latency: Service time distribution for the token endpoint
+        error_rate: Fraction of API requests answered with a 500 error
+        throttle_rate: Fraction of API requests answered with a 429
+        retry_after: Value of the Retry-After header on 429 responses, in seconds
+        token_ttl: Lifetime of issued access tokens, in seconds
+        token_error_rate: Fraction of token requests answered with a 503
+        require_auth: Whether API routes reject missing, unknown or expired tokens
+        max_records: Number of transactions retained for lookups
+        seed: Seed for the random number generator, for reproducible runs
+    """
+
+    def __init__(
+        self,
+        *,
+        base_path: str = "/api/v2",
+        latency: Optional[LatencyDistribution] = None,
+        route_latency: Optional[Dict[str, LatencyDistribution]] = None,
+        token_latency: Optional[LatencyDistribution] = None,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: int = 1,
+        token_ttl: int = 3600,
+        token_error_rate: float = 0.0,
+        require_auth: bool = True,
+        max_records: int = 100_000,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.base_path = base_path.rstrip("/")
+        self.latency = latency or LatencyDistribution("constant", (0.0,))
+        self.route_latency = route_latency or {}
+        self.token_latency = token_latency or LatencyDistribution("constant", (0.0,))
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.token_ttl = token_ttl
+        self.token_error_rate = token_error_rate
+        self.require_auth = require_auth
+        self.max_records = max_records
+        self.seed = seed
+
+
+class _Store:
+    """Bounded, thread-safe transaction store indexed by transaction and request id."""
+
+    def __init__(self, max_records: int) -> None:
+        self._max_records = max_records
+        self._by_id: "collections.OrderedDict[str, Dict[str, Any]]" = (
+            collections.OrderedDict()
+        )
+        self._by_request_id: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def put(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._by_id[record["transactionId"]] = record
+            self._by_request_id[record["requestId"]] = record["transactionId"]
+            while len(self._by_id) > self._max_records:
+                _, evicted = self._by_id.popitem(last=False)
+                self._by_request_id.pop(evicted["requestId"], None)
+
+    def get(self, transaction_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._by_id.get(transaction_id)
+
+    def get_by_request_id(self, request_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            transaction_id = self._by_request_id.get(request_id)
+            return self._by_id.get(transaction_id) if transaction_id else None
+
+
+class _Response:
+    def __init__(
+        self, status: int, body: Any = None, headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+
+def _error(status: int, code: str, message: str) -> _Response:
+    return _Response(
+        status,
+        {"responseStatus": "ERROR", "responseCode": code, "responseMessage": message},
+    )
+
+
+def _approved(request_id: str, **fields: Any) -> Dict[str, Any]:
+    record: Dict[str, Any] = {
+        "transactionId": str(uuid.uuid4()),
+        "requestId": request_id,
+        "responseStatus": "SUCCESS",
+        "responseCode": "APPROVED",
+        "responseMessage": "Transaction approved by Issuer",
+        "hostMessage": "Approved",
+        "approvalCode": f"tst{secrets.randbelow(1000):03d}",
+        "transactionDate": time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime()),
+    }
+    record.update(fields)
+    return record
+
+
+Handler = Callable[
+    ["Gateway", Dict[str, str], Dict[str, List[str]], Any, Dict[str, str]], _Response
+]
+
+
+class Gateway:
+    """
+    Request handling logic of the local gateway, independent of the HTTP server.
+    """
+
+    def __init__(self, config: GatewayConfig) -> None:
+        self.config = config
+        self._rng = random.Random(config.seed)
+        self._rng_lock = threading.Lock()
+        self._tokens: Dict[str, float] = {}
+        self._tokens_lock = threading.Lock()
+        self._payments = _Store(config.max_records)
+        self._refunds = _Store(config.max_records)
+        self._verifications = _Store(config.max_records)
+        self._fraudchecks = _Store(config.max_records)
+        self._routes: List[Tuple[str, "re.Pattern[str]", str, Handler]] = []
+        for method, template, handler in _ROUTES:
+            pattern = re.compile(
+                "^" + re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", template) + "$"
+            )
+            self._routes.append((method, pattern, template, handler))
+
+    def _random(self) -> float:
+        with self._rng_lock:
+            return self._rng.random()
+
+    def _latency(self, distribution: LatencyDistribution) -> float:
+        with self._rng_lock:
+            return distribution.sample(self._rng)
+
+    def handle(
+        self, method: str, raw_path: str, headers: Dict[str, str], body: bytes
+    ) -> Tuple[_Response, float]:
+        """
+        Handles a request.
+
+        Returns:
+            The response and the artificial delay to apply before sending it
+        """
+        parts = urlsplit(raw_path)
+        path = parts.path
+        query = parse_qs(parts.query)
+
+        if path == TOKEN_PATH:
+            return self._token(method, headers), self._latency(
+                self.config.token_latency
+            )
+
+        if not path.startswith(self.config.base_path):
+            return _error(404, "NOT_FOUND", "Unknown route"), 0.0
+        path = path[len(self.config.base_path) :] or "/"
+
+        for route_method, pattern, template, handler in self._routes:
+            match = pattern.match(path)
+            if match is None or route_method != method:
+                continue
+            delay = self._latency(
+                self.config.route_latency.get(template, self.config.latency)
+            )
+
+            if self.config.require_auth and not self._authorized(headers):
+                return (
+                    _error(401, "UNAUTHORIZED", "Missing or expired access token"),
+                    delay,
+                )
+            roll = self._random()
+            if roll < self.config.throttle_rate:
+                response = _error(429, "TOO_MANY_REQUESTS", "Rate limit exceeded")
+                response.headers["retry-after"] = str(self.config.retry_after)
+                return response, delay
+            if roll < self.config.throttle_rate + self.config.error_rate:
+                return _error(500, "INTERNAL_ERROR", "Injected gateway error"), delay
+
+            try:
+                payload = json.loads(body) if body else None
+            except json.JSONDecodeError:
+                return (
+                    _error(400, "INVALID_JSON", "Request body is not valid JSON"),
+                    delay,
+                )
+            return handler(self, headers, query, payload, match.groupdict()), delay
+
+        return _error(404, "NOT_FOUND", "Unknown route"), 0.0
+
+    def _token(self, method: str, headers: Dict[str, str]) -> _Response:
+        if method != "POST":
+            return _error(405, "METHOD_NOT_ALLOWED", "Use POST")
+        if self._random() < self.config.token_error_rate:
+            return _error(503, "UNAVAILABLE", "Injected token endpoint failure")
+        authorization = headers.get("authorization", "")
+        if not authorization.lower().startswith("basic "):
+            return _Response(401, {"error": "invalid_client"})
+        try:
+            base64.b64decode(authorization[6:])
+        except ValueError:
+            return _Response(401, {"error": "invalid_client"})
+
+        token = secrets.token_urlsafe(24)
+        with self._tokens_lock:
+            now = time.monotonic()
+            if len(self._tokens) > 10_000:
+                self._tokens = {t: exp for t, exp in self._tokens.items() if exp > now}
+            self._tokens[token] = now + self.config.token_ttl
+        return _Response(
+            200,
+            {
+                "access_token": token,
+                "token_type": "Bearer",
+                "expires_in": self.config.token_ttl,
+            },
+        )
+
+    def _authorized(self, headers: Dict[str, str]) -> bool:
+        authorization = headers.get("authorization", "")
+        if not authorization.startswith("Bearer "):
+            return False
+        with self._tokens_lock:
+            expires_at = self._tokens.get(authorization[7:])
+        return expires_at is not None and expires_at > time.monotonic()
+
+    # -- route handlers -------------------------------------------------------
+
+    def _create_payment(self, headers, query, payload, params) -> _Response:
+        missing = _missing(
+            headers, payload, ("amount", "currency", "merchant", "paymentMethodType")
+        )
+        if missing is not None:
+            return missing
+        capture_method = payload.get("captureMethod", "NOW")
+        record = _approved(
+            headers["request-id"],
+            transactionState="AUTHORIZED" if capture_method == "MANUAL" else "CLOSED",
+            amount=payload["amount"],
+            currency=payload["currency"],
+            captureMethod=capture_method,
+            merchant=payload["merchant"],
+            paymentMethodType=payload["paymentMethodType"],
+            initiatorType=payload.get("initiatorType", "CARDHOLDER"),
+            isAmountFinal=payload.get("isAmountFinal", True),
+            remainingRefundableAmount=payload["amount"],
+        )
+        self._payments.put(record)
+        return _Response(201, record)
+
+    def _get_payment(self, headers, query, payload, params) -> _Response:
+        return _lookup(self._payments, params.get("id"), query, headers)
+
+    def _patch_payment(self, headers, query, payload, params) -> _Response:
+        record = self._payments.get(params["id"])
+        if record is None:
+            return _error(404, "NOT_FOUND", "Transaction not found")
+        payload = payload or {}
+        record = dict(record)
+        if payload.get("isVoid"):
+            record["transactionState"] = "VOIDED"
+        elif payload.get("isCapture") or payload.get("captureMethod") == "NOW":
+            record["transactionState"] = "CLOSED"
+        if "amount" in payload:
+            record["amount"] = payload["amount"]
+        self._payments.put(record)
+        return _Response(200, record)
+
+    def _capture_payment(self, headers, query, payload, params) -> _Response:
+        missing = _missing(headers, payload or {}, ())
+        if missing is not None:
+            return missing
+        original = self._payments.get(params["id"])
+        if original is None:
+            return _error(404, "NOT_FOUND", "Transaction not found")
+        if original["transactionState"] != "AUTHORIZED":
+            return _error(400, "INVALID_STATE", "Transaction is not capturable")
+        amount = (payload or {}).get("amount", original["amount"])
+        self._payments.put(dict(original, transactionState="CLOSED"))
+        record = _approved(
+            headers["request-id"],
+            transactionState="CLOSED",
+            amount=amount,
+            currency=original["currency"],
+            captureMethod="MANUAL",
+            merchant=original["merchant"],
+            paymentMethodType=original["paymentMethodType"],
+            originalTransactionId=original["transactionId"],
+        )
+        self._payments.put(record)
+        return _Response(201, record)
+
+    def _create_refund(self, headers, query, payload, params) -> _Response:
+        missing = _missing(headers, payload, ("merchant",))
+        if missing is not None:
+            return missing
+        original_id = (
+            payload.get("paymentMethodType", {})
+            .get("transactionReference", {})
+            .get("transactionReferenceId")
+        )
+        original = self._payments.get(original_id) if original_id else None
+        record = _approved(
+            headers["request-id"],
+            transactionState="CLOSED",
+            amount=payload.get("amount", original["amount"] if original else 0),
+            currency=payload.get(
+                "currency", original["currency"] if original else "USD"
+            ),
+            merchant=payload["merchant"],
+        )
+        self._refunds.put(record)
+        return _Response(201, record)
+
+    def _get_refund(self, headers, query, payload, params) -> _Response:
+        return _lookup(self._refunds, params.get("id"), query, headers)
+
+    def _create_verification(self, headers, query, payload, params) -> _Response:
+        missing = _missing(
+            headers, payload, ("currency", "merchant", "paymentMethodType")
+        )
+        if missing is not None:
+            return missing
+        record = _approved(
+            headers["request-id"],
+            currency=payload["currency"],
+            merchant=payload["merchant"],
+            paymentMethodType=payload["paymentMethodType"],
+        )
+        self._verifications.put(record)
+        return _Response(200, record)
+
+    def _get_verification(self, headers, query, payload, params) -> _Response:
+        return _lookup(self._verifications, params.get("id"), query, headers)
+
+    def _create_fraudcheck(self, headers, query, payload, params) -> _Response:
+        missing = _missing(headers, payload, ())
+        if missing is not None:
+            return missing
+        score = int(self._random() * 100)
+        record = _approved(
+            headers["request-id"],
+            responseCode="ACCEPT",
+            riskDecision={
+                "fraudRiskScore": str(score),
+                "fraudStatus": "HIGH_RISK" if score > 80 else "LOW_RISK",
+            },
+        )
+        self._fraudchecks.put(record)
+        return _Response(200, record)
+
+    def _get_fraudcheck(self, headers, query, payload, params) -> _Response:
+        return _lookup(self._fraudchecks, params.get("id"), query, headers)
+
+    def _healthcheck(self, headers, query, payload, params) -> _Response:
+        return _Response(200, {"status": "PASS"})
+
+
+def _missing(
+    headers: Dict[str, str], payload: Any, fields: Tuple[str, ...]
+) -> Optional[_Response]:
+    for header in ("merchant-id", "request-id"):
+        if not headers.get(header):
+            return _error(400, "MISSING_HEADER", f"Missing required header {header}")
+    if not isinstance(payload, dict):
+        return _error(400, "INVALID_REQUEST", "Request body must be a JSON object")
+    for field in fields:
+        if field not in payload:
+            return _error(400, "MISSING_FIELD", f"Missing required field {field}")
+    return None
+
+
+def _lookup(
+    store: _Store,
+    transaction_id: Optional[str],
+    query: Dict[str, List[str]],
+    headers: Dict[str, str],
+) -> _Response:
+    if transaction_id is not None:
+        record = store.get(transaction_id)
+    else:
+        request_identifier = query.get("requestIdentifier", [""])[0]
+        record = store.get_by_request_id(request_identifier)
+    if record is None:
+        return _error(404, "NOT_FOUND", "Transaction not found")
+    return _Response(200, record)
+
+
+_ROUTES: List[Tuple[str, str, Handler]] = [
+    ("POST", "/payments", Gateway._create_payment),
+    ("GET", "/payments", Gateway._get_payment),
+    ("GET", "/payments/{id}", Gateway._get_payment),
+    ("PATCH", "/payments/{id}", Gateway._patch_payment),
+    ("POST", "/payments/{id}/captures", Gateway._capture_payment),
+    ("GET", "/captures", Gateway._get_payment),
+    ("GET", "/captures/{id}", Gateway._get_payment),
+    ("POST", "/refunds", Gateway._create_refund),
+    ("GET", "/refunds", Gateway._get_refund),
+    ("GET", "/refunds/{id}", Gateway._get_refund),
+    ("POST", "/verifications", Gateway._create_verification),
+    ("GET", "/verifications", Gateway._get_verification),
+    ("GET", "/verifications/{id}", Gateway._get_verification),
+    ("POST", "/fraudcheck", Gateway._create_fraudcheck),
+    ("GET", "/fraudcheck", Gateway._get_fraudcheck),
+    ("GET", "/fraudcheck/{id}", Gateway._get_fraudcheck),
+    ("GET", "/healthcheck/payments", Gateway._healthcheck),
+    ("GET", "/healthcheck/refunds", Gateway._healthcheck),
+    ("GET", "/healthcheck/verifications", Gateway._healthcheck),
+]
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately; without these, Nagle's algorithm
+    # and delayed ACKs add ~40ms to every keep-alive response
+    disable_nagle_algorithm = True
+    wbufsize = 64 * 1024
+    server: "GatewayServer"
+
+    def _dispatch(self) -> None:
+        length = int(self.headers.get("content-length") or 0)
+        body = self.rfile.read(length) if length else b""
+        headers = {k.lower(): v for k, v in self.headers.items()}
+        response, delay = self.server.gateway.handle(
+            self.command, self.path, headers, body
+        )
+        if delay > 0:
+            time.sleep(delay)
+
+        encoded = (
+            json.dumps(response.body).encode() if response.body is not None else b""
+        )
+        self.send_response(response.status)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(encoded)))
+        if "request-id" in headers:
+            self.send_header("request-id", headers["request-id"])
+        for name, value in response.headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _dispatch
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class GatewayServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server exposing a `Gateway`.
+
+    Example:
+    ```py
+    latency = LatencyDistribution.parse("lognormal:20,0.4")
+    server = GatewayServer(("127.0.0.1", 0), GatewayConfig(latency=latency))
+    server.start()
+    client = Client(base_url=server.base_url, token_url=server.token_url, auth={...})
+    ...
+    server.stop()
+    ```
+    """
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(
+        self,
+        address: Tuple[str, int] = ("127.0.0.1", 8080),
+        config: Optional[GatewayConfig] = None,
+        *,
+        verbose: bool = False,
+    ) -> None:
+        self.gateway = Gateway(config or GatewayConfig())
+        self.verbose = verbose
+        self._thread: Optional[threading.Thread] = None
+        super().__init__(address, _RequestHandler)
+
+    @property
+    def origin(self) -> str:
+        host, port = self.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode("ascii")
+        return f"http://{host}:{port}"
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to pass to `Client(base_url=...)`."""
+        return self.origin + self.gateway.config.base_path
+
+    @property
+    def token_url(self) -> str:
+        """Token URL to pass to `Client(token_url=...)`."""
+        return self.origin + TOKEN_PATH
+
+    def start(self) -> "GatewayServer":
+        """Serves requests from a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops a server started with `start`."""
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -1,28 +1,99 @@
+import pydantic
 import typing
 
 from jpm_online_payments.core import (
+    AnyRequestOptions,
     AsyncBaseClient,
+    Endpoint,
+    ModelRequestOptions,
+    ModelView,
     QueryParams,
+    RawRequestOptions,
+    RawResponse,
     RequestOptions,
     SyncBaseClient,
+    ViewRequestOptions,
     default_request_options,
     encode_param,
 )
 from jpm_online_payments.types import models
 
+_GET_ENDPOINT = Endpoint(
+    method="GET",
+    path="/captures",
+    cast_to=models.PaymentResponse,
+    auth_names=["auth"],
+)
+_GET_BY_ID_ENDPOINT = Endpoint(
+    method="GET",
+    path="/captures/{id}",
+    cast_to=models.PaymentResponse,
+    auth_names=["auth"],
+)
+
 
 class CapturesClient:
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
 
+    @typing.overload
+    def get(
+        self,
+        *,
+        merchant_id: str,
+        request_id: str,
+        request_identifier: str,
+        request_options: typing.Optional[ModelRequestOptions] = None,
+    ) -> models.PaymentResponse: ...
+
+    @typing.overload
+    def get(
+        self,
+        *,
+        merchant_id: str,
+        request_id: str,
+        request_identifier: str,
+        request_options: ViewRequestOptions,
+    ) -> ModelView: ...
+
+    @typing.overload
+    def get(
+        self,
+        *,
+        merchant_id: str,
+        request_id: str,
+        request_identifier: str,
+        request_options: RawRequestOptions,
+    ) -> RawResponse[models.PaymentResponse]: ...
+
+    @typing.overload
+    def get(
+        self,
+        *,
+        merchant_id: str,
+        request_id: str,
+        request_identifier: str,
+        request_options: RequestOptions,
+    ) -> typing.Union[
+        models.PaymentResponse,
+        pydantic.BaseModel,
+        ModelView,
+        RawResponse[models.PaymentResponse],
+    ]: ...
+
     def get(
         self,
         *,
         merchant_id: str,
         request_id: str,
         request_identifier: str,
-        request_options: typing.Optional[RequestOptions] = None,
-    ) -> models.PaymentResponse:
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> typing.Union[
+        models.PaymentResponse,
+        pydantic.BaseModel,
+        ModelView,
+        RawResponse[models.PaymentResponse],
+    ]:
         """
         Retrieve Payment Details
 
@@ -59,23 +130,70 @@ class CapturesClient:
         _header["merchant-id"] = str(encode_param(merchant_id, False))
         _header["request-id"] = str(encode_param(request_id, False))
         return self._base_client.request(
-            method="GET",
-            path="/captures",
-            auth_names=["auth"],
+            endpoint=_GET_ENDPOINT,
             query_params=_query,
             headers=_header,
-            cast_to=models.PaymentResponse,
             request_options=request_options or default_request_options(),
         )
 
+    @typing.overload
     def get_by_id(
         self,
         *,
         id: str,
         merchant_id: str,
         request_id: str,
-        request_options: typing.Optional[RequestOptions] = None,
-    ) -> models.PaymentResponse:
+        request_options: typing.Optional[ModelRequestOptions] = None,
+    ) -> models.PaymentResponse: ...
+
+    @typing.overload
+    def get_by_id(
+        self,
+        *,
+        id: str,
+        merchant_id: str,
+        request_id: str,
+        request_options: ViewRequestOptions,
+    ) -> ModelView: ...
+
+    @typing.overload
+    def get_by_id(
+        self,
+        *,
+        id: str,
+        merchant_id: str,
+        request_id: str,
+        request_options: RawRequestOptions,
+    ) -> RawResponse[models.PaymentResponse]: ...
+
+    @typing.overload
+    def get_by_id(
+        self,
+        *,
+        id: str,
+        merchant_id: str,
+        request_id: str,
+        request_options: RequestOptions,
+    ) -> typing.Union[
+        models.PaymentResponse,
+        pydantic.BaseModel,
+        ModelView,
+        RawResponse[models.PaymentResponse],
+    ]: ...
+
+    def get_by_id(
+        self,
+        *,
+        id: str,
+        merchant_id: str,
+        request_id: str,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> typing.Union[
+        models.PaymentResponse,
+        pydantic.BaseModel,
+        ModelView,
+        RawResponse[models.PaymentResponse],
+    ]:
         """
         Retrieve Payment Details by transaction Id
 
@@ -110,11 +228,9 @@ class CapturesClient:
         _header["merchant-id"] = str(encode_param(merchant_id, False))
         _header["request-id"] = str(encode_param(request_id, False))
         return self._base_client.request(
-            method="GET",
-            path=f"/captures/{id}",
-            auth_names=["auth"],
+            endpoint=_GET_BY_ID_ENDPOINT,
+            path_params={"id": id},
             headers=_header,
-            cast_to=models.PaymentResponse,
             request_options=request_options or default_request_options(),
         )
 
@@ -123,14 +239,64 @@ class AsyncCapturesClient:
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
 
+    @typing.overload
+    async def get(
+        self,
+        *,
+        merchant_id: str,
+        request_id: str,
+        request_identifier: str,
+        request_options: typing.Optional[ModelRequestOptions] = None,
+    ) -> models.PaymentResponse: ...
+
+    @typing.overload
+    async def get(
+        self,
+        *,
+        merchant_id: str,
+        request_id: str,
+        request_identifier: str,
+        request_options: ViewRequestOptions,
+    ) -> ModelView: ...
+
+    @typing.overload
+    async def get(
+        self,
+        *,
+        merchant_id: str,
+        request_id: str,
+        request_identifier: str,
+        request_options: RawRequestOptions,
+    ) -> RawResponse[models.PaymentResponse]: ...
+
+    @typing.overload
+    async def get(
+        self,
+        *,
+        merchant_id: str,
+        request_id: str,
+        request_identifier: str,
+        request_options: RequestOptions,
+    ) -> typing.Union[
+        models.PaymentResponse,
+        pydantic.BaseModel,
+        ModelView,
+        RawResponse[models.PaymentResponse],
+    ]: ...
+
     async def get(
         self,
         *,
         merchant_id: str,
         request_id: str,
         request_identifier: str,
-        request_options: typing.Optional[RequestOptions] = None,
-    ) -> models.PaymentResponse:
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> typing.Union[
+        models.PaymentResponse,
+        pydantic.BaseModel,
+        ModelView,
+        RawResponse[models.PaymentResponse],
+    ]:
         """
         Retrieve Payment Details
 
@@ -167,23 +333,70 @@ class AsyncCapturesClient:
         _header["merchant-id"] = str(encode_param(merchant_id, False))
         _header["request-id"] = str(encode_param(request_id, False))
         return await self._base_client.request(
-            method="GET",
-            path="/captures",
-            auth_names=["auth"],
+            endpoint=_GET_ENDPOINT,
             query_params=_query,
             headers=_header,
-            cast_to=models.PaymentResponse,
             request_options=request_options or default_request_options(),
         )
 
+    @typing.overload
+    async def get_by_id(
+        self,
+        *,
+        id: str,
+        merchant_id: str,
+        request_id: str,
+        request_options: typing.Optional[ModelRequestOptions] = None,
+    ) -> models.PaymentResponse: ...
+
+    @typing.overload
+    async def get_by_id(
+        self,
+        *,
+        id: str,
+        merchant_id: str,
+        request_id: str,
+        request_options: ViewRequestOptions,
+    ) -> ModelView: ...
+
+    @typing.overload
+    async def get_by_id(
+        self,
+        *,
+        id: str,
+        merchant_id: str,
+        request_id: str,
+        request_options: RawRequestOptions,
+    ) -> RawResponse[models.PaymentResponse]: ...
+
+    @typing.overload
+    async def get_by_id(
+        self,
+        *,
+        id: str,
+        merchant_id: str,
+        request_id: str,
+        request_options: RequestOptions,
+    ) -> typing.Union[
+        models.PaymentResponse,
+        pydantic.BaseModel,
+        ModelView,
+        RawResponse[models.PaymentResponse],
+    ]: ...
+
     async def get_by_id(
         self,
         *,
         id: str,
         merchant_id: str,
         request_id: str,
-        request_options: typing.Optional[RequestOptions] = None,
-    ) -> models.PaymentResponse:
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> typing.Union[
+        models.PaymentResponse,
+        pydantic.BaseModel,
+        ModelView,
+        RawResponse[models.PaymentResponse],
+    ]:
         """
         Retrieve Payment Details by transaction Id
 
@@ -218,10 +431,8 @@ class AsyncCapturesClient:
         _header["merchant-id"] = str(encode_param(merchant_id, False))
         _header["request-id"] = str(encode_param(request_id, False))
         return await self._base_client.request(
-            method="GET",
-            path=f"/captures/{id}",
-            auth_names=["auth"],
+            endpoint=_GET_BY_ID_ENDPOINT,
+            path_params={"id": id},
             headers=_header,
-            cast_to=models.PaymentResponse,
             request_options=request_options or default_request_options(),
         )
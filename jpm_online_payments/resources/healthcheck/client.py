@@ -1,21 +1,74 @@
+import pydantic
 import typing
 
 from jpm_online_payments.core import (
+    AnyRequestOptions,
     AsyncBaseClient,
+    Endpoint,
+    ModelRequestOptions,
+    ModelView,
+    RawRequestOptions,
+    RawResponse,
     RequestOptions,
     SyncBaseClient,
+    ViewRequestOptions,
     default_request_options,
 )
 from jpm_online_payments.types import models
 
+_PAYMENTS_STATUS_ENDPOINT = Endpoint(
+    method="GET",
+    path="/healthcheck/payments",
+    cast_to=models.HealthCheckResource,
+    auth_names=["auth"],
+)
+_REFUNDS_STATUS_ENDPOINT = Endpoint(
+    method="GET",
+    path="/healthcheck/refunds",
+    cast_to=models.HealthCheckResource,
+    auth_names=["auth"],
+)
+_VERIFICATIONS_STATUS_ENDPOINT = Endpoint(
+    method="GET",
+    path="/healthcheck/verifications",
+    cast_to=models.HealthCheckResource,
+    auth_names=["auth"],
+)
+
 
 class HealthcheckClient:
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
 
+    @typing.overload
+    def payments_status(
+        self, *, request_options: typing.Optional[ModelRequestOptions] = None
+    ) -> models.HealthCheckResource: ...
+
+    @typing.overload
+    def payments_status(self, *, request_options: ViewRequestOptions) -> ModelView: ...
+
+    @typing.overload
+    def payments_status(
+        self, *, request_options: RawRequestOptions
+    ) -> RawResponse[models.HealthCheckResource]: ...
+
+    @typing.overload
+    def payments_status(self, *, request_options: RequestOptions) -> typing.Union[
+        models.HealthCheckResource,
+        pydantic.BaseModel,
+        ModelView,
+        RawResponse[models.HealthCheckResource],
+    ]: ...
+
     def payments_status(
-        self, *, request_options: typing.Optional[RequestOptions] = None
-    ) -> models.HealthCheckResource:
+        self, *, request_options: typing.Optional[AnyRequestOptions] = None
+    ) -> typing.Union[
+        models.HealthCheckResource,
+        pydantic.BaseModel,
+        ModelView,
+        RawResponse[models.HealthCheckResource],
+    ]:
         """
         Health check for payments
 
@@ -40,16 +93,39 @@ class HealthcheckClient:
 
         """
         return self._base_client.request(
-            method="GET",
-            path="/healthcheck/payments",
-            auth_names=["auth"],
-            cast_to=models.HealthCheckResource,
+            endpoint=_PAYMENTS_STATUS_ENDPOINT,
             request_options=request_options or default_request_options(),
         )
 
+    @typing.overload
     def refunds_status(
-        self, *, request_options: typing.Optional[RequestOptions] = None
-    ) -> models.HealthCheckResource:
+        self, *, request_options: typing.Optional[ModelRequestOptions] = None
+    ) -> models.HealthCheckResource: ...
+
+    @typing.overload
+    def refunds_status(self, *, request_options: ViewRequestOptions) -> ModelView: ...
+
+    @typing.overload
+    def refunds_status(
+        self, *, request_options: RawRequestOptions
+    ) -> RawResponse[models.HealthCheckResource]: ...
+
+    @typing.overload
+    def refunds_status(self, *, request_options: RequestOptions) -> typing.Union[
+        models.HealthCheckResource,
+        pydantic.BaseModel,
+        ModelView,
+        RawResponse[models.HealthCheckResource],
+    ]: ...
+
+    def refunds_status(
+        self, *, request_options: typing.Optional[AnyRequestOptions] = None
+    ) -> typing.Union[
+        models.HealthCheckResource,
+        pydantic.BaseModel,
+        ModelView,
+        RawResponse[models.HealthCheckResource],
+    ]:
         """
         Health check for refunds
 
@@ -74,16 +150,41 @@ class HealthcheckClient:
 
         """
         return self._base_client.request(
-            method="GET",
-            path="/healthcheck/refunds",
-            auth_names=["auth"],
-            cast_to=models.HealthCheckResource,
+            endpoint=_REFUNDS_STATUS_ENDPOINT,
             request_options=request_options or default_request_options(),
         )
 
+    @typing.overload
+    def verifications_status(
+        self, *, request_options: typing.Optional[ModelRequestOptions] = None
+    ) -> models.HealthCheckResource: ...
+
+    @typing.overload
+    def verifications_status(
+        self, *, request_options: ViewRequestOptions
+    ) -> ModelView: ...
+
+    @typing.overload
+    def verifications_status(
+        self, *, request_options: RawRequestOptions
+    ) -> RawResponse[models.HealthCheckResource]: ...
+
+    @typing.overload
+    def verifications_status(self, *, request_options: RequestOptions) -> typing.Union[
+        models.HealthCheckResource,
+        pydantic.BaseModel,
+        ModelView,
+        RawResponse[models.HealthCheckResource],
+    ]: ...
+
     def verifications_status(
-        self, *, request_options: typing.Optional[RequestOptions] = None
-    ) -> models.HealthCheckResource:
+        self, *, request_options: typing.Optional[AnyRequestOptions] = None
+    ) -> typing.Union[
+        models.HealthCheckResource,
+        pydantic.BaseModel,
+        ModelView,
+        RawResponse[models.HealthCheckResource],
+    ]:
         """
         Health check for verifications
 
@@ -108,10 +209,7 @@ class HealthcheckClient:
 
         """
         return self._base_client.request(
-            method="GET",
-            path="/healthcheck/verifications",
-            auth_names=["auth"],
-            cast_to=models.HealthCheckResource,
+            endpoint=_VERIFICATIONS_STATUS_ENDPOINT,
             request_options=request_options or default_request_options(),
         )
 
@@ -120,9 +218,37 @@ class AsyncHealthcheckClient:
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
 
+    @typing.overload
     async def payments_status(
-        self, *, request_options: typing.Optional[RequestOptions] = None
-    ) -> models.HealthCheckResource:
+        self, *, request_options: typing.Optional[ModelRequestOptions] = None
+    ) -> models.HealthCheckResource: ...
+
+    @typing.overload
+    async def payments_status(
+        self, *, request_options: ViewRequestOptions
+    ) -> ModelView: ...
+
+    @typing.overload
+    async def payments_status(
+        self, *, request_options: RawRequestOptions
+    ) -> RawResponse[models.HealthCheckResource]: ...
+
+    @typing.overload
+    async def payments_status(self, *, request_options: RequestOptions) -> typing.Union[
+        models.HealthCheckResource,
+        pydantic.BaseModel,
+        ModelView,
+        RawResponse[models.HealthCheckResource],
+    ]: ...
+
+    async def payments_status(
+        self, *, request_options: typing.Optional[AnyRequestOptions] = None
+    ) -> typing.Union[
+        models.HealthCheckResource,
+        pydantic.BaseModel,
+        ModelView,
+        RawResponse[models.HealthCheckResource],
+    ]:
         """
         Health check for payments
 
@@ -147,16 +273,41 @@ class AsyncHealthcheckClient:
 
         """
         return await self._base_client.request(
-            method="GET",
-            path="/healthcheck/payments",
-            auth_names=["auth"],
-            cast_to=models.HealthCheckResource,
+            endpoint=_PAYMENTS_STATUS_ENDPOINT,
             request_options=request_options or default_request_options(),
         )
 
+    @typing.overload
+    async def refunds_status(
+        self, *, request_options: typing.Optional[ModelRequestOptions] = None
+    ) -> models.HealthCheckResource: ...
+
+    @typing.overload
+    async def refunds_status(
+        self, *, request_options: ViewRequestOptions
+    ) -> ModelView: ...
+
+    @typing.overload
     async def refunds_status(
-        self, *, request_options: typing.Optional[RequestOptions] = None
-    ) -> models.HealthCheckResource:
+        self, *, request_options: RawRequestOptions
+    ) -> RawResponse[models.HealthCheckResource]: ...
+
+    @typing.overload
+    async def refunds_status(self, *, request_options: RequestOptions) -> typing.Union[
+        models.HealthCheckResource,
+        pydantic.BaseModel,
+        ModelView,
+        RawResponse[models.HealthCheckResource],
+    ]: ...
+
+    async def refunds_status(
+        self, *, request_options: typing.Optional[AnyRequestOptions] = None
+    ) -> typing.Union[
+        models.HealthCheckResource,
+        pydantic.BaseModel,
+        ModelView,
+        RawResponse[models.HealthCheckResource],
+    ]:
         """
         Health check for refunds
 
@@ -181,16 +332,43 @@ class AsyncHealthcheckClient:
 
         """
         return await self._base_client.request(
-            method="GET",
-            path="/healthcheck/refunds",
-            auth_names=["auth"],
-            cast_to=models.HealthCheckResource,
+            endpoint=_REFUNDS_STATUS_ENDPOINT,
             request_options=request_options or default_request_options(),
         )
 
+    @typing.overload
+    async def verifications_status(
+        self, *, request_options: typing.Optional[ModelRequestOptions] = None
+    ) -> models.HealthCheckResource: ...
+
+    @typing.overload
+    async def verifications_status(
+        self, *, request_options: ViewRequestOptions
+    ) -> ModelView: ...
+
+    @typing.overload
+    async def verifications_status(
+        self, *, request_options: RawRequestOptions
+    ) -> RawResponse[models.HealthCheckResource]: ...
+
+    @typing.overload
+    async def verifications_status(
+        self, *, request_options: RequestOptions
+    ) -> typing.Union[
+        models.HealthCheckResource,
+        pydantic.BaseModel,
+        ModelView,
+        RawResponse[models.HealthCheckResource],
+    ]: ...
+
     async def verifications_status(
-        self, *, request_options: typing.Optional[RequestOptions] = None
-    ) -> models.HealthCheckResource:
+        self, *, request_options: typing.Optional[AnyRequestOptions] = None
+    ) -> typing.Union[
+        models.HealthCheckResource,
+        pydantic.BaseModel,
+        ModelView,
+        RawResponse[models.HealthCheckResource],
+    ]:
         """
         Health check for verifications
 
@@ -215,9 +393,6 @@ class AsyncHealthcheckClient:
 
         """
         return await self._base_client.request(
-            method="GET",
-            path="/healthcheck/verifications",
-            auth_names=["auth"],
-            cast_to=models.HealthCheckResource,
+            endpoint=_VERIFICATIONS_STATUS_ENDPOINT,
             request_options=request_options or default_request_options(),
         )
@@ -0,0 +1,67 @@
+import math
+import random
+from typing import Tuple
+
+"""
+Gateway behaviour shared by the local gateway and the fault-injection transport.
+"""
+
+TOKEN_PATH = "/am/oauth2/alpha/access_token"
+
+
+class LatencyDistribution:
+    """
+    Random service time distribution, specified in milliseconds.
+
+    Parsed from `kind:arg1,arg2` strings:
+
+    * `constant:MS`
+    * `uniform:LOW_MS,HIGH_MS`
+    * `normal:MEAN_MS,STDDEV_MS` (truncated at zero)
+    * `lognormal:MEDIAN_MS,SIGMA`
+    * `exponential:MEAN_MS`
+    """
+
+    KINDS = ("constant", "uniform", "normal", "lognormal", "exponential")
+
+    def __init__(self, kind: str, args: Tuple[float, ...]) -> None:
+        expected = {
+            "constant": 1,
+            "uniform": 2,
+            "normal": 2,
+            "lognormal": 2,
+            "exponential": 1,
+        }
+        if kind not in expected:
+            raise ValueError(
+                f"unknown latency distribution {kind!r}, expected one of {self.KINDS}"
+            )
+        if len(args) != expected[kind]:
+            raise ValueError(f"{kind} latency expects {expected[kind]} argument(s)")
+        self.kind = kind
+        self.args = args
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyDistribution":
+        """Parses a `kind:args` specification, e.g. `lognormal:25,0.5`."""
+        kind, _, raw_args = spec.partition(":")
+        args = tuple(float(a) for a in raw_args.split(",") if a.strip())
+        return cls(kind.strip(), args)
+
+    def sample(self, rng: random.Random) -> float:
+        """Draws a latency in seconds."""
+        a = self.args
+        if self.kind == "constant":
+            ms = a[0]
+        elif self.kind == "uniform":
+            ms = rng.uniform(a[0], a[1])
+        elif self.kind == "normal":
+            ms = rng.gauss(a[0], a[1])
+        elif self.kind == "lognormal":
+            ms = rng.lognormvariate(math.log(a[0]), a[1]) if a[0] > 0 else 0.0
+        else:
+            ms = rng.expovariate(1.0 / a[0]) if a[0] > 0 else 0.0
+        return max(ms, 0.0) / 1000.0
+
+    def __repr__(self) -> str:
+        return f"{self.kind}:{','.join(str(a) for a in self.args)}"
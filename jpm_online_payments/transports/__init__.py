@@ -0,0 +1,27 @@
+from .cassette import (
+    REDACTED_FIELDS,
+    CassetteWriter,
+    Interaction,
+    read_cassette,
+    redact,
+    redact_content,
+)
+from .faults import TOKEN_ENDPOINT, FaultInjectionTransport, FaultRule
+from .recording import RecordingTransport
+from .replay import ReplayTransport, UnrecordedRequestError
+
+
+__all__ = [
+    "REDACTED_FIELDS",
+    "TOKEN_ENDPOINT",
+    "CassetteWriter",
+    "FaultInjectionTransport",
+    "FaultRule",
+    "Interaction",
+    "RecordingTransport",
+    "ReplayTransport",
+    "UnrecordedRequestError",
+    "read_cassette",
+    "redact",
+    "redact_content",
+]
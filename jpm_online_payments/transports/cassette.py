@@ -0,0 +1,223 @@
+import base64
+import gzip
+import hashlib
+import json
+import threading
+from typing import IO, Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+import httpx
+
+from jpm_online_payments.core.redaction import REDACTED_FIELDS, redact
+
+"""
+Cassette files of recorded request and response pairs.
+
+A cassette is a gzip-compressed JSON lines file: a header line with the format
+version, then one line per interaction holding the request method, path, query
+and body hash, the response status, headers and content, and the time the
+gateway took to answer. Card data is redacted from request and response bodies
+before anything is written, including before request bodies are hashed, so the
+replaying side hashes redacted bodies too and two requests differing only in
+card data match the same interaction.
+"""
+
+VERSION = 1
+
+# headers describing the original encoding of content stored decoded
+_DROPPED_HEADERS = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding"}
+)
+
+InteractionKey = Tuple[str, str, str]
+
+
+def redact_content(content: bytes, fields: FrozenSet[str] = REDACTED_FIELDS) -> bytes:
+    """
+    Redacts a JSON body, re-encoding it with sorted keys so equal bodies encode
+    equally. Bodies that are not JSON are returned unchanged.
+    """
+    if not content:
+        return content
+    try:
+        data = json.loads(content)
+    except ValueError:
+        return content
+    return json.dumps(
+        redact(data, fields), ensure_ascii=False, separators=(",", ":"), sort_keys=True
+    ).encode("utf-8")
+
+
+def body_hash(content: bytes) -> str:
+    """Hashes a redacted request body for lookups."""
+    return hashlib.sha256(content).hexdigest()[:32] if content else ""
+
+
+def interaction_key(
+    request: httpx.Request, fields: FrozenSet[str] = REDACTED_FIELDS
+) -> InteractionKey:
+    """
+    Returns the lookup key of a request: method, path with query, and hash of the
+    redacted body. The host is left out, so a cassette recorded against one
+    environment replays under any base URL.
+    """
+    return (
+        request.method,
+        request.url.raw_path.decode("ascii"),
+        body_hash(redact_content(request.content, fields)),
+    )
+
+
+class Interaction:
+    """
+    A recorded request and response.
+
+    Attributes:
+        method: HTTP method
+        path: Path of the request URL, with the query string
+        body_hash: Hash of the redacted request body
+        status_code: Response status code
+        headers: Response headers
+        content: Redacted response body
+        elapsed: Seconds from sending the request to reading the whole response
+    """
+
+    __slots__ = (
+        "method",
+        "path",
+        "body_hash",
+        "status_code",
+        "headers",
+        "content",
+        "elapsed",
+    )
+
+    def __init__(
+        self,
+        *,
+        method: str,
+        path: str,
+        body_hash: str,
+        status_code: int,
+        headers: List[Tuple[str, str]],
+        content: bytes,
+        elapsed: float,
+    ) -> None:
+        self.method = method
+        self.path = path
+        self.body_hash = body_hash
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.elapsed = elapsed
+
+    @property
+    def key(self) -> InteractionKey:
+        return (self.method, self.path, self.body_hash)
+
+    @classmethod
+    def from_exchange(
+        cls,
+        request: httpx.Request,
+        response: httpx.Response,
+        *,
+        elapsed: float,
+        fields: FrozenSet[str] = REDACTED_FIELDS,
+    ) -> "Interaction":
+        """Builds a redacted interaction from a request and its read response."""
+        method, path, hashed = interaction_key(request, fields)
+        return cls(
+            method=method,
+            path=path,
+            body_hash=hashed,
+            status_code=response.status_code,
+            headers=[
+                (name, value)
+                for name, value in response.headers.items()
+                if name.lower() not in _DROPPED_HEADERS
+            ],
+            content=redact_content(response.content, fields),
+            elapsed=elapsed,
+        )
+
+    def to_response(self) -> httpx.Response:
+        return httpx.Response(
+            self.status_code, headers=self.headers, content=self.content
+        )
+
+    def to_record(self) -> Dict[str, Any]:
+        record: Dict[str, Any] = {
+            "method": self.method,
+            "path": self.path,
+            "body_hash": self.body_hash,
+            "status_code": self.status_code,
+            "headers": self.headers,
+            "elapsed": self.elapsed,
+        }
+        try:
+            record["content"] = self.content.decode("utf-8")
+        except UnicodeDecodeError:
+            record["content_base64"] = base64.b64encode(self.content).decode("ascii")
+        return record
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "Interaction":
+        if "content_base64" in record:
+            content = base64.b64decode(record["content_base64"])
+        else:
+            content = record.get("content", "").encode("utf-8")
+        return cls(
+            method=record["method"],
+            path=record["path"],
+            body_hash=record["body_hash"],
+            status_code=record["status_code"],
+            headers=[(name, value) for name, value in record["headers"]],
+            content=content,
+            elapsed=record["elapsed"],
+        )
+
+    def __repr__(self) -> str:
+        return f"Interaction({self.method} {self.path} -> {self.status_code})"
+
+
+class CassetteWriter:
+    """Appends interactions to a cassette file; safe to share between threads."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._file: Optional[IO[str]] = gzip.open(path, "wt", encoding="utf-8")
+        self._write({"version": VERSION})
+        self.count = 0
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        assert self._file is not None
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def write(self, interaction: Interaction) -> None:
+        with self._lock:
+            if self._file is None:
+                raise RuntimeError(f"cassette {self.path} is closed")
+            self._write(interaction.to_record())
+            self.count += 1
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def read_cassette(path: str) -> Iterator[Interaction]:
+    """
+    Reads the interactions of a cassette file in recorded order.
+
+    Raises:
+        ValueError: If the file is not a cassette of a supported version
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        header = json.loads(file.readline() or "{}")
+        if header.get("version") != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} cassette")
+        for line in file:
+            if line.strip():
+                yield Interaction.from_record(json.loads(line))
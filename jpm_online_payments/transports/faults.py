@@ -0,0 +1,329 @@
+import asyncio
+import collections
+import json
+import random
+import re
+import threading
+import time
+from typing import (
+    AsyncIterator,
+    Counter,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import httpx
+
+from jpm_online_payments.simulation import TOKEN_PATH, LatencyDistribution
+
+"""
+Transport injecting gateway faults into a client's traffic.
+
+`FaultInjectionTransport` wraps the transport of an `httpx.Client` or
+`httpx.AsyncClient`, and `token_transport` of the client for the token endpoint,
+and applies the first `FaultRule` matching each request's endpoint template:
+
+* `latency` delays the request by a sample of a `LatencyDistribution`
+* `connect_error_rate` fails it with `httpx.ConnectError` before it is sent
+* `throttle_rate` and `unavailable_rate` answer it with a 429 or 503 error,
+  without forwarding it
+* `reset_rate` forwards it, then fails with `httpx.ReadError` as if the
+  connection was reset before the response arrived
+* `partial_read_rate` forwards it and cuts the response body short with
+  `httpx.RemoteProtocolError`
+
+All random draws come from one RNG seeded with `seed`, and each request draws the
+same number of values, so a sequential run is reproducible. With concurrent
+requests, which request receives which draw follows the order they arrive in.
+"""
+
+TOKEN_ENDPOINT = "token"
+
+FAULTS = ("connect_error", "throttle", "unavailable", "reset", "partial_read")
+
+
+class FaultRule:
+    """
+    Faults injected into requests to one endpoint, or to all.
+
+    Attributes:
+        endpoint: Path template below the base path, e.g. `/payments/{id}`,
+            `token` for the token endpoint, or None for every API endpoint
+        method: HTTP method, or None for any
+        latency: Distribution of the delay added to each request
+        connect_error_rate: Fraction of requests failing to connect
+        throttle_rate: Fraction of requests answered with a 429
+        unavailable_rate: Fraction of requests answered with a 503
+        reset_rate: Fraction of requests whose connection is reset after sending
+        partial_read_rate: Fraction of responses whose body is cut short
+        retry_after: Retry-After header of injected 429 and 503 responses, in
+            seconds
+    """
+
+    __slots__ = (
+        "endpoint",
+        "method",
+        "latency",
+        "connect_error_rate",
+        "throttle_rate",
+        "unavailable_rate",
+        "reset_rate",
+        "partial_read_rate",
+        "retry_after",
+        "_pattern",
+        "_thresholds",
+    )
+
+    def __init__(
+        self,
+        *,
+        endpoint: Optional[str] = None,
+        method: Optional[str] = None,
+        latency: Union[LatencyDistribution, str, None] = None,
+        connect_error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        unavailable_rate: float = 0.0,
+        reset_rate: float = 0.0,
+        partial_read_rate: float = 0.0,
+        retry_after: int = 1,
+    ) -> None:
+        """
+        Raises:
+            ValueError: If a rate is negative or the rates add up to more than 1
+        """
+        rates = (
+            connect_error_rate,
+            throttle_rate,
+            unavailable_rate,
+            reset_rate,
+            partial_read_rate,
+        )
+        if min(rates) < 0 or sum(rates) > 1:
+            raise ValueError("fault rates must be non-negative and add up to at most 1")
+        if isinstance(latency, str):
+            latency = LatencyDistribution.parse(latency)
+        self.endpoint = endpoint
+        self.method = method.upper() if method else None
+        self.latency = latency
+        self.connect_error_rate = connect_error_rate
+        self.throttle_rate = throttle_rate
+        self.unavailable_rate = unavailable_rate
+        self.reset_rate = reset_rate
+        self.partial_read_rate = partial_read_rate
+        self.retry_after = retry_after
+        self._pattern = None
+        if endpoint is not None and endpoint != TOKEN_ENDPOINT:
+            self._pattern = re.compile(
+                "^" + re.sub(r"\\\{\w+\\\}", "[^/]+", re.escape(endpoint)) + "$"
+            )
+        thresholds: List[Tuple[float, str]] = []
+        total = 0.0
+        for fault, rate in zip(FAULTS, rates):
+            if rate:
+                total += rate
+                thresholds.append((total, fault))
+        self._thresholds = thresholds
+
+    def matches(self, method: str, path: Optional[str]) -> bool:
+        """
+        Whether the rule applies to a request.
+
+        Args:
+            method: HTTP method
+            path: Path below the base path, or None for the token endpoint
+        """
+        if self.method is not None and self.method != method:
+            return False
+        if path is None:
+            return self.endpoint == TOKEN_ENDPOINT
+        if self.endpoint is None:
+            return True
+        return self._pattern is not None and self._pattern.match(path) is not None
+
+    def _draw(self, rng: random.Random) -> Tuple[float, Optional[str], float]:
+        delay = self.latency.sample(rng) if self.latency is not None else 0.0
+        roll = rng.random()
+        cut = rng.random()
+        for threshold, fault in self._thresholds:
+            if roll < threshold:
+                return delay, fault, cut
+        return delay, None, cut
+
+    def __repr__(self) -> str:
+        return f"FaultRule({self.method or '*'} {self.endpoint or '*'})"
+
+
+class _TruncatedStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    def __init__(self, content: bytes) -> None:
+        self._content = content
+
+    def _error(self) -> httpx.RemoteProtocolError:
+        return httpx.RemoteProtocolError(
+            "peer closed connection without sending complete message body"
+        )
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self._content:
+            yield self._content
+        raise self._error()
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        if self._content:
+            yield self._content
+        raise self._error()
+
+
+class FaultInjectionTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Wraps a transport and injects faults according to a list of rules.
+
+    ```py
+    faults = FaultInjectionTransport(
+        [
+            FaultRule(endpoint="/payments", method="POST", latency="lognormal:80,0.6",
+                      reset_rate=0.01, throttle_rate=0.02),
+            FaultRule(endpoint="token", unavailable_rate=0.2),
+        ],
+        seed=7,
+    )
+    client = Client(
+        auth={...}, httpx_client=httpx.Client(transport=faults), token_transport=faults
+    )
+    ```
+
+    Attributes:
+        injected: Number of injected faults per endpoint template and fault
+    """
+
+    def __init__(
+        self,
+        rules: Sequence[FaultRule],
+        *,
+        transport: Optional[httpx.BaseTransport] = None,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+        seed: Optional[int] = None,
+        base_path: str = "/api/v2",
+        token_path: str = TOKEN_PATH,
+    ) -> None:
+        """
+        Args:
+            rules: Fault rules; the first rule matching a request applies
+            transport: Transport forwarding synchronous requests
+            async_transport: Transport forwarding asynchronous requests
+            seed: Seed of the random number generator
+            base_path: Path prefix of the API routes, removed before matching
+                endpoint templates
+            token_path: Path of the OAuth2 token endpoint
+        """
+        self.rules = list(rules)
+        self._transport = transport
+        self._async_transport = async_transport
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.base_path = base_path.rstrip("/")
+        self.token_path = token_path
+        self.injected: Counter[Tuple[str, str]] = collections.Counter()
+
+    def _plan(
+        self, request: httpx.Request
+    ) -> Tuple[Optional[FaultRule], float, Optional[str], float]:
+        url_path = request.url.path
+        path: Optional[str] = None
+        if url_path != self.token_path:
+            path = url_path
+            if self.base_path and url_path.startswith(self.base_path):
+                path = url_path[len(self.base_path) :] or "/"
+        for rule in self.rules:
+            if rule.matches(request.method, path):
+                with self._lock:
+                    delay, fault, cut = rule._draw(self._rng)
+                    if fault is not None:
+                        self.injected[(rule.endpoint or "*", fault)] += 1
+                return rule, delay, fault, cut
+        return None, 0.0, None, 0.0
+
+    def _error_response(self, rule: FaultRule, fault: str) -> httpx.Response:
+        status, code, message = (
+            (429, "TOO_MANY_REQUESTS", "Rate limit exceeded")
+            if fault == "throttle"
+            else (503, "SERVICE_UNAVAILABLE", "Injected gateway unavailability")
+        )
+        body = {
+            "responseStatus": "ERROR",
+            "responseCode": code,
+            "responseMessage": message,
+        }
+        return httpx.Response(
+            status,
+            headers={"retry-after": str(rule.retry_after)},
+            content=json.dumps(body).encode("utf-8"),
+        )
+
+    def _truncate(self, response: httpx.Response, cut: float) -> httpx.Response:
+        content = response.content
+        return httpx.Response(
+            response.status_code,
+            headers=[
+                (name, value)
+                for name, value in response.headers.items()
+                if name.lower() != "content-encoding"
+            ],
+            stream=_TruncatedStream(content[: int(len(content) * cut)]),
+            extensions=response.extensions,
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        rule, delay, fault, cut = self._plan(request)
+        if delay:
+            time.sleep(delay)
+        if rule is not None and fault in ("throttle", "unavailable"):
+            return self._error_response(rule, fault)  # type: ignore[arg-type]
+        if fault == "connect_error":
+            raise httpx.ConnectError("injected connection failure", request=request)
+        if self._transport is None:
+            self._transport = httpx.HTTPTransport()
+        response = self._transport.handle_request(request)
+        if fault == "reset":
+            response.close()
+            raise httpx.ReadError("injected connection reset", request=request)
+        if fault == "partial_read":
+            try:
+                response.read()
+            finally:
+                response.close()
+            return self._truncate(response, cut)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        rule, delay, fault, cut = self._plan(request)
+        if delay:
+            await asyncio.sleep(delay)
+        if rule is not None and fault in ("throttle", "unavailable"):
+            return self._error_response(rule, fault)  # type: ignore[arg-type]
+        if fault == "connect_error":
+            raise httpx.ConnectError("injected connection failure", request=request)
+        if self._async_transport is None:
+            self._async_transport = httpx.AsyncHTTPTransport()
+        response = await self._async_transport.handle_async_request(request)
+        if fault == "reset":
+            await response.aclose()
+            raise httpx.ReadError("injected connection reset", request=request)
+        if fault == "partial_read":
+            try:
+                await response.aread()
+            finally:
+                await response.aclose()
+            return self._truncate(response, cut)
+        return response
+
+    def close(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
+
+    async def aclose(self) -> None:
+        if self._async_transport is not None:
+            await self._async_transport.aclose()
@@ -0,0 +1,118 @@
+import time
+from typing import FrozenSet, Optional
+
+import httpx
+
+from .cassette import REDACTED_FIELDS, CassetteWriter, Interaction
+
+"""
+Transport recording the traffic of a client into a cassette.
+"""
+
+
+class RecordingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Forwards requests to a real transport and records each exchange, redacted, to
+    a cassette file.
+
+    Works with both `httpx.Client` and `httpx.AsyncClient`; the wrapped transport
+    defaults to the matching httpx transport. Responses are read fully before they
+    are returned. The cassette is complete once the client, or the transport, is
+    closed.
+
+    ```py
+    transport = RecordingTransport("checkout.cassette.gz")
+    client = Client(auth={...}, httpx_client=httpx.Client(transport=transport))
+    ...
+    client._base_client.httpx_client.close()
+    ```
+
+    Attributes:
+        path: Cassette file being written
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        transport: Optional[httpx.BaseTransport] = None,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+        redacted_fields: FrozenSet[str] = REDACTED_FIELDS,
+    ) -> None:
+        """
+        Args:
+            path: Cassette file to create, overwriting an existing file
+            transport: Transport sending synchronous requests
+            async_transport: Transport sending asynchronous requests
+            redacted_fields: JSON keys whose values are redacted from bodies
+        """
+        self.path = path
+        self._transport = transport
+        self._async_transport = async_transport
+        self._redacted_fields = redacted_fields
+        self._writer = CassetteWriter(path)
+
+    @property
+    def count(self) -> int:
+        """Number of interactions recorded so far."""
+        return self._writer.count
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self._transport is None:
+            self._transport = httpx.HTTPTransport()
+        request.read()
+        started = time.perf_counter()
+        response = self._transport.handle_request(request)
+        try:
+            content = response.read()
+        finally:
+            response.close()
+        return self._record(request, response, content, started)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self._async_transport is None:
+            self._async_transport = httpx.AsyncHTTPTransport()
+        await request.aread()
+        started = time.perf_counter()
+        response = await self._async_transport.handle_async_request(request)
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        return self._record(request, response, content, started)
+
+    def _record(
+        self,
+        request: httpx.Request,
+        response: httpx.Response,
+        content: bytes,
+        started: float,
+    ) -> httpx.Response:
+        elapsed = time.perf_counter() - started
+        self._writer.write(
+            Interaction.from_exchange(
+                request, response, elapsed=elapsed, fields=self._redacted_fields
+            )
+        )
+        # the read content is decoded, so it is returned without its encoding
+        headers = [
+            (name, value)
+            for name, value in response.headers.items()
+            if name.lower() not in ("content-encoding", "content-length")
+        ]
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=content,
+            extensions=response.extensions,
+        )
+
+    def close(self) -> None:
+        self._writer.close()
+        if self._transport is not None:
+            self._transport.close()
+
+    async def aclose(self) -> None:
+        self._writer.close()
+        if self._async_transport is not None:
+            await self._async_transport.aclose()
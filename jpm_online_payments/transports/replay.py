@@ -0,0 +1,107 @@
+import asyncio
+import itertools
+import time
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Tuple, Union
+
+import httpx
+
+from .cassette import (
+    REDACTED_FIELDS,
+    Interaction,
+    InteractionKey,
+    interaction_key,
+    read_cassette,
+)
+
+"""
+Transport answering requests from a cassette instead of the network.
+"""
+
+
+class UnrecordedRequestError(httpx.TransportError):
+    """Raised when a cassette holds no response for a request."""
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Serves recorded responses for `httpx.Client` and `httpx.AsyncClient`.
+
+    Interactions are indexed by method, path and redacted body hash when the
+    cassette is loaded, so a lookup costs one hash of the request body and one
+    dictionary access. Requests with the same key are answered with their recorded
+    responses in order, starting over once all were served, so a short recording
+    can drive a long benchmark. With `match_body=False`, the body is ignored and
+    requests are matched by method and path only.
+
+    Each response is delayed by its recorded latency multiplied by
+    `latency_scale`; `0` answers immediately.
+
+    Attributes:
+        interactions: Number of interactions loaded
+        served: Number of requests answered
+    """
+
+    def __init__(
+        self,
+        cassette: Union[str, Iterable[Interaction]],
+        *,
+        latency_scale: float = 1.0,
+        match_body: bool = True,
+        redacted_fields: FrozenSet[str] = REDACTED_FIELDS,
+    ) -> None:
+        """
+        Args:
+            cassette: Cassette file, or interactions to serve
+            latency_scale: Factor applied to recorded latencies
+            match_body: Match requests by body hash in addition to method and path
+            redacted_fields: JSON keys redacted when the cassette was recorded
+
+        Raises:
+            ValueError: If `latency_scale` is negative
+        """
+        if latency_scale < 0:
+            raise ValueError("latency_scale must not be negative")
+        self.latency_scale = latency_scale
+        self.match_body = match_body
+        self._redacted_fields = redacted_fields
+        if isinstance(cassette, str):
+            cassette = read_cassette(cassette)
+        grouped: Dict[InteractionKey, List[Interaction]] = {}
+        for interaction in cassette:
+            key = interaction.key
+            if not match_body:
+                key = (key[0], key[1], "")
+            grouped.setdefault(key, []).append(interaction)
+        self.interactions = sum(len(group) for group in grouped.values())
+        self._index: Dict[InteractionKey, Iterator[Interaction]] = {
+            key: itertools.cycle(group) for key, group in grouped.items()
+        }
+        self.served = 0
+
+    def _lookup(self, request: httpx.Request) -> Tuple[httpx.Response, float]:
+        if self.match_body:
+            key = interaction_key(request, self._redacted_fields)
+        else:
+            key = (request.method, request.url.raw_path.decode("ascii"), "")
+        responses = self._index.get(key)
+        if responses is None:
+            raise UnrecordedRequestError(
+                f"no recorded response for {request.method} {key[1]}", request=request
+            )
+        interaction = next(responses)
+        self.served += 1
+        return interaction.to_response(), interaction.elapsed * self.latency_scale
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        response, delay = self._lookup(request)
+        if delay:
+            time.sleep(delay)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        response, delay = self._lookup(request)
+        if delay:
+            await asyncio.sleep(delay)
+        return response
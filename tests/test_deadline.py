@@ -0,0 +1,259 @@
+import asyncio
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
+
+import httpx
+import pytest
+
+from jpm_online_payments.core import (
+    AsyncBaseClient,
+    AuthBearer,
+    DeadlineExceeded,
+    OAuth2,
+    RequestDeduplicator,
+    SyncBaseClient,
+)
+
+"""
+Calls fail with `DeadlineExceeded` naming the phase their budget ran out in.
+
+The gateway and the token endpoint are `httpx.MockTransport`s, which ignore httpx
+timeouts; they sleep past the deadline instead, before raising the timeout httpx
+would have raised or answering late.
+"""
+
+BUDGET = 0.2
+
+HEADERS = {"merchant-id": "991234567890", "request-id": "r-1"}
+
+Client = Union[SyncBaseClient, AsyncBaseClient]
+
+
+def _token_endpoint(*, times_out: bool) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(BUDGET + 0.05)
+        if times_out:
+            raise httpx.ReadTimeout("token request timed out", request=request)
+        return httpx.Response(200, json={"access_token": "token", "expires_in": 600})
+
+    return httpx.MockTransport(handler)
+
+
+def _register_oauth(client: Client, token_transport: httpx.MockTransport) -> None:
+    client.register_auth(
+        "auth",
+        OAuth2(
+            token_url="https://gateway.test/token",
+            access_token_pointer="/access_token",
+            expires_in_pointer="/expires_in",
+            credentials_location="basic_authorization_header",
+            body_content="form",
+            grant_type="client_credentials",
+            client_id="id",
+            client_secret="secret",
+            request_mutator=AuthBearer(val=None),
+            token_transport=token_transport,
+        ),
+    )
+
+
+class _SlowBody(httpx.SyncByteStream):
+    def __iter__(self) -> Iterator[bytes]:
+        yield b'{"chunks": ['
+        for _ in range(20):
+            time.sleep(BUDGET / 10)
+            yield b"0,"
+        yield b"0]}"
+
+
+class _AsyncSlowBody(httpx.AsyncByteStream):
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield b'{"chunks": ['
+        for _ in range(20):
+            await asyncio.sleep(BUDGET / 10)
+            yield b"0,"
+        yield b"0]}"
+
+
+def _gateway(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/slow":
+        return httpx.Response(200, stream=_SlowBody())
+    return httpx.Response(201, json={"ok": True})
+
+
+async def _async_gateway(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/slow":
+        return httpx.Response(200, stream=_AsyncSlowBody())
+    return httpx.Response(201, json={"ok": True})
+
+
+def _client(**kwargs: Any) -> SyncBaseClient:
+    return SyncBaseClient(
+        base_url="https://gateway.test",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_gateway)),
+        **kwargs,
+    )
+
+
+def _async_client(**kwargs: Any) -> AsyncBaseClient:
+    return AsyncBaseClient(
+        base_url="https://gateway.test",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(_async_gateway)),
+        **kwargs,
+    )
+
+
+def _call(
+    client: SyncBaseClient,
+    path: str = "/payments",
+    auth_names: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    return client.request(
+        method="POST",
+        path=path,
+        cast_to=Dict[str, Any],
+        auth_names=auth_names,
+        headers=HEADERS,
+        request_options={"deadline": BUDGET},
+    )
+
+
+async def _acall(
+    client: AsyncBaseClient,
+    path: str = "/payments",
+    auth_names: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    return await client.request(
+        method="POST",
+        path=path,
+        cast_to=Dict[str, Any],
+        auth_names=auth_names,
+        headers=HEADERS,
+        request_options={"deadline": BUDGET},
+    )
+
+
+def _assert_exceeded(error: DeadlineExceeded, phase: str, started: float) -> None:
+    assert error.phase == phase
+    assert error.budget == BUDGET
+    assert time.perf_counter() - started < BUDGET + 0.5
+
+
+def test_deadline_is_not_exceeded_in_time() -> None:
+    assert _call(_client()) == {"ok": True}
+
+
+@pytest.mark.parametrize(
+    "times_out, phase", [(True, "authentication"), (False, "dispatch")]
+)
+def test_token_request_spends_the_deadline(times_out: bool, phase: str) -> None:
+    client = _client()
+    _register_oauth(client, _token_endpoint(times_out=times_out))
+    started = time.perf_counter()
+    with pytest.raises(DeadlineExceeded) as error:
+        _call(client, auth_names=["auth"])
+    _assert_exceeded(error.value, phase, started)
+
+
+def test_body_read_past_the_deadline() -> None:
+    started = time.perf_counter()
+    with pytest.raises(DeadlineExceeded) as error:
+        _call(_client(), "/slow")
+    _assert_exceeded(error.value, "read", started)
+
+
+def test_duplicate_waits_until_the_deadline() -> None:
+    release = threading.Event()
+
+    def gateway(request: httpx.Request) -> httpx.Response:
+        release.wait(5.0)
+        return httpx.Response(201, json={"ok": True})
+
+    deduplicator = RequestDeduplicator()
+    client = SyncBaseClient(
+        base_url="https://gateway.test",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(gateway)),
+        deduplicator=deduplicator,
+    )
+    sender = threading.Thread(
+        target=client.request,
+        kwargs={
+            "method": "POST",
+            "path": "/payments",
+            "cast_to": Dict[str, Any],
+            "headers": HEADERS,
+        },
+    )
+    sender.start()
+    while not deduplicator._in_flight:
+        time.sleep(0.01)
+    started = time.perf_counter()
+    try:
+        with pytest.raises(DeadlineExceeded) as error:
+            _call(client)
+    finally:
+        release.set()
+        sender.join()
+    _assert_exceeded(error.value, "read", started)
+    assert deduplicator.suppressed == 1
+
+
+@pytest.mark.asyncio
+async def test_async_deadline_is_not_exceeded_in_time() -> None:
+    assert await _acall(_async_client()) == {"ok": True}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "times_out, phase", [(True, "authentication"), (False, "dispatch")]
+)
+async def test_async_token_request_spends_the_deadline(
+    times_out: bool, phase: str
+) -> None:
+    client = _async_client()
+    _register_oauth(client, _token_endpoint(times_out=times_out))
+    started = time.perf_counter()
+    with pytest.raises(DeadlineExceeded) as error:
+        await _acall(client, auth_names=["auth"])
+    _assert_exceeded(error.value, phase, started)
+
+
+@pytest.mark.asyncio
+async def test_async_body_read_past_the_deadline() -> None:
+    started = time.perf_counter()
+    with pytest.raises(DeadlineExceeded) as error:
+        await _acall(_async_client(), "/slow")
+    _assert_exceeded(error.value, "read", started)
+
+
+@pytest.mark.asyncio
+async def test_async_duplicate_waits_until_the_deadline() -> None:
+    release = asyncio.Event()
+
+    async def gateway(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return httpx.Response(201, json={"ok": True})
+
+    deduplicator = RequestDeduplicator()
+    client = AsyncBaseClient(
+        base_url="https://gateway.test",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(gateway)),
+        deduplicator=deduplicator,
+    )
+    sender: "asyncio.Future[Dict[str, Any]]" = asyncio.ensure_future(
+        client.request(
+            method="POST", path="/payments", cast_to=Dict[str, Any], headers=HEADERS
+        )
+    )
+    while not deduplicator._in_flight:
+        await asyncio.sleep(0)
+    started = time.perf_counter()
+    try:
+        with pytest.raises(DeadlineExceeded) as error:
+            await _acall(client)
+    finally:
+        release.set()
+        await sender
+    _assert_exceeded(error.value, "read", started)
+    assert deduplicator.suppressed == 1
@@ -0,0 +1,187 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import httpx
+import pytest
+
+from jpm_online_payments.core import (
+    ApiError,
+    AsyncBaseClient,
+    RequestDeduplicator,
+    SyncBaseClient,
+)
+
+"""
+Duplicates of a request sharing its `request-id` reach the gateway only once.
+
+The gateway is an `httpx.MockTransport` counting the requests it receives; while
+`hold` is set, it answers only once the event is set.
+"""
+
+
+class Gateway:
+    def __init__(self) -> None:
+        self.requests: List[httpx.Request] = []
+        self.status_codes: List[int] = []
+        self.hold: Optional[threading.Event] = None
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.hold is not None:
+            self.hold.wait(5.0)
+        status_code = self.status_codes.pop(0) if self.status_codes else 201
+        return httpx.Response(
+            status_code, json={"request": len(self.requests), "status": status_code}
+        )
+
+
+@pytest.fixture
+def gateway() -> Gateway:
+    return Gateway()
+
+
+def _client(
+    gateway: Gateway, deduplicator: RequestDeduplicator, timeout: float = 5.0
+) -> SyncBaseClient:
+    return SyncBaseClient(
+        base_url="https://gateway.test",
+        httpx_client=httpx.Client(
+            transport=httpx.MockTransport(gateway), timeout=timeout
+        ),
+        deduplicator=deduplicator,
+    )
+
+
+def _capture(
+    client: SyncBaseClient,
+    request_id: str = "r-1",
+    *,
+    method: str = "POST",
+) -> Dict[str, Any]:
+    return client.request(
+        method=method,
+        path="/payments/t-1/captures",
+        cast_to=Dict[str, Any],
+        headers={"merchant-id": "991234567890", "request-id": request_id},
+    )
+
+
+def _wait_until(condition: Any) -> None:
+    for _ in range(500):
+        if condition():
+            return
+        time.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+def test_duplicate_waits_for_the_request_in_flight(gateway: Gateway) -> None:
+    deduplicator = RequestDeduplicator()
+    client = _client(gateway, deduplicator)
+    gateway.hold = threading.Event()
+    with ThreadPoolExecutor(2) as pool:
+        sent = pool.submit(_capture, client)
+        _wait_until(lambda: gateway.requests)
+        duplicate = pool.submit(_capture, client)
+        _wait_until(lambda: deduplicator.suppressed)
+        assert not duplicate.done()
+        gateway.hold.set()
+
+        assert sent.result() == duplicate.result() == {"request": 1, "status": 201}
+    assert len(gateway.requests) == 1
+
+
+def test_duplicate_stops_waiting_after_the_senders_timeouts(gateway: Gateway) -> None:
+    # connect, write, read and pool timeouts of 0.1s each
+    client = _client(gateway, RequestDeduplicator(), timeout=0.1)
+    gateway.hold = threading.Event()
+    with ThreadPoolExecutor(1) as pool:
+        sent = pool.submit(_capture, client)
+        _wait_until(lambda: gateway.requests)
+        started = time.perf_counter()
+        with pytest.raises(httpx.ReadTimeout):
+            _capture(client)
+        waited = time.perf_counter() - started
+        gateway.hold.set()
+        sent.result()
+
+    assert 0.4 <= waited < 2.0
+    assert len(gateway.requests) == 1
+
+
+def test_only_successful_responses_are_cached(gateway: Gateway) -> None:
+    client = _client(gateway, RequestDeduplicator())
+    gateway.status_codes = [500]
+    with pytest.raises(ApiError):
+        _capture(client)
+
+    assert _capture(client) == {"request": 2, "status": 201}
+    assert _capture(client) == {"request": 2, "status": 201}
+    assert len(gateway.requests) == 2
+
+
+def test_get_requests_are_not_deduplicated(gateway: Gateway) -> None:
+    deduplicator = RequestDeduplicator()
+    client = _client(gateway, deduplicator)
+    _capture(client, method="GET")
+    _capture(client, method="GET")
+
+    assert len(gateway.requests) == 2
+    assert deduplicator.suppressed == 0
+
+
+def test_cached_responses_expire_after_ttl(gateway: Gateway) -> None:
+    client = _client(gateway, RequestDeduplicator(ttl=0.1))
+    _capture(client)
+    _capture(client)
+    assert len(gateway.requests) == 1
+    time.sleep(0.15)
+
+    assert _capture(client) == {"request": 2, "status": 201}
+
+
+def test_oldest_responses_are_evicted_beyond_max_size(gateway: Gateway) -> None:
+    deduplicator = RequestDeduplicator(max_size=2)
+    client = _client(gateway, deduplicator)
+    for request_id in ("r-1", "r-2", "r-3"):
+        _capture(client, request_id)
+    assert len(deduplicator) == 2
+
+    assert _capture(client, "r-3") == {"request": 3, "status": 201}
+    assert _capture(client, "r-1") == {"request": 4, "status": 201}
+
+
+@pytest.mark.asyncio
+async def test_async_duplicate_waits_for_the_request_in_flight() -> None:
+    requests: List[httpx.Request] = []
+    release = asyncio.Event()
+
+    async def gateway(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await release.wait()
+        return httpx.Response(201, json={"request": len(requests)})
+
+    deduplicator = RequestDeduplicator()
+    client = AsyncBaseClient(
+        base_url="https://gateway.test",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(gateway)),
+        deduplicator=deduplicator,
+    )
+
+    async def capture() -> Dict[str, Any]:
+        return await client.request(
+            method="POST",
+            path="/payments/t-1/captures",
+            cast_to=Dict[str, Any],
+            headers={"merchant-id": "991234567890", "request-id": "r-1"},
+        )
+
+    captures = [asyncio.ensure_future(capture()) for _ in range(3)]
+    while deduplicator.suppressed < 2:
+        await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*captures) == [{"request": 1}] * 3
+    assert len(requests) == 1
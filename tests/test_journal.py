@@ -0,0 +1,198 @@
+import json
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from jpm_online_payments.core import (
+    REDACTED_FIELDS,
+    Journal,
+    RedactedEntryError,
+    SyncBaseClient,
+)
+
+"""
+Requests journaled before a failed send are recovered by the next run.
+
+The gateway is an `httpx.MockTransport`; a request whose transport raises is left
+unfinished in the journal, as if the process had died while it was in flight.
+"""
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAYMENT = {
+    "amount": 1234,
+    "currency": "USD",
+    "paymentMethodType": {
+        "card": {
+            "accountNumber": "4012000033330026",
+            "cvv": "123",
+            "expiry": {"month": 5, "year": 2030},
+        }
+    },
+}
+
+
+class Gateway:
+    """Records the requests it receives, failing them while `down`."""
+
+    def __init__(self) -> None:
+        self.down = False
+        self.requests: List[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.down:
+            raise httpx.ConnectError("gateway unreachable", request=request)
+        return httpx.Response(201, json={"transactionId": "t-1"})
+
+
+@pytest.fixture
+def journal_path(tmp_path: Any) -> str:
+    return str(tmp_path / "payments.journal")
+
+
+@pytest.fixture
+def gateway() -> Gateway:
+    return Gateway()
+
+
+def _client(gateway: Gateway, journal: Journal) -> SyncBaseClient:
+    return SyncBaseClient(
+        base_url="https://gateway.test",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(gateway)),
+        journal=journal,
+    )
+
+
+def _pay(client: SyncBaseClient, request_id: str) -> Dict[str, Any]:
+    return client.request(
+        method="POST",
+        path="/payments",
+        cast_to=Dict[str, Any],
+        headers={"merchant-id": "991234567890", "request-id": request_id},
+        json=PAYMENT,
+    )
+
+
+def _fail_payment(gateway: Gateway, journal: Journal, request_id: str) -> None:
+    gateway.down = True
+    with pytest.raises(httpx.ConnectError):
+        _pay(_client(gateway, journal), request_id)
+    gateway.down = False
+
+
+def _records(path: str) -> List[Dict[str, Any]]:
+    with open(path, "rb") as file:
+        return [json.loads(line) for line in file]
+
+
+@pytest.fixture
+def unfinished(journal_path: str, gateway: Gateway) -> None:
+    with Journal(journal_path) as journal:
+        _pay(_client(gateway, journal), "r-1")
+        _fail_payment(gateway, journal, "r-2")
+    gateway.requests.clear()
+
+
+def test_unfinished_request_is_sent_again(
+    unfinished: None, journal_path: str, gateway: Gateway
+) -> None:
+    with Journal(journal_path) as journal:
+        [entry] = journal.recovered()
+        assert entry.request_id == "r-2"
+        [(recovered, outcome)] = _client(gateway, journal).recover_journal()
+
+    assert recovered is entry
+    assert isinstance(outcome, httpx.Response) and outcome.status_code == 201
+    [request] = gateway.requests
+    assert request.method == "POST"
+    assert request.url == "https://gateway.test/payments"
+    assert request.headers["request-id"] == "r-2"
+    assert json.loads(request.content) == PAYMENT
+    with Journal(journal_path) as journal:
+        assert journal.recovered() == []
+
+
+def test_failed_recovery_keeps_the_entry_open(
+    unfinished: None, journal_path: str, gateway: Gateway
+) -> None:
+    gateway.down = True
+    with Journal(journal_path) as journal:
+        [(_, outcome)] = _client(gateway, journal).recover_journal()
+    assert isinstance(outcome, httpx.ConnectError)
+    with Journal(journal_path) as journal:
+        assert [entry.request_id for entry in journal.recovered()] == ["r-2"]
+
+
+def test_opening_compacts_the_journal_to_unfinished_entries(
+    unfinished: None, journal_path: str
+) -> None:
+    assert [record["op"] for record in _records(journal_path)] == [
+        "begin",
+        "end",
+        "begin",
+    ]
+    # a record torn by a crash while it was written
+    with open(journal_path, "ab") as file:
+        file.write(b'{"op":"begin","id":3,"met')
+
+    with Journal(journal_path) as journal:
+        assert [entry.request_id for entry in journal.recovered()] == ["r-2"]
+    [record] = _records(journal_path)
+    assert record["op"] == "begin" and record["headers"]["request-id"] == "r-2"
+
+
+def test_journal_is_private_to_its_owner(unfinished: None, journal_path: str) -> None:
+    if sys.platform != "win32":
+        assert os.stat(journal_path).st_mode & 0o777 == 0o600
+
+
+def test_second_process_cannot_open_the_journal(journal_path: str) -> None:
+    script = (
+        "import sys\n"
+        "from jpm_online_payments.core import Journal\n"
+        "try:\n"
+        "    Journal(sys.argv[1])\n"
+        "except RuntimeError as exc:\n"
+        "    sys.exit(str(exc))\n"
+    )
+    with Journal(journal_path):
+        held = subprocess.run(
+            [sys.executable, "-c", script, journal_path],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+        )
+    released = subprocess.run(
+        [sys.executable, "-c", script, journal_path], cwd=ROOT, capture_output=True
+    )
+
+    assert held.returncode == 1
+    assert "is in use by another process" in held.stderr
+    assert released.returncode == 0
+
+
+def test_redacted_entry_is_reported_and_not_sent(
+    journal_path: str, gateway: Gateway
+) -> None:
+    with Journal(journal_path, redact_fields=REDACTED_FIELDS) as journal:
+        _fail_payment(gateway, journal, "r-1")
+    gateway.requests.clear()
+    with open(journal_path, "rb") as file:
+        assert b"4012000033330026" not in file.read()
+
+    with Journal(journal_path, redact_fields=REDACTED_FIELDS) as journal:
+        [(entry, outcome)] = _client(gateway, journal).recover_journal()
+        assert entry.redacted
+        assert isinstance(outcome, RedactedEntryError) and outcome.entry is entry
+        assert gateway.requests == []
+    with Journal(journal_path) as journal:
+        [entry] = journal.recovered()
+        # closed by hand, e.g. after looking the payment up by its request-id
+        journal.end(entry.id, status=None, error="looked up by request-id")
+    with Journal(journal_path) as journal:
+        assert journal.recovered() == []
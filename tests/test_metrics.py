@@ -0,0 +1,33 @@
+import threading
+
+from jpm_online_payments.core.metrics import Counter, Histogram
+
+"""
+Shards of exited threads are folded into the retired shard without losing counts.
+"""
+
+
+def _record(counter: Counter, histogram: Histogram) -> None:
+    for _ in range(10):
+        counter.inc(("x",))
+        histogram.observe(("x",), 1.5)
+
+
+def test_exited_threads_are_folded_into_the_retired_shard() -> None:
+    counter = Counter(name="c", documentation="c", label_names=["label"])
+    histogram = Histogram(
+        name="h", documentation="h", label_names=["label"], buckets=[1.0, 2.0]
+    )
+    _record(counter, histogram)
+    for _ in range(50):
+        thread = threading.Thread(target=_record, args=(counter, histogram))
+        thread.start()
+        thread.join()
+
+    # the retired shard and the shard of this thread
+    assert len(counter._shards) == len(histogram._shards) == 2
+    assert counter.value(("x",)) == 510
+    assert histogram.count(("x",)) == 510
+    assert dict(
+        (name, value) for name, _, extra, value in histogram.samples() if not extra
+    ) == {"h_sum": 765.0, "h_count": 510}
@@ -0,0 +1,216 @@
+import asyncio
+import gc
+import threading
+import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, AsyncIterator, Dict, Iterator
+
+import httpx
+import pydantic
+import pytest
+import pytest_asyncio
+
+from jpm_online_payments.core import (
+    AsyncBaseClient,
+    AsyncStreamResponse,
+    StreamResponse,
+    SyncBaseClient,
+)
+
+"""
+Streams must return their connection to the pool however they are left.
+
+Every client has a single pooled connection and a short pool timeout, so a stream
+still holding the connection makes the next request fail with `httpx.PoolTimeout`.
+"""
+
+EVENTS = 200
+
+
+class Event(pydantic.BaseModel):
+    data: int
+
+
+class _SSEHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        events = [b"data: %d\n\n" % i for i in range(EVENTS)]
+        if self.path.endswith("/invalid"):
+            events.insert(1, b'data: "not a number"\n\n')
+        body = b"".join(events)
+        self.send_response(200)
+        self.send_header("content-type", "text/event-stream")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def base_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SSEHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def _limits() -> Dict[str, Any]:
+    return {
+        "limits": httpx.Limits(max_connections=1),
+        "timeout": httpx.Timeout(5.0, pool=0.5),
+    }
+
+
+@pytest.fixture
+def client(base_url: str) -> Iterator[SyncBaseClient]:
+    httpx_client = httpx.Client(**_limits())
+    yield SyncBaseClient(base_url=base_url, httpx_client=httpx_client)
+    httpx_client.close()
+
+
+@pytest_asyncio.fixture
+async def async_client(base_url: str) -> AsyncIterator[AsyncBaseClient]:
+    httpx_client = httpx.AsyncClient(**_limits())
+    yield AsyncBaseClient(base_url=base_url, httpx_client=httpx_client)
+    await httpx_client.aclose()
+
+
+def _stream(client: SyncBaseClient, path: str = "/events") -> StreamResponse[Event]:
+    return client.stream_request(method="GET", path=path, cast_to=Event)
+
+
+async def _astream(
+    client: AsyncBaseClient, path: str = "/events"
+) -> AsyncStreamResponse[Event]:
+    return await client.stream_request(method="GET", path=path, cast_to=Event)
+
+
+def _assert_pool_free(client: SyncBaseClient) -> None:
+    with _stream(client) as events:
+        assert next(events).data == 0
+
+
+async def _assert_async_pool_free(client: AsyncBaseClient) -> None:
+    async with await _astream(client) as events:
+        assert (await events.__anext__()).data == 0
+
+
+def test_open_stream_holds_the_connection(client: SyncBaseClient) -> None:
+    events = _stream(client)
+    next(events)
+    with pytest.raises(httpx.PoolTimeout):
+        _stream(client)
+    events.close()
+
+
+def test_exhausted_stream_releases_the_connection(client: SyncBaseClient) -> None:
+    assert [event.data for event in _stream(client)] == list(range(EVENTS))
+    _assert_pool_free(client)
+
+
+def test_with_exit_releases_the_connection(client: SyncBaseClient) -> None:
+    with _stream(client) as events:
+        next(events)
+    assert events.closed
+    _assert_pool_free(client)
+
+
+def test_close_releases_the_connection(client: SyncBaseClient) -> None:
+    events = _stream(client)
+    next(events)
+    events.close()
+    assert list(events) == []
+    _assert_pool_free(client)
+
+
+def test_iteration_error_releases_the_connection(client: SyncBaseClient) -> None:
+    events = _stream(client, "/invalid")
+    next(events)
+    with pytest.raises(pydantic.ValidationError):
+        next(events)
+    assert events.closed
+    _assert_pool_free(client)
+
+
+def test_abandoned_stream_is_closed_when_collected(client: SyncBaseClient) -> None:
+    events = _stream(client)
+    next(events)
+    with pytest.warns(ResourceWarning):
+        del events
+        gc.collect()
+    _assert_pool_free(client)
+
+
+@pytest.mark.asyncio
+async def test_async_open_stream_holds_the_connection(
+    async_client: AsyncBaseClient,
+) -> None:
+    events = await _astream(async_client)
+    await events.__anext__()
+    with pytest.raises(httpx.PoolTimeout):
+        await _astream(async_client)
+    await events.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_exhausted_stream_releases_the_connection(
+    async_client: AsyncBaseClient,
+) -> None:
+    events = await _astream(async_client)
+    assert [event.data async for event in events] == list(range(EVENTS))
+    await _assert_async_pool_free(async_client)
+
+
+@pytest.mark.asyncio
+async def test_async_with_exit_releases_the_connection(
+    async_client: AsyncBaseClient,
+) -> None:
+    async with await _astream(async_client) as events:
+        await events.__anext__()
+    assert events.closed
+    await _assert_async_pool_free(async_client)
+
+
+@pytest.mark.asyncio
+async def test_async_aclose_releases_the_connection(
+    async_client: AsyncBaseClient,
+) -> None:
+    events = await _astream(async_client)
+    await events.__anext__()
+    await events.aclose()
+    assert [event async for event in events] == []
+    await _assert_async_pool_free(async_client)
+
+
+@pytest.mark.asyncio
+async def test_async_iteration_error_releases_the_connection(
+    async_client: AsyncBaseClient,
+) -> None:
+    events = await _astream(async_client, "/invalid")
+    await events.__anext__()
+    with pytest.raises(pydantic.ValidationError):
+        await events.__anext__()
+    assert events.closed
+    await _assert_async_pool_free(async_client)
+
+
+@pytest.mark.asyncio
+async def test_async_abandoned_stream_is_closed_when_collected(
+    async_client: AsyncBaseClient,
+) -> None:
+    events = await _astream(async_client)
+    await events.__anext__()
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        del events
+        gc.collect()
+        # the close is scheduled on the event loop
+        for _ in range(10):
+            await asyncio.sleep(0)
+    assert [w.category for w in caught] == [ResourceWarning]
+    await _assert_async_pool_free(async_client)